@@ -28,6 +28,8 @@ def _args_action_build(args: argparse.Namespace) -> None:
             process_tokens=args.process_tokens,
             make_dist=args.make_dist,
             pre_install_pure_packages=args.process_pure,
+            build_wheelhouse=args.build_wheelhouse,
+            build_local_wheels=args.build_local_wheels,
         )
     )
     print("Processing...", end="", flush=True)
@@ -64,6 +66,22 @@ def _args_add_sub_build(parser: argparse.ArgumentParser) -> None:
         dest="process_pure",
         default=True,
     )
+    parser.add_argument(
+        "-w",
+        "--no-wheelhouse",
+        help="Do not collect requirement wheels into the wheelhouse",
+        action="store_false",
+        dest="build_wheelhouse",
+        default=True,
+    )
+    parser.add_argument(
+        "-l",
+        "--no-local-wheels",
+        help="Do not convert local source distributions into wheels",
+        action="store_false",
+        dest="build_local_wheels",
+        default=True,
+    )
     parser.add_argument(
         "-d", "--no-dist", help="Do not process dist", action="store_false", dest="make_dist", default=True
     )
@@ -21,12 +21,14 @@ class ConfigMeta(type):
 class BasicConfig(metaclass=ConfigMeta):
     def __init__(self, **kwargs) -> None:
         self._py_pkg_dir = str(kwargs["py_pkg_dir"])
+        self._extension_version = str(kwargs["extension_version"])
         self._lo_identifier = str(kwargs["lo_identifier"])
         self._lo_implementation_name = str(kwargs["lo_implementation_name"])
         self._zipped_preinstall_pure = bool(kwargs["zipped_preinstall_pure"])
         self._auto_install_in_site_packages = bool(kwargs["auto_install_in_site_packages"])
         self._install_wheel = bool(kwargs["install_wheel"])
         self._has_locals = bool(kwargs["has_locals"])
+        self._has_wheelhouse = bool(kwargs["has_wheelhouse"])
         self._window_timeout = int(kwargs["window_timeout"])
         self._dialog_desktop_owned = bool(kwargs["dialog_desktop_owned"])
         self._default_locale = cast(List[str], (kwargs["default_locale"]))
@@ -35,6 +37,11 @@ class BasicConfig(metaclass=ConfigMeta):
         self._isolate_windows = set(kwargs["isolate_windows"])
         self._sym_link_cpython = bool(kwargs["sym_link_cpython"])
         self._uninstall_on_update = bool(kwargs["uninstall_on_update"])
+        self._download_retries = int(kwargs["download_retries"])
+        self._download_backoff = float(kwargs["download_backoff"])
+        self._log_json_file = str(kwargs["log_json_file"])
+        self._log_ring_buffer_size = int(kwargs["log_ring_buffer_size"])
+        self._mirrors = cast(Dict[str, List[str]], dict(kwargs["mirrors"]))
 
         if "requirements" not in kwargs:
             kwargs["requirements"] = {}
@@ -79,6 +86,33 @@ class BasicConfig(metaclass=ConfigMeta):
         """
         return self._dialog_desktop_owned
 
+    @property
+    def download_backoff(self) -> float:
+        """
+        Gets the delay in seconds before the first download retry. The delay is doubled for each following retry.
+
+        The value for this property can be set in pyproject.toml (tool.oxt.config.download_backoff)
+        """
+        return self._download_backoff
+
+    @property
+    def download_retries(self) -> int:
+        """
+        Gets the number of times a failed download is retried.
+
+        The value for this property can be set in pyproject.toml (tool.oxt.config.download_retries)
+        """
+        return self._download_retries
+
+    @property
+    def extension_version(self) -> str:
+        """
+        Gets the extension version such as ``1.2.0``.
+
+        The value for this property is set in pyproject.toml (tool.poetry.version)
+        """
+        return self._extension_version
+
     @property
     def has_locals(self) -> bool:
         """
@@ -86,6 +120,13 @@ class BasicConfig(metaclass=ConfigMeta):
         """
         return self._has_locals
 
+    @property
+    def has_wheelhouse(self) -> bool:
+        """
+        Gets the flag indicating if the extension has a wheelhouse of requirement wheels to install from.
+        """
+        return self._has_wheelhouse
+
     @property
     def install_wheel(self) -> bool:
         """
@@ -120,6 +161,34 @@ class BasicConfig(metaclass=ConfigMeta):
         """
         return self._lo_implementation_name
 
+    @property
+    def log_json_file(self) -> str:
+        """
+        Gets the name of the json lines file that timing records are written to. Empty string if not set.
+
+        The value for this property can be set in pyproject.toml (tool.oxt.config.log_json_file)
+        """
+        return self._log_json_file
+
+    @property
+    def log_ring_buffer_size(self) -> int:
+        """
+        Gets the number of records below the log level that are kept in memory and written to the log file
+        when an error is logged. ``0`` to disable.
+
+        The value for this property can be set in pyproject.toml (tool.oxt.config.log_ring_buffer_size)
+        """
+        return self._log_ring_buffer_size
+
+    @property
+    def mirrors(self) -> Dict[str, List[str]]:
+        """
+        Gets the mirror urls such as ``{"url_pip": [...], "pip_wheel_url": [...], "index_url": [...]}``.
+
+        The value for this property can be set in pyproject.toml (tool.oxt.mirrors)
+        """
+        return self._mirrors
+
     @property
     def py_pkg_dir(self) -> str:
         """
@@ -2,17 +2,19 @@
 # region Imports
 from __future__ import annotations
 from pathlib import Path
-from typing import Dict, List, Set, TYPE_CHECKING
+from typing import Any, Dict, List, Set, TYPE_CHECKING
 import json
 import os
 import sys
 import platform
 import site
+import threading
 
 from .oxt_logger.logger_config import LoggerConfig
 from .meta.singleton import Singleton
 from .basic_config import BasicConfig
-from .oxt_logger.oxt_logger import OxtLogger
+from .config_snapshot import ConfigSnapshot, get_snapshot_key
+from .oxt_logger.oxt_logger import get_logger
 
 if TYPE_CHECKING:
     from .lo_util import Session
@@ -44,33 +46,19 @@ class Config(metaclass=Singleton):
     # region Init
 
     def __init__(self):
-        if not TYPE_CHECKING:
-            from .lo_util import Session
-            from .info import ExtensionInfo
-            from .lo_util import Util
-            from .settings.general_settings import GeneralSettings
-
         logger_config = LoggerConfig()
-        self._logger = OxtLogger(log_name=__name__)
+        self._logger = get_logger(log_name=__name__)
         self._logger.debug("Initializing Config")
         try:
             self._log_file = logger_config.log_file
             self._log_name = logger_config.log_name
             self._log_format = logger_config.log_format
+            self._log_json_file = logger_config.log_json_file
+            self._log_ring_buffer_size = logger_config.log_ring_buffer_size
+            self._user_profile_path = logger_config.user_profile_path
             self._basic_config = BasicConfig()
             self._logger.debug("Basic config initialized")
-            generals_settings = GeneralSettings()
-            self._logger.debug("General Settings initialized")
-            self._url_pip = generals_settings.url_pip
-            self._pip_wheel_url = generals_settings.pip_wheel_url
-            self._test_internet_url = generals_settings.test_internet_url
-            self._log_pip_installs = generals_settings.log_pip_installs
-            self._show_progress = generals_settings.show_progress
-            self._startup_event = generals_settings.startup_event
-            self._delay_startup = generals_settings.delay_startup
 
-            self._session = Session()
-            self._extension_info = ExtensionInfo()
             self._auto_install_in_site_packages = self._basic_config.auto_install_in_site_packages
             if not self._auto_install_in_site_packages and os.getenv("DEV_CONTAINER", "") == "1":
                 # if running in a dev container (Codespace)
@@ -83,33 +71,21 @@ class Config(metaclass=Singleton):
             self._is_app_image = bool(os.getenv("APPIMAGE", ""))
             self._is_flatpak = bool(os.getenv("FLATPAK_ID", ""))
             self._is_snap = bool(os.getenv("SNAP_INSTANCE_NAME", ""))
-            self._site_packages = ""
-            util = Util()
-
-            # self._package_location = Path(file_util.get_package_location(self._lo_identifier, True))
-            self._package_location = Path(self._extension_info.get_extension_loc(self.lo_identifier, True)).resolve()
             self._python_major_minor = self._get_python_major_minor()
 
+            # created on first access, see _get_general_settings(), session and extension_info.
+            self._general_settings: GeneralSettings | None = None
+            self._session: Session | None = None
+            self._extension_info: ExtensionInfo | None = None
+
+            # python path, site-packages, install layers and package location take several UNO calls.
+            # They are loaded from the snapshot or worked out on first access, see _ensure_derived().
+            self._derived_lock = threading.RLock()
+            self._derived_ready = False
+            self._site_packages = ""
             self._is_user_installed = False
             self._is_shared_installed = False
             self._is_bundled_installed = False
-            self._set_extension_installs()
-
-            if self._is_win:
-                self._python_path = Path(self.join(util.config("Module"), "python.exe"))
-                self._site_packages = self._get_windows_site_packages_dir()
-            elif self._is_mac:
-                self._python_path = Path(self.join(util.config("Module"), "..", "Resources", "python")).resolve()
-                self._site_packages = self._get_mac_site_packages_dir()
-            elif self._is_app_image:
-                self._python_path = Path(self.join(util.config("Module"), "python"))
-                self._site_packages = self._get_default_site_packages_dir()
-            else:
-                self._python_path = Path(sys.executable)
-                if self._is_flatpak:
-                    self._site_packages = self._get_flatpak_site_packages_dir()
-                else:
-                    self._site_packages = self._get_default_site_packages_dir()
         except Exception as err:
             self._logger.error(f"Error initializing config: {err}", exc_info=True)
             raise
@@ -122,8 +98,99 @@ class Config(metaclass=Singleton):
     def join(self, *paths: str):
         return str(Path(paths[0]).joinpath(*paths[1:]))
 
+    def _ensure_derived(self) -> None:
+        """Loads the derived values from the snapshot or works them out, once."""
+        if self._derived_ready:
+            return
+        with self._derived_lock:
+            if self._derived_ready:
+                return
+            try:
+                snapshot = self._get_snapshot(self._user_profile_path)
+                values = snapshot.load() if snapshot else None
+                if values:
+                    self._set_snapshot_values(values)
+                    self._logger.debug("Config values loaded from snapshot")
+                else:
+                    self._set_derived_values()
+                    if snapshot:
+                        snapshot.save(self._get_snapshot_values())
+            except Exception as err:
+                self._logger.error(f"Error initializing config values: {err}", exc_info=True)
+                raise
+            self._derived_ready = True
+
+    def _get_general_settings(self) -> GeneralSettings:
+        if self._general_settings is None:
+            if not TYPE_CHECKING:
+                from .settings.general_settings import GeneralSettings
+            self._general_settings = GeneralSettings()
+            self._logger.debug("General Settings initialized")
+        return self._general_settings
+
+    def _set_derived_values(self) -> None:
+        """Works out the values that are kept in the config snapshot. This takes several UNO calls."""
+        if not TYPE_CHECKING:
+            from .lo_util import Util
+        util = Util()
+
+        # self._package_location = Path(file_util.get_package_location(self._lo_identifier, True))
+        self._package_location = Path(self.extension_info.get_extension_loc(self.lo_identifier, True)).resolve()
+        self._set_extension_installs()
+
+        if self._is_win:
+            self._python_path = Path(self.join(util.config("Module"), "python.exe"))
+            self._site_packages = self._get_windows_site_packages_dir()
+        elif self._is_mac:
+            self._python_path = Path(self.join(util.config("Module"), "..", "Resources", "python")).resolve()
+            self._site_packages = self._get_mac_site_packages_dir()
+        elif self._is_app_image:
+            self._python_path = Path(self.join(util.config("Module"), "python"))
+            self._site_packages = self._get_default_site_packages_dir()
+        else:
+            self._python_path = Path(sys.executable)
+            if self._is_flatpak:
+                self._site_packages = self._get_flatpak_site_packages_dir()
+            else:
+                self._site_packages = self._get_default_site_packages_dir()
+
+    def _get_snapshot(self, user_profile_path: str) -> ConfigSnapshot | None:
+        """Gets the config snapshot for this LibreOffice build and extension version, or ``None`` if it can not be keyed."""
+        if not TYPE_CHECKING:
+            from .lo_util import Util
+        try:
+            build_id = Util().get_build_id()
+        except Exception as err:
+            self._logger.debug("Unable to get LibreOffice build id: %s", err)
+            return None
+        if not build_id or not self._basic_config.extension_version:
+            return None
+        key = get_snapshot_key(build_id, self._basic_config.extension_version)
+        if self._is_app_image:
+            # each AppImage mounts at a new path.
+            key["appimage"] = os.getenv("APPIMAGE", "")
+        return ConfigSnapshot(Path(user_profile_path, f"{self.lo_identifier}.config_snapshot.json"), key)
+
+    def _get_snapshot_values(self) -> Dict[str, Any]:
+        return {
+            "package_location": str(self._package_location),
+            "python_path": str(self._python_path),
+            "site_packages": self._site_packages,
+            "is_user_installed": self._is_user_installed,
+            "is_shared_installed": self._is_shared_installed,
+            "is_bundled_installed": self._is_bundled_installed,
+        }
+
+    def _set_snapshot_values(self, values: Dict[str, Any]) -> None:
+        self._package_location = Path(values["package_location"])
+        self._python_path = Path(values["python_path"])
+        self._site_packages = str(values["site_packages"])
+        self._is_user_installed = bool(values["is_user_installed"])
+        self._is_shared_installed = bool(values["is_shared_installed"])
+        self._is_bundled_installed = bool(values["is_bundled_installed"])
+
     def _set_extension_installs(self) -> None:
-        details = self._extension_info.get_extension_details(self.lo_identifier)
+        details = self.extension_info.get_extension_details(self.lo_identifier)
         if details[0] is not None:
             self._is_user_installed = True
         if details[1] is not None:
@@ -146,7 +213,7 @@ class Config(metaclass=Singleton):
         return Path(packages[0]).resolve()
 
     def _get_default_site_packages_dir(self) -> str:
-        if self.is_shared_installed or self.is_bundled_installed:
+        if self._is_shared_installed or self._is_bundled_installed:
             # if package has been installed for all users (root)
             site_packages = self._get_shared_site_packages_dir()
         else:
@@ -168,7 +235,7 @@ class Config(metaclass=Singleton):
 
     def _get_mac_site_packages_dir(self) -> str:
         # sourcery skip: class-extract-method
-        if self.is_shared_installed or self.is_bundled_installed:
+        if self._is_shared_installed or self._is_bundled_installed:
             # if package has been installed for all users (root)
             site_packages = self._get_shared_site_packages_dir()
         else:
@@ -183,7 +250,7 @@ class Config(metaclass=Singleton):
 
     def _get_windows_site_packages_dir(self) -> str:
         # sourcery skip: class-extract-method
-        if self.is_shared_installed or self.is_bundled_installed:
+        if self._is_shared_installed or self._is_bundled_installed:
             # if package has been installed for all users (root)
             site_packages = self._get_shared_site_packages_dir()
         else:
@@ -211,7 +278,7 @@ class Config(metaclass=Singleton):
         """
         Gets the flag indicating if the startup should be delayed.
         """
-        return self._delay_startup
+        return self._get_general_settings().delay_startup
 
     @property
     def default_locale(self) -> List[str]:
@@ -242,7 +309,7 @@ class Config(metaclass=Singleton):
 
         The value for this property can be set in pyproject.toml (tool.oxt.token.url_pip)
         """
-        return self._url_pip
+        return self._get_general_settings().url_pip
         # return self._basic_config.url_pip
 
     @property
@@ -252,7 +319,7 @@ class Config(metaclass=Singleton):
 
         The value for this property can be set in pyproject.toml (tool.oxt.token.test_internet_url)
         """
-        return self._test_internet_url
+        return self._get_general_settings().test_internet_url
 
     @property
     def python_path(self) -> Path:
@@ -261,6 +328,7 @@ class Config(metaclass=Singleton):
 
         For some strange reason, on windows, the path can come back as 'soffice.bin' for 'sys.executable'.
         """
+        self._ensure_derived()
         return self._python_path
 
     @property
@@ -299,6 +367,24 @@ class Config(metaclass=Singleton):
         """
         return self._log_format
 
+    @property
+    def log_json_file(self) -> str:
+        """
+        Gets the json lines file for timing records. Empty string if not set.
+
+        The value for this property can be set in pyproject.toml (tool.oxt.config.log_json_file)
+        """
+        return self._log_json_file
+
+    @property
+    def log_ring_buffer_size(self) -> int:
+        """
+        Gets the number of debug records kept in memory and written to the log file when an error is logged.
+
+        The value for this property can be set in pyproject.toml (tool.oxt.config.log_ring_buffer_size)
+        """
+        return self._log_ring_buffer_size
+
     @property
     def py_pkg_dir(self) -> str:
         """
@@ -405,6 +491,7 @@ class Config(metaclass=Singleton):
         """
         Gets the flag indicating if extension is installed as user.
         """
+        self._ensure_derived()
         return self._is_user_installed
 
     @property
@@ -412,6 +499,7 @@ class Config(metaclass=Singleton):
         """
         Gets the flag indicating if extension is installed as shared.
         """
+        self._ensure_derived()
         return self._is_shared_installed
 
     @property
@@ -419,6 +507,7 @@ class Config(metaclass=Singleton):
         """
         Gets the flag indicating if extension is installed bundled with LibreOffice.
         """
+        self._ensure_derived()
         return self._is_bundled_installed
 
     @property
@@ -435,7 +524,7 @@ class Config(metaclass=Singleton):
 
         May be empty string.
         """
-        return self._pip_wheel_url
+        return self._get_general_settings().pip_wheel_url
 
     @property
     def install_wheel(self) -> bool:
@@ -474,6 +563,7 @@ class Config(metaclass=Singleton):
         """
         Gets the path to the site-packages directory. May be empty string.
         """
+        self._ensure_derived()
         return self._site_packages
 
     @property
@@ -481,6 +571,10 @@ class Config(metaclass=Singleton):
         """
         Gets the LibreOffice session info.
         """
+        if self._session is None:
+            if not TYPE_CHECKING:
+                from .lo_util import Session
+            self._session = Session()
         return self._session
 
     @property
@@ -488,6 +582,7 @@ class Config(metaclass=Singleton):
         """
         Gets the LibreOffice package location.
         """
+        self._ensure_derived()
         return self._package_location
 
     @property
@@ -495,6 +590,10 @@ class Config(metaclass=Singleton):
         """
         Gets the LibreOffice extension info.
         """
+        if self._extension_info is None:
+            if not TYPE_CHECKING:
+                from .info import ExtensionInfo
+            self._extension_info = ExtensionInfo()
         return self._extension_info
 
     @property
@@ -502,7 +601,7 @@ class Config(metaclass=Singleton):
         """
         Gets the flag indicating if pip installs should be logged.
         """
-        return self._log_pip_installs
+        return self._get_general_settings().log_pip_installs
 
     @property
     def has_locals(self) -> bool:
@@ -511,6 +610,67 @@ class Config(metaclass=Singleton):
         """
         return self._basic_config.has_locals
 
+    @property
+    def download_backoff(self) -> float:
+        """
+        Gets the delay in seconds before the first download retry. The delay is doubled for each following retry.
+
+        The value for this property can be set in pyproject.toml (tool.oxt.config.download_backoff)
+        """
+        return self._basic_config.download_backoff
+
+    @property
+    def download_retries(self) -> int:
+        """
+        Gets the number of times a failed download is retried.
+
+        The value for this property can be set in pyproject.toml (tool.oxt.config.download_retries)
+        """
+        return self._basic_config.download_retries
+
+    @property
+    def index_url_mirrors(self) -> List[str]:
+        """
+        Gets the package index urls used by pip.
+
+        The value for this property can be set in pyproject.toml (tool.oxt.mirrors.index_url)
+
+        When empty pip uses its default index.
+        """
+        return list(self._basic_config.mirrors.get("index_url", []))
+
+    @property
+    def pip_wheel_url_mirrors(self) -> List[str]:
+        """
+        Gets the mirrors of ``pip_wheel_url``.
+
+        The value for this property can be set in pyproject.toml (tool.oxt.mirrors.pip_wheel_url)
+        """
+        return list(self._basic_config.mirrors.get("pip_wheel_url", []))
+
+    @property
+    def url_pip_mirrors(self) -> List[str]:
+        """
+        Gets the mirrors of ``url_pip``.
+
+        The value for this property can be set in pyproject.toml (tool.oxt.mirrors.url_pip)
+        """
+        return list(self._basic_config.mirrors.get("url_pip", []))
+
+    @property
+    def has_wheelhouse(self) -> bool:
+        """
+        Gets the flag indicating if the extension has a wheelhouse of requirement wheels to install from.
+        """
+        return self._basic_config.has_wheelhouse
+
+    @property
+    def wheelhouse_path(self) -> Path:
+        """
+        Gets the path to the wheelhouse folder of the extension.
+        """
+        return self.package_location / "wheelhouse"
+
     @property
     def resource_dir_name(self) -> str:
         """
@@ -538,7 +698,7 @@ class Config(metaclass=Singleton):
         """
         Gets the flag indicating if the terminal should be shown.
         """
-        return self._show_progress
+        return self._get_general_settings().show_progress
 
     @property
     def startup_event(self) -> str:
@@ -547,7 +707,7 @@ class Config(metaclass=Singleton):
 
         The value for this property can be set in pyproject.toml (tool.oxt.token.startup_event)
         """
-        return self._startup_event
+        return self._get_general_settings().startup_event
 
     @property
     def uninstall_on_update(self) -> bool:
@@ -0,0 +1,113 @@
+"""
+Json snapshot of the ``Config`` values that are derived from LibreOffice at startup.
+
+Working out the python path, site-packages, install layer and package location takes several UNO calls
+and ``site`` lookups on every launch. The values only change when LibreOffice or the extension changes,
+so they are saved keyed on the LibreOffice build id, the extension version and the running python
+and reused while the key matches and the saved paths still exist.
+"""
+from __future__ import annotations
+from typing import Any, Dict
+from pathlib import Path
+import json
+import os
+import sys
+
+from .input_output.atomic_file import write_json_atomic
+
+SNAPSHOT_VERSION = 1
+
+PATH_KEYS = ("package_location", "python_path", "site_packages")
+OPTIONAL_PATH_KEYS = ("site_packages",)
+"""Path keys that may be empty, ``Config.site_packages`` is empty when it could not be worked out."""
+FLAG_KEYS = ("is_user_installed", "is_shared_installed", "is_bundled_installed")
+
+
+def get_snapshot_key(build_id: str, extension_version: str) -> Dict[str, Any]:
+    """
+    Gets the key a snapshot is valid for.
+
+    Args:
+        build_id (str): LibreOffice build id.
+        extension_version (str): Extension version.
+
+    Returns:
+        Dict[str, Any]: Key.
+    """
+    return {
+        "snapshot_version": SNAPSHOT_VERSION,
+        "build_id": build_id,
+        "extension_version": extension_version,
+        "python": sys.version,
+        "executable": sys.executable,
+    }
+
+
+class ConfigSnapshot:
+    """Loads and saves the snapshot file."""
+
+    def __init__(self, file: str | Path, key: Dict[str, Any]) -> None:
+        """
+        Constructor
+
+        Args:
+            file (str | Path): Snapshot file.
+            key (Dict[str, Any]): Key from ``get_snapshot_key()``.
+        """
+        self._file = Path(file)
+        self._key = key
+
+    def load(self) -> Dict[str, Any] | None:
+        """
+        Loads the snapshot values.
+
+        Returns:
+            Dict[str, Any] | None: Values, or ``None`` if there is no snapshot, its key does not match
+            or one of its paths no longer exists. An empty optional path such as ``site_packages`` is kept.
+        """
+        try:
+            with open(self._file, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if not isinstance(data, dict) or data.get("key") != self._key:
+            return None
+        values = data.get("values")
+        if not isinstance(values, dict):
+            return None
+        for key in PATH_KEYS:
+            value = values.get(key)
+            if not isinstance(value, str):
+                return None
+            if not value:
+                if key in OPTIONAL_PATH_KEYS:
+                    continue
+                return None
+            if not os.path.exists(value):
+                return None
+        for key in FLAG_KEYS:
+            if not isinstance(values.get(key), bool):
+                return None
+        return values
+
+    def save(self, values: Dict[str, Any]) -> None:
+        """
+        Saves the snapshot values. Errors are ignored, without a snapshot the values are worked out again.
+
+        Args:
+            values (Dict[str, Any]): Values with the ``PATH_KEYS`` and ``FLAG_KEYS`` keys.
+        """
+        data = {"key": self._key, "values": {k: values[k] for k in (*PATH_KEYS, *FLAG_KEYS)}}
+        write_json_atomic(self._file, data)
+
+    def clear(self) -> None:
+        """Removes the snapshot file."""
+        try:
+            self._file.unlink()
+        except OSError:
+            pass
+
+    @property
+    def file(self) -> Path:
+        """Gets the snapshot file."""
+        return self._file
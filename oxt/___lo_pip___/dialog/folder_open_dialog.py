@@ -2,7 +2,7 @@ from __future__ import annotations
 from typing import TYPE_CHECKING, cast, Any
 from .dialog_base import DialogBase
 
-from ..oxt_logger import OxtLogger
+from ..oxt_logger import get_logger
 
 if TYPE_CHECKING:
     from com.sun.star.ui.dialogs import FolderPicker  # service
@@ -24,7 +24,7 @@ class FolderOpenDialog(DialogBase):
             description (str): Description of the dialog.
         """
         super().__init__(ctx)
-        self._logger = OxtLogger(log_name=__name__)
+        self._logger = get_logger(log_name=__name__)
         self._logger.debug("FolderOpenDialog.__init__")
         self.args = kwargs
         try:
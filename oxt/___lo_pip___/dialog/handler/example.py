@@ -14,7 +14,7 @@ from ...lo_util.configuration import Configuration, SettingsT
 from ...settings.settings import Settings
 from ..file_open_dialog import FileOpenDialog
 
-from ...oxt_logger import OxtLogger
+from ...oxt_logger import get_logger
 
 if TYPE_CHECKING:
     from com.sun.star.awt import UnoControlDialog  # service
@@ -27,7 +27,7 @@ IMPLEMENTATION_NAME = f"{BasicConfig().lo_implementation_name}.Example"
 
 class ButtonListener(unohelper.Base, XActionListener):
     def __init__(self, cast: "OptionsDialogHandler"):
-        self._logger = OxtLogger(log_name=__name__)
+        self._logger = get_logger(log_name=__name__)
         self._logger.debug("ButtonListener.__init__")
         self.cast = cast
         self._logger.debug("ButtonListener.__init__ done")
@@ -51,7 +51,7 @@ class ButtonListener(unohelper.Base, XActionListener):
 
 class OptionsDialogHandler(unohelper.Base, XContainerWindowEventHandler):
     def __init__(self, ctx: Any):
-        self._logger = OxtLogger(log_name=__name__)
+        self._logger = get_logger(log_name=__name__)
         self._logger.debug("OptionsDialogHandler.__init__")
         self.ctx = ctx
         self._config = BasicConfig()
@@ -15,7 +15,7 @@ from ...lo_util.resource_resolver import ResourceResolver
 from ...lo_util.configuration import Configuration, SettingsT
 from ...settings.settings import Settings
 
-from ...oxt_logger import OxtLogger
+from ...oxt_logger import get_logger
 from ..message_dialog import MessageDialog
 from ...lo_util.clipboard import copy_to_clipboard
 
@@ -50,7 +50,7 @@ _OPT_LOG = {
 
 class ButtonListener(unohelper.Base, XActionListener):
     def __init__(self, cast: "OptionsDialogHandler"):
-        self._logger = OxtLogger(log_name=__name__)
+        self._logger = get_logger(log_name=__name__)
         self._logger.debug("ButtonListener.__init__")
         self.cast = cast
         self._logger.debug("ButtonListener.__init__ done")
@@ -86,7 +86,7 @@ class ButtonListener(unohelper.Base, XActionListener):
 
 class RadioButtonListener(unohelper.Base, XPropertyChangeListener):
     def __init__(self, cast: "OptionsDialogHandler"):
-        self._logger = OxtLogger(log_name=__name__)
+        self._logger = get_logger(log_name=__name__)
         self._logger.debug("RadioButtonListener.__init__")
         self.cast = cast
         self._logger.debug("RadioButtonListener.__init__ done")
@@ -108,7 +108,7 @@ class RadioButtonListener(unohelper.Base, XPropertyChangeListener):
 
 class OptionsDialogHandler(unohelper.Base, XContainerWindowEventHandler):
     def __init__(self, ctx: Any):
-        self._logger = OxtLogger(log_name=__name__)
+        self._logger = get_logger(log_name=__name__)
         self._logger.debug("Logging-OptionsDialogHandler.__init__")
         self.ctx = ctx
         self._config = Config()
@@ -1,7 +1,8 @@
 from __future__ import annotations
 import contextlib
-from typing import Any, TYPE_CHECKING, Literal, cast, Callable, Set, Sequence
+from typing import Any, TYPE_CHECKING, List, Literal, cast, Callable, Set, Sequence, Tuple
 from pathlib import Path
+import threading
 
 import uno
 import unohelper
@@ -20,16 +21,20 @@ from com.sun.star.resource import MissingResourceException
 
 from ...basic_config import BasicConfig
 from ...config import Config
+from ...lo_util.async_callback import AsyncCallback
 from ...lo_util.configuration import Configuration, SettingsT
 from ...lo_util.link_cpython import LinkCPython
 from ...lo_util.resource_resolver import ResourceResolver
-from ...oxt_logger import OxtLogger
+from ...oxt_logger import get_logger
+from ...oxt_logger.logger_config import LoggerConfig
 from ...settings.py_paths_settings import PyPathsSettings
 from ...settings.settings import Settings
 from ..file_open_dialog import FileOpenDialog
 from ..folder_open_dialog import FolderOpenDialog
 from ..message_dialog import MessageDialog
 from ...py_paths import PathItems
+from ...py_paths.path_glob import PathGlobCache, is_glob_pattern
+from ...py_paths.venv_discovery import VenvDiscovery, VenvInfo
 
 if TYPE_CHECKING:
     from com.sun.star.awt import ItemEvent  # struct
@@ -48,7 +53,7 @@ IMPLEMENTATION_NAME = f"{BasicConfig().lo_implementation_name}.PyPathsOptionsPag
 
 class CheckBoxListener(unohelper.Base, XPropertyChangeListener):
     def __init__(self, handler: "OptionsDialogHandler"):
-        self._logger = OxtLogger(log_name=__name__)
+        self._logger = get_logger(log_name=__name__)
         self._logger.debug("CheckBoxListener.__init__")
         self.handler = handler
         self._logger.debug("CheckBoxListener.__init__ done")
@@ -95,7 +100,7 @@ class ItemListener(unohelper.Base, XItemListener):
 
 class ButtonListener(unohelper.Base, XActionListener):
     def __init__(self, cast: "OptionsDialogHandler"):
-        self._logger = OxtLogger(log_name=__name__)
+        self._logger = get_logger(log_name=__name__)
         self._logger.debug("ButtonListener.__init__")
         self.cast = cast
         self._logger.debug("ButtonListener.__init__ done")
@@ -128,6 +133,8 @@ class ButtonListener(unohelper.Base, XActionListener):
                 self.cast.action_move("up")
             elif cmd == "MoveDown":
                 self.cast.action_move("dn")
+            elif cmd == "Discover":
+                self.cast.action_discover()
         except Exception as err:
             self._logger.error(f"ButtonListener.actionPerformed: {err}", exc_info=True)
             raise err
@@ -135,7 +142,7 @@ class ButtonListener(unohelper.Base, XActionListener):
 
 class OptionsDialogHandler(unohelper.Base, XContainerWindowEventHandler):
     def __init__(self, ctx: Any):
-        self._logger = OxtLogger(log_name=__name__)
+        self._logger = get_logger(log_name=__name__)
         self._logger.debug("PyPaths-OptionsDialogHandler.__init__")
         self.ctx = ctx
         self._config = Config()
@@ -149,6 +156,8 @@ class OptionsDialogHandler(unohelper.Base, XContainerWindowEventHandler):
         self._path_verify_orig = True
         self._path_append = True
         self._path_append_orig = True
+        self._venv_roots: Tuple[str, ...] = ()
+        self._venv_roots_orig: Tuple[str, ...] = ()
         self._btn_link_visible = self._config.is_mac or self._config.is_app_image
         self._logger.debug("PyPaths-OptionsDialogHandler.__init__ done")
 
@@ -183,26 +192,36 @@ class OptionsDialogHandler(unohelper.Base, XContainerWindowEventHandler):
         if name != self._window_name:
             return
         data = self._get_list_data(window)
-        if self._py_settings.py_paths != data or self._path_verify_orig != self._path_verify:
-            if self._py_settings.py_paths != data:
-                self._logger.debug("PyPaths-OptionsDialogHandler._save_data: data changed")
-                self._py_settings.py_paths = data
-            else:
-                self._logger.debug("PyPaths-OptionsDialogHandler._save_data: data not changed")
-            if self._path_verify_orig != self._path_verify:
-                self._logger.debug(
-                    f"PyPaths-OptionsDialogHandler._save_data: path_verify changed: {self._path_verify}"
-                )
-                self._py_settings.py_path_verify = self._path_verify
-            else:
-                self._logger.debug("PyPaths-OptionsDialogHandler._save_data: path_verify not changed")
-            if self._path_append_orig != self._path_append:
-                self._logger.debug(
-                    f"PyPaths-OptionsDialogHandler._save_data: path_append changed: {self._path_append}"
-                )
-                self._py_settings.py_path_append = self._path_append
-            else:
-                self._logger.debug("PyPaths-OptionsDialogHandler._save_data: path_append not changed")
+        if (
+            self._py_settings.py_paths != data
+            or self._path_verify_orig != self._path_verify
+            or self._path_append_orig != self._path_append
+            or self._venv_roots_orig != self._venv_roots
+        ):
+            # one commit and one settings reload for all changes.
+            with Configuration().batch():
+                if self._py_settings.py_paths != data:
+                    self._logger.debug("PyPaths-OptionsDialogHandler._save_data: data changed")
+                    self._py_settings.py_paths = data
+                else:
+                    self._logger.debug("PyPaths-OptionsDialogHandler._save_data: data not changed")
+                if self._path_verify_orig != self._path_verify:
+                    self._logger.debug(
+                        f"PyPaths-OptionsDialogHandler._save_data: path_verify changed: {self._path_verify}"
+                    )
+                    self._py_settings.py_path_verify = self._path_verify
+                else:
+                    self._logger.debug("PyPaths-OptionsDialogHandler._save_data: path_verify not changed")
+                if self._path_append_orig != self._path_append:
+                    self._logger.debug(
+                        f"PyPaths-OptionsDialogHandler._save_data: path_append changed: {self._path_append}"
+                    )
+                    self._py_settings.py_path_append = self._path_append
+                else:
+                    self._logger.debug("PyPaths-OptionsDialogHandler._save_data: path_append not changed")
+                if self._venv_roots_orig != self._venv_roots:
+                    self._logger.debug("PyPaths-OptionsDialogHandler._save_data: venv_roots changed")
+                    self._py_settings.venv_roots = self._venv_roots
             title = self._resource_resolver.resolve_string("msg09")
             msg = self._resource_resolver.resolve_string("msg10")
             _ = MessageDialog(
@@ -262,6 +281,11 @@ class OptionsDialogHandler(unohelper.Base, XContainerWindowEventHandler):
                 btn_down.addActionListener(btn_listener)
                 btn_down.setEnable(False)
 
+                btn_discover = self._get_ctl_discover(window)
+                btn_discover.setActionCommand("Discover")
+                btn_discover.addActionListener(btn_listener)
+                btn_discover.setEnable(True)
+
                 if self._btn_link_visible:
                     btn_link = self._get_ctl_link(window)
                     btn_link.setActionCommand("Link")
@@ -287,10 +311,12 @@ class OptionsDialogHandler(unohelper.Base, XContainerWindowEventHandler):
                 self._path_verify_orig = self._path_verify
                 self._path_append = self._py_settings.py_path_append
                 self._path_append_orig = self._path_append
+                self._venv_roots = self._py_settings.venv_roots
+                self._venv_roots_orig = self._venv_roots
 
                 ellipse = self._resource_resolver.resolve_string("ellipse")
 
-                el_buttons = {"cmdAdd", "cmdAddFile", "cmdImport", "cmdExport", "cmdLink", "cmdUnlink"}
+                el_buttons = {"cmdAdd", "cmdAddFile", "cmdImport", "cmdExport", "cmdLink", "cmdUnlink", "cmdDiscover"}
 
                 for control in window.Controls:  # type: ignore
                     if not control.supportsService("com.sun.star.awt.UnoControlListBox"):
@@ -484,8 +510,11 @@ class OptionsDialogHandler(unohelper.Base, XContainerWindowEventHandler):
             )
             msg_box.execute()
             return
-        p = Path(path)
-        if p.exists():
+        if is_glob_pattern(path):
+            exists = bool(PathGlobCache().expand(path))
+        else:
+            exists = Path(path).exists()
+        if exists:
             msg_box = MessageDialog(
                 ctx=self.ctx,
                 parent=self.window.getPeer(),
@@ -607,9 +636,7 @@ class OptionsDialogHandler(unohelper.Base, XContainerWindowEventHandler):
                 data: PathItems = PathItems()
                 try:
                     with open(pth, "r") as f:
-                        for line in f:
-                            if line_data := line.strip():
-                                data.add_path(line_data)
+                        data.extend(line_data for line in f if (line_data := line.strip()))
                 except UnicodeDecodeError as err:
                     msg_box = MessageDialog(
                         ctx=self.ctx,
@@ -639,7 +666,7 @@ class OptionsDialogHandler(unohelper.Base, XContainerWindowEventHandler):
                         if result == MessageBoxResults.CANCEL:
                             return
                         if result == MessageBoxResults.YES:
-                            data = data.union(current_data)
+                            data.merge(current_data)
 
                 self._refresh_list_data(self.window, data)
                 lb = self._get_model_lst_py_paths(self.window)
@@ -689,6 +716,81 @@ class OptionsDialogHandler(unohelper.Base, XContainerWindowEventHandler):
 
     # endregion Import Export
 
+    def action_discover(self) -> None:
+        """Searches a folder and the folders searched before for matching virtual environments, off the UI thread."""
+        self._logger.debug("PyPaths-OptionsDialogHandler.action_discover")
+        if not self.window:
+            return
+        ret = self.choose_folder()
+        if not ret:
+            return
+        root = uno.fileUrlToSystemPath(ret)
+        if root not in self._venv_roots:
+            self._venv_roots = (*self._venv_roots, root)
+        # the chosen folder first, it is what the user is looking for.
+        roots = [root] + [r for r in self._venv_roots if r != root]
+        version = self._config.python_major_minor
+        cache_file = Path(LoggerConfig().user_profile_path, f"{self._config.lo_identifier}.venv_discovery.json")
+        # the page can be closed and opened again while the scan runs, the result belongs to this window only.
+        window = self.window
+        self._get_ctl_discover(window).setEnable(False)
+
+        def discover() -> None:
+            found: List[VenvInfo] = []
+            try:
+                discovery = VenvDiscovery(version, cache_file)
+                found = discovery.discover(roots)
+                self._logger.debug(
+                    "PyPaths-OptionsDialogHandler.action_discover: %d found, %d roots from cache, %d scanned",
+                    len(found),
+                    discovery.hits,
+                    discovery.misses,
+                )
+            except Exception as err:
+                self._logger.error(f"PyPaths-OptionsDialogHandler.action_discover: {err}", exc_info=True)
+            AsyncCallback(lambda: self._discover_done(window, found)).post()
+
+        threading.Thread(target=discover, name="lo_pip_venv_discovery", daemon=True).start()
+
+    def _discover_done(self, window: UnoControlDialog, found: List[VenvInfo]) -> None:
+        """Offers the site-packages found by ``action_discover()``, on the UI thread."""
+        self._logger.debug("PyPaths-OptionsDialogHandler._discover_done")
+        if not self.window or self.window is not window:
+            self._logger.debug("PyPaths-OptionsDialogHandler._discover_done: window changed, result ignored")
+            return
+        try:
+            self._get_ctl_discover(self.window).setEnable(True)
+            data = self._get_list_data(self.window)
+            new_venvs = [venv for venv in found if data.find_path_item(venv.site_packages) is None]
+            version = self._config.python_major_minor
+            if not new_venvs:
+                msg_box = MessageDialog(
+                    ctx=self.ctx,
+                    parent=self.window.getPeer(),
+                    type=INFOBOX,
+                    message=self._resource_resolver.resolve_string("msg24").format(version),
+                    title=self._resource_resolver.resolve_string("title04"),
+                )
+                _ = msg_box.execute()
+                return
+            lines = "\n".join(venv.path for venv in new_venvs)
+            msg_box = MessageDialog(
+                ctx=self.ctx,
+                parent=self.window.getPeer(),
+                type=QUERYBOX,
+                message=f"{self._resource_resolver.resolve_string('msg25').format(version)}\n\n{lines}",
+                title=self._resource_resolver.resolve_string("title04"),
+                buttons=MessageBoxButtons.BUTTONS_YES_NO,
+            )
+            if msg_box.execute() != MessageBoxResults.YES:
+                return
+            data.extend(venv.site_packages for venv in new_venvs)
+            self._refresh_list_data(self.window, data)
+            lb = self._get_model_lst_py_paths(self.window)
+            self._update_ui(bool(lb.SelectedItems))
+        except Exception as err:
+            self._logger.error(f"PyPaths-OptionsDialogHandler._discover_done: {err}", exc_info=True)
+
     def action_move(self, direction: Literal["up", "dn"]) -> None:
         self._logger.debug(f"PyPaths-OptionsDialogHandler.action_move: {direction}")
         if not self.window:
@@ -748,6 +850,9 @@ class OptionsDialogHandler(unohelper.Base, XContainerWindowEventHandler):
     def _get_ctl_export(self, window: UnoControlDialog) -> UnoControlButton:
         return cast("UnoControlButton", window.getControl("cmdExport"))
 
+    def _get_ctl_discover(self, window: UnoControlDialog) -> UnoControlButton:
+        return cast("UnoControlButton", window.getControl("cmdDiscover"))
+
     def _get_ctl_link(self, window: UnoControlDialog) -> UnoControlButton:
         return cast("UnoControlButton", window.getControl("cmdLink"))
 
@@ -1,7 +1,7 @@
 from __future__ import annotations
 from typing import Any
 from ...meta.singleton import Singleton
-from ...oxt_logger import OxtLogger
+from ...oxt_logger import get_logger
 from ...events.lo_events import LoEvents
 from ...events.args.event_args import EventArgs
 from ...events.named_events.startup_events import StartupNamedEvent
@@ -11,7 +11,7 @@ class StartupMonitor(metaclass=Singleton):
     """Singleton class to monitor startup progress."""
 
     def __init__(self) -> None:
-        self._logger = OxtLogger(log_name=__name__)
+        self._logger = get_logger(log_name=__name__)
         self._window_started = False
 
         def on_window_started(source: Any, event: EventArgs) -> None:
@@ -1,5 +1,5 @@
 from __future__ import annotations
-from typing import cast, Any, Tuple, TYPE_CHECKING
+from typing import cast, Tuple, TYPE_CHECKING
 from logging import Logger
 import uno
 
@@ -7,6 +7,7 @@ from com.sun.star.deployment import XPackageInformationProvider
 from com.sun.star.deployment import XPackage
 
 from ..meta.singleton import Singleton
+from ..lo_util.uno_services import UnoServices
 
 # from ..lo_util import Util
 
@@ -53,15 +54,13 @@ class ExtensionInfo(metaclass=Singleton):
             XPackageInformationProvider: Package Information Provider
         """
         # sourcery skip: raise-specific-error
-        ctx: Any = uno.getComponentContext()
-        pip = ctx.getValueByName("/singletons/com.sun.star.deployment.PackageInformationProvider")
+        pip = UnoServices().get_singleton("com.sun.star.deployment.PackageInformationProvider")
         if pip is None:
             raise Exception("Unable to get PackageInformationProvider, pip is None")
         return cast(XPackageInformationProvider, pip)
 
     def get_extension_manager(self) -> ExtensionManager:
-        ctx: Any = uno.getComponentContext()
-        return ctx.getValueByName("/singletons/com.sun.star.deployment.ExtensionManager")
+        return UnoServices().get_singleton("com.sun.star.deployment.ExtensionManager")
 
     def get_extension_details(self, pkg_id: str) -> Tuple[XPackage, ...]:
         """
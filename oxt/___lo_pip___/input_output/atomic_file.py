@@ -0,0 +1,60 @@
+"""
+Writes files so that a reader never sees a partly written file.
+
+The data is written to a temp file in the folder of the target and then moved over the target with ``os.replace``.
+The temp file is removed when anything fails, so no ``.tmp_`` files are left behind.
+"""
+from __future__ import annotations
+from typing import Any
+from pathlib import Path
+import json
+import os
+import tempfile
+
+
+def write_atomic(file: str | Path, data: bytes) -> None:
+    """
+    Writes a file atomically.
+
+    Args:
+        file (str | Path): File. Its folder must exist.
+        data (bytes): Content.
+
+    Raises:
+        OSError: If the file can not be written.
+    """
+    file = Path(file)
+    fd, tmp = tempfile.mkstemp(dir=file.parent, prefix=".tmp_")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp, file)
+    except BaseException:
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+        raise
+
+
+def write_json_atomic(file: str | Path, data: Any) -> bool:
+    """
+    Writes a json file atomically, creating its folder if needed.
+
+    Errors are not raised, the callers write caches that are worked out again when they can not be read.
+
+    Args:
+        file (str | Path): File.
+        data (Any): Json serializable data.
+
+    Returns:
+        bool: ``True`` if the file was written.
+    """
+    file = Path(file)
+    try:
+        content = json.dumps(data, indent=2).encode("utf-8")
+        file.parent.mkdir(parents=True, exist_ok=True)
+        write_atomic(file, content)
+    except (OSError, TypeError, ValueError):
+        return False
+    return True
@@ -7,6 +7,8 @@ from shutil import which
 from contextlib import contextmanager
 import uno
 
+from ..lo_util.uno_services import UnoServices
+
 
 @contextmanager
 def change_dir(directory):
@@ -197,12 +199,13 @@ def get_user_profile_path(as_sys_path: bool = True, ctx: Any = None) -> str:
         ctx (Any, optional): The context to use. Defaults to None.
     """
     if ctx is None:
-        ctx = uno.getComponentContext()
-    result = ctx.ServiceManager.createInstance(
-        "com.sun.star.util.PathSubstitution"
-    ).substituteVariables(  # type: ignore
-        "$(user)", True
-    )
+        result = UnoServices().substitute_variables("$(user)")
+    else:
+        result = ctx.ServiceManager.createInstance(
+            "com.sun.star.util.PathSubstitution"
+        ).substituteVariables(  # type: ignore
+            "$(user)", True
+        )
     return uno.fileUrlToSystemPath(result) if as_sys_path else result
 
 
@@ -224,8 +227,9 @@ def get_package_location(pkg_id: str, as_sys_path: bool = True, ctx: Any = None)
     """
     # sourcery skip: reintroduce-else, swap-if-else-branches, use-named-expression
     if ctx is None:
-        ctx = uno.getComponentContext()
-    pip = ctx.getValueByName("/singletons/com.sun.star.deployment.PackageInformationProvider")
+        pip = UnoServices().get_singleton("com.sun.star.deployment.PackageInformationProvider")
+    else:
+        pip = ctx.getValueByName("/singletons/com.sun.star.deployment.PackageInformationProvider")
     # pip.getPackageLocation("org.openoffice.extensions.ooopip")
     result = pip.getPackageLocation(pkg_id)
     if not result:
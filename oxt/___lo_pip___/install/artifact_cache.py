@@ -0,0 +1,216 @@
+"""
+Artifact cache for downloaded installation files such as ``get-pip.py`` and the pip wheel.
+
+Each artifact is stored in its own folder, named from a hash of the url, together with a small json file
+that holds the ``ETag`` and ``Last-Modified`` values returned by the server.
+When an artifact is requested again a conditional ``GET`` is sent and the cached file is reused
+when the server answers ``304 Not Modified`` or when the server can not be reached.
+"""
+from __future__ import annotations
+from enum import Enum
+from typing import Any, Dict, Iterable, NamedTuple
+from pathlib import Path
+from urllib.parse import urlparse
+from urllib.error import URLError
+import hashlib
+import json
+import shutil
+
+from ..input_output.atomic_file import write_atomic
+from .http_pool import HttpPool, ProgressCallback
+from .mirrors import RetryPolicy, request_with_retry
+
+
+class CacheStatus(Enum):
+    """Status of a cache fetch."""
+
+    DOWNLOADED = 1
+    """Artifact was downloaded and stored in the cache."""
+    NOT_MODIFIED = 2
+    """Server reported the cached artifact is current."""
+    OFFLINE = 3
+    """Server could not be reached, cached artifact is used."""
+    FAILED = 4
+    """Artifact could not be downloaded and is not cached."""
+
+
+class CacheResult(NamedTuple):
+    """Result of a cache fetch."""
+
+    path: Path | None
+    """Path to the cached artifact or ``None`` if not available."""
+    status: CacheStatus
+    """Fetch status."""
+    err: str = ""
+    """Error message, if any."""
+
+
+class ArtifactCache:
+    """Revalidating file cache for downloaded artifacts."""
+
+    META_FILE = "meta.json"
+
+    def __init__(
+        self,
+        cache_dir: str | Path,
+        pool: HttpPool | None = None,
+        timeout: float = 30.0,
+        retry: RetryPolicy | None = None,
+    ) -> None:
+        """
+        Constructor
+
+        Args:
+            cache_dir (str | Path): Directory where artifacts are cached. Created if it does not exist.
+            pool (HttpPool, optional): Connection pool used for requests. Defaults to a new pool.
+            timeout (float, optional): Timeout in seconds for network requests. Defaults to ``30.0``.
+            retry (RetryPolicy, optional): Retry settings for each url. Defaults to no retries.
+        """
+        self._cache_dir = Path(cache_dir)
+        self._pool = HttpPool() if pool is None else pool
+        self._timeout = timeout
+        self._retry = RetryPolicy(retries=0) if retry is None else retry
+
+    # region Methods
+    def fetch(
+        self,
+        url: str,
+        filename: str = "",
+        verify: bool = True,
+        offline: bool = False,
+        on_progress: ProgressCallback | None = None,
+        mirrors: Iterable[str] = (),
+    ) -> CacheResult:
+        """
+        Gets an artifact, downloading it only when the cached copy is missing or stale.
+
+        When mirrors are given they are tried in order instead of ``url`` until one succeeds.
+        ``url`` is always used as the cache key so all mirrors share one cache entry.
+
+        Args:
+            url (str): Url of the artifact.
+            filename (str, optional): File name to store the artifact as. Defaults to the last part of the url.
+            verify (bool, optional): Verify ssl. Defaults to True.
+            offline (bool, optional): Skip the network and only use the cache. Defaults to False.
+            on_progress (ProgressCallback, optional): Called as the artifact is downloaded.
+            mirrors (Iterable[str], optional): Urls to download from in order of preference. Defaults to ``url`` only.
+
+        Returns:
+            CacheResult: Fetch result.
+        """
+        entry_dir = self._get_entry_dir(url)
+        meta = self._read_meta(entry_dir)
+        cached = self._get_cached_file(entry_dir, meta)
+        if offline:
+            if cached:
+                return CacheResult(cached, CacheStatus.OFFLINE)
+            return CacheResult(None, CacheStatus.FAILED, "No internet connection and artifact is not cached")
+
+        headers: Dict[str, str] = {}
+        if cached:
+            if meta.get("etag"):
+                headers["If-None-Match"] = meta["etag"]
+            if meta.get("last_modified"):
+                headers["If-Modified-Since"] = meta["last_modified"]
+        err = ""
+        for src_url in dict.fromkeys(mirrors or [url]):
+            try:
+                response = request_with_retry(
+                    self._pool,
+                    src_url,
+                    self._retry,
+                    headers=headers,
+                    verify=verify,
+                    timeout=self._timeout,
+                    on_progress=on_progress,
+                )
+            except (URLError, OSError) as e:
+                err = str(getattr(e, "reason", e))
+                continue
+            if response.status == 304 and cached:
+                return CacheResult(cached, CacheStatus.NOT_MODIFIED)
+            if response.status >= 300:
+                err = f"HTTP Error {response.status}: {response.reason}"
+                continue
+
+            name = filename or self._get_url_file_name(url)
+            self._store(entry_dir, name, response.data, response.headers, url)
+            return CacheResult(entry_dir / name, CacheStatus.DOWNLOADED)
+        return self._fallback(cached, err)
+
+    def get_cached(self, url: str) -> Path | None:
+        """
+        Gets the cached file for a url without any network access.
+
+        Args:
+            url (str): Url of the artifact.
+
+        Returns:
+            Path | None: Path to the cached file or ``None`` if not cached.
+        """
+        entry_dir = self._get_entry_dir(url)
+        return self._get_cached_file(entry_dir, self._read_meta(entry_dir))
+
+    def remove(self, url: str) -> None:
+        """Removes the cached artifact for a url."""
+        entry_dir = self._get_entry_dir(url)
+        if entry_dir.exists():
+            shutil.rmtree(entry_dir, ignore_errors=True)
+
+    def clear(self) -> None:
+        """Removes all cached artifacts."""
+        if self._cache_dir.exists():
+            shutil.rmtree(self._cache_dir, ignore_errors=True)
+
+    def _fallback(self, cached: Path | None, err: str) -> CacheResult:
+        if cached:
+            return CacheResult(cached, CacheStatus.OFFLINE, err)
+        return CacheResult(None, CacheStatus.FAILED, err)
+
+    def _get_entry_dir(self, url: str) -> Path:
+        key = hashlib.sha256(url.encode("utf-8")).hexdigest()[:24]
+        return self._cache_dir / key
+
+    def _get_url_file_name(self, url: str) -> str:
+        name = Path(urlparse(url).path).name
+        return name or "artifact"
+
+    def _get_cached_file(self, entry_dir: Path, meta: Dict[str, Any]) -> Path | None:
+        name = meta.get("file", "")
+        if not name:
+            return None
+        pth = entry_dir / name
+        return pth if pth.is_file() else None
+
+    def _read_meta(self, entry_dir: Path) -> Dict[str, Any]:
+        meta_file = entry_dir / self.META_FILE
+        if not meta_file.exists():
+            return {}
+        try:
+            with open(meta_file, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _store(self, entry_dir: Path, name: str, data: bytes, headers: Dict[str, str], url: str) -> None:
+        entry_dir.mkdir(parents=True, exist_ok=True)
+        write_atomic(entry_dir / name, data)
+        # header names are case insensitive
+        lower_headers = {k.lower(): v for k, v in headers.items()}
+        meta = {
+            "url": url,
+            "file": name,
+            "etag": lower_headers.get("etag", ""),
+            "last_modified": lower_headers.get("last-modified", ""),
+        }
+        write_atomic(entry_dir / self.META_FILE, json.dumps(meta, indent=2).encode("utf-8"))
+
+    # endregion Methods
+
+    # region Properties
+    @property
+    def cache_dir(self) -> Path:
+        """Gets the cache directory."""
+        return self._cache_dir
+
+    # endregion Properties
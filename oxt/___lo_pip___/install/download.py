@@ -1,22 +1,27 @@
 from __future__ import annotations
-from typing import Any, Dict, Tuple
-import ssl
+from typing import Any, Callable, Dict, Iterable, List, Tuple
 import json
 from pathlib import Path
-from urllib.request import Request, urlopen
-from urllib.error import URLError, HTTPError
+from urllib.error import URLError
 
 
 from ..meta.singleton import Singleton
-from ..oxt_logger import OxtLogger
+from ..oxt_logger import get_logger
 from ..config import Config
+from ..input_output import file_util
+from .artifact_cache import ArtifactCache, CacheResult, CacheStatus
+from .http_pool import HttpPool
+from .mirrors import MirrorRanker, RetryPolicy, request_with_retry
+from .multi_download import DownloadItem, DownloadTask, MultiDownload
 
 
 class Download(metaclass=Singleton):
     """Singleton class. Download file from url"""
 
     def __init__(self) -> None:
-        self._logger = OxtLogger(log_name=__name__)
+        self._logger = get_logger(log_name=__name__)
+        # persistent connections shared by the connection test and all downloads
+        self._pool = HttpPool()
 
     def url_open(
         self,
@@ -48,27 +53,27 @@ class Download(metaclass=Singleton):
 
         result = None
         err = ""
-        req = Request(url)
-        for k, v in headers.items():
-            req.add_header(k, v)
+        if data is not None and isinstance(data, str):
+            data = data.encode()
         try:
-            # ~ debug(url)
-            if verify:
-                if data is not None and isinstance(data, str):
-                    data = data.encode()
-                response = urlopen(req, data=data)
-            else:
-                context = ssl._create_unverified_context()
-                response = urlopen(req, context=context)
-        except HTTPError as e:
-            self._logger.error(e)
-            err = str(e)
+            response = request_with_retry(
+                self._pool,
+                url,
+                self.retry_policy,
+                method="GET" if data is None else "POST",
+                headers=headers,
+                data=data,
+                verify=verify,
+            )
         except URLError as e:
             self._logger.error(e.reason)
-            err = str(e.reason)
+            return result, {}, str(e.reason)
+        headers = response.headers
+        if response.status >= 400:
+            err = f"HTTP Error {response.status}: {response.reason}"
+            self._logger.error(err)
         else:
-            headers = dict(response.info())
-            result = response.read()
+            result = response.data
             if get_json:
                 result = json.loads(result)
 
@@ -89,6 +94,127 @@ class Download(metaclass=Singleton):
             pth = Path(pth)
         return bool(pth.write_bytes(data))
 
+    def fetch_cached(
+        self, url: str, filename: str = "", verify: bool = True, mirrors: Iterable[str] = ()
+    ) -> CacheResult:
+        """
+        Gets a file from url using the artifact cache.
+
+        The file is only downloaded when it is not cached or the server reports that it has changed.
+        When there is no internet connection the cached file is used if it exist.
+
+        When mirrors are given the url and its mirrors are ranked by latency and tried from fastest to slowest.
+
+        Args:
+            url (str): Url to download
+            filename (str, optional): File name to save as. Defaults to the last part of the url.
+            verify (bool, optional): Verify ssl. Defaults to True.
+            mirrors (Iterable[str], optional): Urls of the same file on other servers.
+
+        Returns:
+            CacheResult: Result. ``CacheResult.path`` is ``None`` if the file is not available.
+        """
+        mirror_lst = list(mirrors)
+        sources = self.rank_mirrors([url, *mirror_lst], verify=verify) if mirror_lst else []
+        result = self.artifact_cache.fetch(
+            url, filename=filename, verify=verify, offline=not self.is_internet, mirrors=sources
+        )
+        self._log_fetch_result(url, result)
+        return result
+
+    def fetch_many(self, items: Iterable[DownloadItem], max_workers: int = 4) -> List[CacheResult]:
+        """
+        Gets several files using the artifact cache, downloading them at the same time.
+
+        Each file is fetched as ``fetch_cached()`` would, the mirrors of an item are ranked first.
+        The method waits for all the files.
+
+        Args:
+            items (Iterable[DownloadItem]): Items to get.
+            max_workers (int, optional): Maximum number of concurrent downloads. Defaults to ``4``.
+
+        Returns:
+            List[CacheResult]: One result per item in the same order as ``items``.
+            ``CacheResult.path`` is ``None`` for a file that is not available.
+        """
+        ranked: List[DownloadItem] = []
+        for itm in items:
+            if itm.mirrors:
+                itm = itm._replace(mirrors=tuple(self.rank_mirrors([itm.url, *itm.mirrors], verify=itm.verify)))
+            ranked.append(itm)
+        results: List[CacheResult] = []
+        for task in self.download_many(ranked, max_workers=max_workers):
+            try:
+                result = task.future.result()
+            except Exception as err:
+                result = CacheResult(None, CacheStatus.FAILED, str(err))
+            self._log_fetch_result(task.item.url, result)
+            results.append(result)
+        return results
+
+    def _log_fetch_result(self, url: str, result: CacheResult) -> None:
+        if result.status == CacheStatus.DOWNLOADED:
+            self._logger.debug(f"Downloaded into cache: {url}")
+        elif result.status == CacheStatus.NOT_MODIFIED:
+            self._logger.debug(f"Cache is current, not downloaded: {url}")
+        elif result.status == CacheStatus.OFFLINE:
+            self._logger.info(f"Unable to reach server, using cached file: {result.path}")
+        else:
+            self._logger.error(f"Unable to download {url}: {result.err}")
+
+    def download_many(
+        self,
+        items: Iterable[DownloadItem | str],
+        max_workers: int = 4,
+        on_progress: Callable[[DownloadTask], None] | None = None,
+    ) -> List[DownloadTask]:
+        """
+        Downloads several files into the artifact cache at the same time.
+
+        The method does not wait for the downloads to finish.
+        Each returned task has a future that resolves to a ``CacheResult`` and the progress for that item.
+        An error in one download does not affect the others.
+
+        Args:
+            items (Iterable[DownloadItem | str]): Items or urls to download.
+            max_workers (int, optional): Maximum number of concurrent downloads. Defaults to ``4``.
+            on_progress (Callable[[DownloadTask], None], optional): Called from the worker thread as an item progresses.
+
+        Returns:
+            List[DownloadTask]: One task per item in the same order as ``items``.
+
+        Example:
+            .. code-block:: python
+
+                tasks = Download().download_many([cfg.url_pip, cfg.pip_wheel_url])
+                for task in tasks:
+                    result = task.future.result()
+        """
+        downloader = MultiDownload(self.artifact_cache, max_workers=max_workers)
+        tasks = downloader.start(items, offline=not self.is_internet, on_progress=on_progress)
+        self._logger.debug(f"Started {len(tasks)} downloads")
+        return tasks
+
+    def rank_mirrors(self, urls: Iterable[str], verify: bool = True) -> List[str]:
+        """
+        Orders equivalent urls from fastest to slowest.
+
+        The ranking is measured once and reused across sessions until it expires.
+
+        Args:
+            urls (Iterable[str]): Urls such as a primary url followed by its mirrors.
+            verify (bool, optional): Verify ssl. Defaults to True.
+
+        Returns:
+            List[str]: Ranked urls. The urls are returned unchanged when there is no internet connection.
+        """
+        lst = list(dict.fromkeys(url for url in urls if url))
+        if len(lst) < 2 or not self.is_internet:
+            return lst
+        ranked = self.mirror_ranker.rank(lst, verify=verify)
+        self._logger.debug(f"Ranked mirrors: {ranked}")
+        return ranked
+
     def check_internet_connection(self, url: str = "") -> bool:
         """
         Gets if there is an internet connection.
@@ -107,16 +233,46 @@ class Download(metaclass=Singleton):
                 url = Config().test_internet_url
             if not url:
                 return False
-            if url.startswith("https"):
-                # do not verify sss
-                context = ssl._create_unverified_context()
-                _ = urlopen(url=url, timeout=5.0, context=context)
-            else:
-                _ = urlopen(url=url, timeout=5.0)
-            return True
+            # do not verify ssl. The connection is kept open for the downloads that follow.
+            response = self._pool.request(url, verify=False, timeout=5.0)
+            return response.status < 400
         except URLError:
             return False
 
+    @property
+    def artifact_cache(self) -> ArtifactCache:
+        """Gets the artifact cache that is stored in the user profile."""
+        try:
+            return self._artifact_cache
+        except AttributeError:
+            cache_dir = Path(file_util.get_user_profile_path(True), "lo_pip_cache", Config().lo_identifier)
+            self._artifact_cache = ArtifactCache(cache_dir, pool=self._pool, retry=self.retry_policy)
+            return self._artifact_cache
+
+    @property
+    def mirror_ranker(self) -> MirrorRanker:
+        """Gets the mirror ranker. The ranking is stored with the artifact cache."""
+        try:
+            return self._mirror_ranker
+        except AttributeError:
+            self._mirror_ranker = MirrorRanker(self._pool, cache_file=self.artifact_cache.cache_dir / "mirrors.json")
+            return self._mirror_ranker
+
+    @property
+    def retry_policy(self) -> RetryPolicy:
+        """Gets the retry settings for downloads."""
+        try:
+            return self._retry_policy
+        except AttributeError:
+            cfg = Config()
+            self._retry_policy = RetryPolicy(retries=cfg.download_retries, backoff=cfg.download_backoff)
+            return self._retry_policy
+
+    @property
+    def pool(self) -> HttpPool:
+        """Gets the connection pool used for all requests."""
+        return self._pool
+
     @property
     def is_internet(self) -> bool:
         """Gets if there is an internet connection."""
@@ -0,0 +1,306 @@
+"""
+Pooled HTTP client used by ``Download``.
+
+Connections are kept open per host and reused for following requests so that the connection test and the
+downloads that follow do not each pay for a new TCP connection and TLS handshake.
+Idle connections are closed after ``max_idle`` seconds.
+
+When a proxy is configured for a url, ``urllib`` is used instead so the proxy settings are honored.
+"""
+from __future__ import annotations
+from typing import Callable, Dict, List, NamedTuple, Tuple
+from urllib.parse import urljoin, urlsplit
+from urllib.request import Request, getproxies, proxy_bypass, urlopen
+from urllib.error import HTTPError, URLError
+import http.client
+import socket
+import ssl
+import threading
+import time
+
+ProgressCallback = Callable[[int, int], None]
+"""Progress callback. Called with bytes read so far and total bytes (``-1`` if unknown)."""
+
+_REDIRECT_CODES = {301, 302, 303, 307, 308}
+_CHUNK_SIZE = 64 * 1024
+_RETRY_METHODS = {"GET", "HEAD"}
+"""Methods that are sent again when a reused connection was closed by the server, they are idempotent."""
+
+# key is (scheme, host, port, verify)
+_PoolKey = Tuple[str, str, int, bool]
+
+
+class HttpResponse(NamedTuple):
+    """Response of a pooled request."""
+
+    status: int
+    """Http status code."""
+    reason: str
+    """Http reason phrase."""
+    headers: Dict[str, str]
+    """Response headers."""
+    data: bytes
+    """Response body."""
+    url: str
+    """Final url after any redirects."""
+
+
+class HttpPool:
+    """Thread safe pool of persistent ``http.client`` connections."""
+
+    def __init__(self, max_idle: float = 30.0, max_per_host: int = 4, timeout: float = 30.0) -> None:
+        """
+        Constructor
+
+        Args:
+            max_idle (float, optional): Seconds an idle connection is kept open. Defaults to ``30.0``.
+            max_per_host (int, optional): Maximum number of idle connections kept per host. Defaults to ``4``.
+            timeout (float, optional): Default socket timeout in seconds. Defaults to ``30.0``.
+        """
+        self._max_idle = max_idle
+        self._max_per_host = max_per_host
+        self._timeout = timeout
+        self._lock = threading.Lock()
+        self._idle: Dict[_PoolKey, List[Tuple[http.client.HTTPConnection, float]]] = {}
+        self._ssl_verified: ssl.SSLContext | None = None
+        self._ssl_unverified: ssl.SSLContext | None = None
+        self._created_count = 0
+        self._reused_count = 0
+
+    # region Methods
+    def request(
+        self,
+        url: str,
+        method: str = "GET",
+        headers: Dict[str, str] | None = None,
+        data: bytes | None = None,
+        verify: bool = True,
+        timeout: float | None = None,
+        max_redirects: int = 5,
+        on_progress: ProgressCallback | None = None,
+    ) -> HttpResponse:
+        """
+        Sends a request and reads the whole response.
+
+        Http error statuses do not raise, check ``HttpResponse.status``.
+
+        Args:
+            url (str): Url.
+            method (str, optional): Http method. Defaults to ``GET``.
+            headers (Dict[str, str], optional): Request headers.
+            data (bytes, optional): Request body.
+            verify (bool, optional): Verify ssl. Defaults to True.
+            timeout (float, optional): Socket timeout in seconds. Defaults to the pool timeout.
+            max_redirects (int, optional): Maximum redirects to follow. Defaults to ``5``.
+            on_progress (ProgressCallback, optional): Called as the response body is read.
+
+        Raises:
+            URLError: If the server can not be reached.
+
+        Returns:
+            HttpResponse: Response.
+        """
+        if timeout is None:
+            timeout = self._timeout
+        hdrs = dict(headers) if headers else {}
+        for _ in range(max_redirects + 1):
+            if self._get_proxy(url):
+                return self._urllib_request(url, method, hdrs, data, verify, timeout, on_progress)
+            response = self._pooled_request(url, method, hdrs, data, verify, timeout, on_progress)
+            location = response.headers.get("Location", response.headers.get("location", ""))
+            if response.status not in _REDIRECT_CODES or not location:
+                return response
+            url = urljoin(url, location)
+            if response.status == 303:
+                method = "GET"
+                data = None
+        raise URLError(f"Too many redirects: {url}")
+
+    def close(self) -> None:
+        """Closes all idle connections."""
+        with self._lock:
+            idle = self._idle
+            self._idle = {}
+        for conns in idle.values():
+            for conn, _ in conns:
+                conn.close()
+
+    def evict_idle(self) -> int:
+        """
+        Closes connections that have been idle longer than ``max_idle``.
+
+        Returns:
+            int: Number of connections closed.
+        """
+        now = time.monotonic()
+        expired: List[http.client.HTTPConnection] = []
+        with self._lock:
+            for key in list(self._idle.keys()):
+                keep = []
+                for conn, last_used in self._idle[key]:
+                    if now - last_used > self._max_idle:
+                        expired.append(conn)
+                    else:
+                        keep.append((conn, last_used))
+                if keep:
+                    self._idle[key] = keep
+                else:
+                    del self._idle[key]
+        for conn in expired:
+            conn.close()
+        return len(expired)
+
+    def _get_proxy(self, url: str) -> str:
+        parts = urlsplit(url)
+        proxy = getproxies().get(parts.scheme, "")
+        if proxy and parts.hostname and proxy_bypass(parts.hostname):
+            return ""
+        return proxy
+
+    def _get_ssl_context(self, verify: bool) -> ssl.SSLContext:
+        # one context per verify mode is shared by all connections so certificates are only loaded once.
+        with self._lock:
+            if verify:
+                if self._ssl_verified is None:
+                    self._ssl_verified = ssl.create_default_context()
+                return self._ssl_verified
+            if self._ssl_unverified is None:
+                self._ssl_unverified = ssl._create_unverified_context()
+            return self._ssl_unverified
+
+    def _checkout(self, key: _PoolKey, timeout: float) -> Tuple[http.client.HTTPConnection, bool]:
+        self.evict_idle()
+        with self._lock:
+            conns = self._idle.get(key)
+            if conns:
+                conn, _ = conns.pop()
+                self._reused_count += 1
+                conn.timeout = timeout
+                if conn.sock is not None:
+                    conn.sock.settimeout(timeout)
+                return conn, True
+            self._created_count += 1
+        scheme, host, port, verify = key
+        if scheme == "https":
+            conn = http.client.HTTPSConnection(host, port, timeout=timeout, context=self._get_ssl_context(verify))
+        else:
+            conn = http.client.HTTPConnection(host, port, timeout=timeout)
+        return conn, False
+
+    def _checkin(self, key: _PoolKey, conn: http.client.HTTPConnection) -> None:
+        with self._lock:
+            conns = self._idle.setdefault(key, [])
+            if len(conns) < self._max_per_host:
+                conns.append((conn, time.monotonic()))
+                return
+        conn.close()
+
+    def _pooled_request(
+        self,
+        url: str,
+        method: str,
+        headers: Dict[str, str],
+        data: bytes | None,
+        verify: bool,
+        timeout: float,
+        on_progress: ProgressCallback | None,
+    ) -> HttpResponse:
+        parts = urlsplit(url)
+        if parts.scheme not in ("http", "https") or not parts.hostname:
+            raise URLError(f"Unsupported url: {url}")
+        port = parts.port or (443 if parts.scheme == "https" else 80)
+        key: _PoolKey = (parts.scheme, parts.hostname, port, verify if parts.scheme == "https" else True)
+        path = parts.path or "/"
+        if parts.query:
+            path = f"{path}?{parts.query}"
+
+        while True:
+            conn, reused = self._checkout(key, timeout)
+            try:
+                conn.request(method, path, body=data, headers=headers)
+                resp = conn.getresponse()
+                body = self._read_body(resp, method, on_progress)
+            except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError) as e:
+                conn.close()
+                if reused and method in _RETRY_METHODS:
+                    # server closed an idle keep-alive connection, try again on a new connection.
+                    # other methods are not sent twice, the server may have acted on the first request.
+                    continue
+                raise URLError(e) from e
+            except (OSError, http.client.HTTPException) as e:
+                conn.close()
+                if isinstance(e, socket.timeout):
+                    raise URLError("timed out") from e
+                raise URLError(e) from e
+            except BaseException:
+                # such as an error raised by on_progress, the response is only partly read so the
+                # connection can not be reused.
+                conn.close()
+                raise
+            break
+
+        if resp.will_close:
+            conn.close()
+        else:
+            self._checkin(key, conn)
+        return HttpResponse(resp.status, resp.reason, dict(resp.getheaders()), body, url)
+
+    def _read_body(self, resp: http.client.HTTPResponse, method: str, on_progress: ProgressCallback | None) -> bytes:
+        if method == "HEAD":
+            resp.read()
+            return b""
+        if on_progress is None:
+            return resp.read()
+        total = int(resp.getheader("Content-Length", "-1") or -1)
+        chunks: List[bytes] = []
+        read = 0
+        on_progress(read, total)
+        while True:
+            chunk = resp.read(_CHUNK_SIZE)
+            if not chunk:
+                break
+            chunks.append(chunk)
+            read += len(chunk)
+            on_progress(read, total)
+        return b"".join(chunks)
+
+    def _urllib_request(
+        self,
+        url: str,
+        method: str,
+        headers: Dict[str, str],
+        data: bytes | None,
+        verify: bool,
+        timeout: float,
+        on_progress: ProgressCallback | None,
+    ) -> HttpResponse:
+        req = Request(url, data=data, headers=headers, method=method)
+        context = None if verify or not url.startswith("https") else self._get_ssl_context(False)
+        try:
+            response = urlopen(req, timeout=timeout, context=context)
+        except HTTPError as e:
+            return HttpResponse(e.code, str(e.reason), dict(e.headers or {}), b"", url)
+        with response:
+            body = self._read_body(response, method, on_progress)
+            return HttpResponse(response.status, response.reason, dict(response.info()), body, response.geturl())
+
+    # endregion Methods
+
+    # region Properties
+    @property
+    def created_count(self) -> int:
+        """Gets the number of connections that have been opened."""
+        return self._created_count
+
+    @property
+    def reused_count(self) -> int:
+        """Gets the number of requests that reused an open connection."""
+        return self._reused_count
+
+    @property
+    def idle_count(self) -> int:
+        """Gets the number of idle connections."""
+        with self._lock:
+            return sum(len(conns) for conns in self._idle.values())
+
+    # endregion Properties
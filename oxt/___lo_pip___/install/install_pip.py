@@ -5,7 +5,7 @@ import subprocess
 from typing import Any, Dict
 
 from ..config import Config
-from ..oxt_logger import OxtLogger
+from ..oxt_logger import get_logger
 from .download import Download
 
 from .pip_installers.base_installer import STARTUP_INFO
@@ -17,7 +17,7 @@ class InstallPip:
     def __init__(self, ctx: Any) -> None:
         self.ctx = ctx
         self._config = Config()
-        self._logger = OxtLogger(log_name=__name__)
+        self._logger = get_logger(log_name=__name__)
         self._download = Download()
 
     def install_pip(self) -> None:
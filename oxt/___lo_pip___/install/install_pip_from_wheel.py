@@ -1,11 +1,10 @@
 from __future__ import annotations
 from typing import Any
-import tempfile
 from pathlib import Path
 
 from ..config import Config
 from .download import Download
-from ..oxt_logger import OxtLogger
+from ..oxt_logger import get_logger
 from ..input_output import file_util
 from .install_pkg import InstallPkg
 
@@ -16,9 +15,9 @@ class InstallPipFromWheel:
     def __init__(self, ctx: Any) -> None:
         self.ctx = ctx
         self._config = Config()
-        self._logger = OxtLogger(log_name=__name__)
+        self._logger = get_logger(log_name=__name__)
 
-    def install(self, dst: str | Path = "") -> None:
+    def install(self, dst: str | Path = "", wheel_file: Path | None = None) -> None:
         """
         Install pip from wheel file.
 
@@ -26,6 +25,7 @@ class InstallPipFromWheel:
 
         Args:
             dst (str | Path, Optional): The destination directory where the pip wheel file will be installed. If not provided, the ``pythonpath`` location will be used.
+            wheel_file (Path, Optional): Pip wheel file that is already downloaded. If not provided, the wheel is fetched.
 
         Returns:
             None:
@@ -34,43 +34,45 @@ class InstallPipFromWheel:
             None:
         """
         url = self._config.pip_wheel_url
-        if not url:
+        if not url and wheel_file is None:
             self._logger.error("PIP installation has failed - No wheel url")
             return
 
         if not self.is_internet:
-            self._logger.error("No internet connection!")
-            return
+            self._logger.warning("No internet connection, attempting to use cached PIP wheel file")
 
         if not dst:
             root_pth = Path(file_util.get_package_location(self._config.lo_identifier))
             dst = root_pth / "pythonpath"
 
-        with tempfile.TemporaryDirectory() as temp_dir:
-            # temp_dir = tempfile.gettempdir()
-            path_pip = Path(temp_dir)
+        if wheel_file is None:
+            dl = Download()
+            # the wheel is kept in the artifact cache so a retry does not download it again.
+            cache_result = dl.fetch_cached(
+                url, filename="pip-wheel.whl", verify=False, mirrors=self._config.pip_wheel_url_mirrors
+            )
+            filename = cache_result.path
+        else:
+            filename = wheel_file
+        if filename is None:
+            self._logger.error("Unable to download PIP installation wheel file")
+            return
 
-            filename = path_pip / "pip-wheel.whl"
+        if filename.exists():
+            self._logger.info("PIP wheel file has been saved")
+        else:
+            self._logger.error("PIP wheel file has not been saved")
+            return
 
-            dl = Download()
-            data, _, err = dl.url_open(url, verify=False)
-            if err:
-                self._logger.error("Unable to download PIP installation wheel file")
-                return
-            dl.save_binary(pth=filename, data=data)
-
-            if filename.exists():
-                self._logger.info("PIP wheel file has been saved")
-            else:
-                self._logger.error("PIP wheel file has not been saved")
-                return
-
-            try:
-                self._unzip_wheel(filename=filename, dst=dst)
-            except Exception:
-                return
-            # now that pip has been installed from wheel force a reinstall to ensure it is the latest version
-            self._force_install_pip()
+        try:
+            self._unzip_wheel(filename=filename, dst=dst)
+        except Exception:
+            return
+        if not self.is_internet:
+            self._logger.info("No internet connection, skipping PIP reinstall")
+            return
+        # now that pip has been installed from wheel force a reinstall to ensure it is the latest version
+        self._force_install_pip()
 
     def _unzip_wheel(self, filename: Path, dst: str | Path) -> None:
         """Unzip the downloaded wheel file"""
@@ -2,13 +2,13 @@ from __future__ import annotations
 import os
 
 import subprocess
-from typing import Any, Dict
+from typing import Any, Dict, Set
 from pathlib import Path
 from importlib.metadata import PackageNotFoundError, version
 
 from ..config import Config
 from ..ver.rules.ver_rules import VerRules
-from ..oxt_logger import OxtLogger
+from ..oxt_logger import get_logger
 
 
 # https://docs.python.org/3.8/library/importlib.metadata.html#module-importlib.metadata
@@ -31,8 +31,9 @@ class InstallPkg:
         self._config = Config()
         self.path_python = Path(self._config.python_path)
         self.ver_rules = VerRules()
-        self._logger = OxtLogger(log_name=__name__)
+        self._logger = get_logger(log_name=__name__)
         self._flag_upgrade = flag_upgrade
+        self._installed_packages: Set[str] = set()
 
     def install(self, req: Dict[str, str] | None = None, force: bool = False) -> bool:
         """
@@ -80,25 +81,37 @@ class InstallPkg:
         from .pkg_installers.install_pkg import InstallPkg
 
         installer = InstallPkg(ctx=self.ctx, flag_upgrade=self._flag_upgrade)
-        return installer.install(req=req, force=force)
+        try:
+            return installer.install(req=req, force=force)
+        finally:
+            self._installed_packages.update(installer.installed_packages)
 
     def _install_default_file(self, pth: str | Path, force: bool = False) -> bool:
         from .pkg_installers.install_pkg import InstallPkg
 
         installer = InstallPkg(ctx=self.ctx, flag_upgrade=self._flag_upgrade)
-        return installer.install_file(pth=pth, force=force)
+        try:
+            return installer.install_file(pth=pth, force=force)
+        finally:
+            self._installed_packages.update(installer.installed_packages)
 
     def _install_flatpak(self, req: Dict[str, str] | None, force: bool) -> bool:
         from .pkg_installers.install_pkg_flatpak import InstallPkgFlatpak
 
         installer = InstallPkgFlatpak(ctx=self.ctx, flag_upgrade=self._flag_upgrade)
-        return installer.install(req=req, force=force)
+        try:
+            return installer.install(req=req, force=force)
+        finally:
+            self._installed_packages.update(installer.installed_packages)
 
     def _install_flatpak_file(self, pth: str | Path, force: bool = False) -> bool:
         from .pkg_installers.install_pkg_flatpak import InstallPkgFlatpak
 
         installer = InstallPkgFlatpak(ctx=self.ctx, flag_upgrade=self._flag_upgrade)
-        return installer.install_file(pth=pth, force=force)
+        try:
+            return installer.install_file(pth=pth, force=force)
+        finally:
+            self._installed_packages.update(installer.installed_packages)
 
     def get_package_version(self, package_name: str) -> str:
         """
@@ -114,3 +127,10 @@ class InstallPkg:
             return version(package_name)
         except PackageNotFoundError:
             return ""
+
+    @property
+    def installed_packages(self) -> Set[str]:
+        """
+        Gets the normalized names of the distributions installed by this instance, including dependencies pulled in by pip.
+        """
+        return set(self._installed_packages)
@@ -1,11 +1,11 @@
 """Install any local packages that are not already installed."""
 from __future__ import annotations
-from pathlib import Path
-from typing import Any, List
+from typing import Any, List, Set
 
 from .install_pkg import InstallPkg
+from .local_wheels import LocalPackage, get_local_packages
 from ..config import Config
-from ..oxt_logger import OxtLogger
+from ..oxt_logger import get_logger
 from ..settings.pip_settings import PipSettings
 
 
@@ -15,21 +15,20 @@ class InstallPkgLocal:
     def __init__(self, ctx: Any) -> None:
         self.ctx = ctx
         self._config = Config()
-        self._logger = OxtLogger(log_name=__name__)
+        self._logger = get_logger(log_name=__name__)
+        self._installed_packages: Set[str] = set()
 
-    def _get_local_packages(self) -> List[Path]:
+    def _get_local_packages(self) -> List[LocalPackage]:
         """Get a list of local packages to install."""
+        return get_local_packages(self._config.package_location / "local")
 
-        local_pth = self._config.package_location / "local"
-        if not local_pth.exists():
-            return []
-        result: List[Path] = []
-        for pkg in local_pth.iterdir():
-            if pkg.is_file():
-                lower_name = pkg.name.lower()
-                if lower_name.endswith(".whl") or lower_name.endswith(".tar.gz"):
-                    result.append(pkg)
-        return result
+    def _install_local(self, installer: InstallPkg, pkg: LocalPackage) -> bool:
+        """Installs the first file of a local package that installs, such as the wheel built from a source distribution."""
+        for file in pkg.files:
+            if installer.install_file(pth=file, force=False):
+                return True
+            self._logger.debug("Unable to install %s for local package %s", file.name, pkg.name)
+        return False
 
     def install(self) -> bool:
         """
@@ -55,7 +54,8 @@ class InstallPkgLocal:
             if pkg.name in pi.installed_local_pips:
                 self._logger.info(f"Local package {pkg.name} is already installed.")
                 continue
-            result = installer.install_file(pth=pkg, force=False)
+            result = self._install_local(installer, pkg)
+            self._installed_packages.update(installer.installed_packages)
             if result:
                 pi.append_installed_local_pip(pkg.name)
                 installed_count += 1
@@ -73,3 +73,10 @@ class InstallPkgLocal:
         else:
             self._logger.error("Failed to install all local packages.")
         return success
+
+    @property
+    def installed_packages(self) -> Set[str]:
+        """
+        Gets the normalized names of the distributions installed by this instance, including dependencies pulled in by pip.
+        """
+        return set(self._installed_packages)
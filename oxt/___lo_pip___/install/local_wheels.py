@@ -0,0 +1,90 @@
+"""
+Local packages shipped in the ``local`` folder of the extension.
+
+At build time each local source distribution (``.tar.gz``) is converted into a wheel and the mapping from the
+source distribution to the wheel is written to ``LOCAL_WHEELS_FILE``. Installing the wheel only unpacks files,
+installing the source distribution runs a full build on every seat.
+A source distribution that converted to a platform specific wheel is kept as a fallback.
+"""
+from __future__ import annotations
+from typing import Dict, List, NamedTuple, Tuple
+from pathlib import Path
+import json
+
+LOCAL_WHEELS_FILE = "local_wheels.json"
+
+
+class LocalPackage(NamedTuple):
+    name: str
+    """File name recorded as installed. For a converted source distribution this is the source distribution name."""
+    files: Tuple[Path, ...]
+    """Files to install, tried in order until one installs."""
+
+
+def is_local_package_file(name: str) -> bool:
+    """Gets if a file name is a wheel or a source distribution."""
+    lower_name = name.lower()
+    return lower_name.endswith(".whl") or lower_name.endswith(".tar.gz")
+
+
+def read_local_wheels(local_path: Path) -> Dict[str, str]:
+    """
+    Reads the mapping of source distribution file names to wheel file names.
+
+    Args:
+        local_path (Path): Local packages folder.
+
+    Returns:
+        Dict[str, str]: Mapping. Empty if there is no mapping file or it can not be read.
+    """
+    try:
+        with open(local_path / LOCAL_WHEELS_FILE, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict):
+        return {}
+    return {str(k): str(v) for k, v in data.items()}
+
+
+def write_local_wheels(local_path: Path, mapping: Dict[str, str]) -> None:
+    """
+    Writes the mapping of source distribution file names to wheel file names.
+
+    Args:
+        local_path (Path): Local packages folder.
+        mapping (Dict[str, str]): Mapping.
+    """
+    with open(local_path / LOCAL_WHEELS_FILE, "w", encoding="utf-8") as f:
+        json.dump(mapping, f, indent=4, sort_keys=True)
+
+
+def get_local_packages(local_path: Path) -> List[LocalPackage]:
+    """
+    Gets the local packages to install.
+
+    A converted source distribution is one package that tries its wheel first and then,
+    if it was kept, the source distribution.
+
+    Args:
+        local_path (Path): Local packages folder.
+
+    Returns:
+        List[LocalPackage]: Packages sorted by name.
+    """
+    if not local_path.exists():
+        return []
+    mapping = read_local_wheels(local_path)
+    converted = set(mapping.values())
+    result: List[LocalPackage] = []
+    for sdist_name, wheel_name in mapping.items():
+        files = tuple(p for p in (local_path / wheel_name, local_path / sdist_name) if p.is_file())
+        if files:
+            result.append(LocalPackage(sdist_name, files))
+    for pkg in local_path.iterdir():
+        if pkg.name in mapping or pkg.name in converted:
+            continue
+        if pkg.is_file() and is_local_package_file(pkg.name):
+            result.append(LocalPackage(pkg.name, (pkg,)))
+    result.sort(key=lambda p: p.name)
+    return result
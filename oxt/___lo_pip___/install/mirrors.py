@@ -0,0 +1,191 @@
+"""
+Retries with exponential backoff and latency ranked mirror lists for downloads.
+
+``RetryPolicy`` describes how often and how long to wait before a request is sent again.
+``MirrorRanker`` orders a list of equivalent urls by measured latency so that the fastest mirror is tried first.
+The ranking is saved to a json file and reused until it expires, so latency is not measured on every start.
+"""
+from __future__ import annotations
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple
+from pathlib import Path
+from urllib.error import URLError
+import json
+import random
+import time
+
+from ..input_output.atomic_file import write_json_atomic
+from .http_pool import HttpPool, HttpResponse
+
+RETRY_STATUS = frozenset({408, 429, 500, 502, 503, 504})
+"""Http status codes that are worth retrying."""
+
+
+class RetryPolicy(NamedTuple):
+    """Retry settings for network requests."""
+
+    retries: int = 3
+    """Number of times a failed request is sent again. ``0`` disables retries."""
+    backoff: float = 0.5
+    """Delay in seconds before the first retry. Doubles for each following retry."""
+    max_backoff: float = 8.0
+    """Maximum delay in seconds between retries."""
+    jitter: float = 0.5
+    """Random fraction of the delay added or removed so that clients do not retry in step."""
+
+    def get_delay(self, attempt: int, rand: Callable[[], float] = random.random) -> float:
+        """
+        Gets the delay before a retry.
+
+        Args:
+            attempt (int): Zero based retry number.
+            rand (Callable[[], float], optional): Random source returning a value from ``0.0`` to ``1.0``.
+
+        Returns:
+            float: Delay in seconds.
+        """
+        delay = min(self.max_backoff, self.backoff * (2**attempt))
+        if self.jitter > 0:
+            delay += delay * self.jitter * (rand() * 2 - 1)
+        return max(0.0, delay)
+
+
+def request_with_retry(
+    pool: HttpPool,
+    url: str,
+    policy: RetryPolicy | None = None,
+    sleep: Callable[[float], None] = time.sleep,
+    **kwargs: Any,
+) -> HttpResponse:
+    """
+    Sends a request and retries on network errors and retryable http status codes.
+
+    Args:
+        pool (HttpPool): Pool used for the request.
+        url (str): Url.
+        policy (RetryPolicy, optional): Retry settings. Defaults to ``RetryPolicy()``.
+        sleep (Callable[[float], None], optional): Sleep function. Defaults to ``time.sleep``.
+        kwargs (Any): Passed to ``HttpPool.request()``.
+
+    Raises:
+        URLError: If the server can not be reached after all retries.
+
+    Returns:
+        HttpResponse: Last response. May have an error status if all retries failed.
+    """
+    if policy is None:
+        policy = RetryPolicy()
+    attempt = 0
+    while True:
+        try:
+            response = pool.request(url, **kwargs)
+            if response.status not in RETRY_STATUS or attempt >= policy.retries:
+                return response
+        except URLError:
+            if attempt >= policy.retries:
+                raise
+        sleep(policy.get_delay(attempt))
+        attempt += 1
+
+
+class MirrorRanker:
+    """Ranks mirrors by latency and caches the ranking in a json file."""
+
+    def __init__(
+        self,
+        pool: HttpPool,
+        cache_file: str | Path | None = None,
+        ttl: float = 86400.0,
+        timeout: float = 5.0,
+    ) -> None:
+        """
+        Constructor
+
+        Args:
+            pool (HttpPool): Pool used to measure latency.
+            cache_file (str | Path, optional): Json file the ranking is saved to. Defaults to no caching.
+            ttl (float, optional): Seconds a saved ranking is reused. Defaults to one day.
+            timeout (float, optional): Seconds to wait for a mirror to respond. Defaults to ``5.0``.
+        """
+        self._pool = pool
+        self._cache_file = None if cache_file is None else Path(cache_file)
+        self._ttl = ttl
+        self._timeout = timeout
+
+    # region Methods
+    def rank(self, urls: Iterable[str], refresh: bool = False, verify: bool = True) -> List[str]:
+        """
+        Orders urls from fastest to slowest. Mirrors that can not be reached are placed last in their original order.
+
+        Args:
+            urls (Iterable[str]): Equivalent urls such as a primary url followed by its mirrors.
+            refresh (bool, optional): Ignore a saved ranking and measure again. Defaults to False.
+            verify (bool, optional): Verify ssl. Defaults to True.
+
+        Returns:
+            List[str]: Ranked urls.
+        """
+        lst = list(dict.fromkeys(url for url in urls if url))
+        if len(lst) < 2:
+            return lst
+        key = "\n".join(sorted(lst))
+        cache = self._read_cache()
+        if not refresh:
+            entry = cache.get(key)
+            if entry and time.time() - float(entry.get("time", 0)) < self._ttl:
+                return list(entry["urls"])
+
+        latency = self.measure(lst, verify=verify)
+        # unreachable mirrors keep their configured order behind the reachable ones
+        ranked = sorted(lst, key=lambda url: (latency[url] < 0, latency[url] if latency[url] >= 0 else lst.index(url)))
+        cache[key] = {"urls": ranked, "latency": latency, "time": time.time()}
+        self._write_cache(cache)
+        return ranked
+
+    def measure(self, urls: List[str], verify: bool = True) -> Dict[str, float]:
+        """
+        Measures the latency of each url in parallel.
+
+        Args:
+            urls (List[str]): Urls.
+            verify (bool, optional): Verify ssl. Defaults to True.
+
+        Returns:
+            Dict[str, float]: Latency in seconds per url, ``-1.0`` if the url could not be reached.
+        """
+        with ThreadPoolExecutor(max_workers=min(8, len(urls)), thread_name_prefix="lo_pip_mirror") as executor:
+            results = list(executor.map(lambda url: self._measure_one(url, verify), urls))
+        return dict(zip(urls, results))
+
+    def clear(self) -> None:
+        """Removes the saved ranking."""
+        if self._cache_file is not None and self._cache_file.exists():
+            self._cache_file.unlink()
+
+    def _measure_one(self, url: str, verify: bool) -> float:
+        start = time.perf_counter()
+        try:
+            response = self._pool.request(url, method="HEAD", verify=verify, timeout=self._timeout)
+        except URLError:
+            return -1.0
+        if response.status >= 400:
+            return -1.0
+        return time.perf_counter() - start
+
+    def _read_cache(self) -> Dict[str, Any]:
+        if self._cache_file is None or not self._cache_file.exists():
+            return {}
+        try:
+            with open(self._cache_file, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            return data if isinstance(data, dict) else {}
+        except (OSError, ValueError):
+            return {}
+
+    def _write_cache(self, cache: Dict[str, Any]) -> None:
+        if self._cache_file is None:
+            return
+        # ranking is only an optimization, if it is not written it is measured again next time.
+        write_json_atomic(self._cache_file, cache)
+
+    # endregion Methods
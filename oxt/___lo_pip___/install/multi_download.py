@@ -0,0 +1,150 @@
+"""
+Downloads several artifacts at the same time using a bounded thread pool.
+
+Each artifact gets its own ``DownloadTask`` holding a future and the progress of that item.
+A failure only affects the future of the item that failed.
+"""
+from __future__ import annotations
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Iterable, List, NamedTuple, Tuple
+import threading
+
+from .artifact_cache import ArtifactCache, CacheResult
+
+
+class DownloadItem(NamedTuple):
+    """An artifact to download."""
+
+    url: str
+    """Url of the artifact."""
+    filename: str = ""
+    """File name to store the artifact as. Defaults to the last part of the url."""
+    verify: bool = True
+    """Verify ssl."""
+    mirrors: Tuple[str, ...] = ()
+    """Urls to download from in order of preference. Defaults to ``url`` only."""
+
+
+class DownloadTask:
+    """A queued download. Progress is updated from the worker thread."""
+
+    def __init__(self, item: DownloadItem) -> None:
+        self._item = item
+        self._lock = threading.Lock()
+        self._read = 0
+        self._total = -1
+        self._future: Future[CacheResult] = Future()
+
+    def _set_progress(self, read: int, total: int) -> None:
+        with self._lock:
+            self._read = read
+            self._total = total
+
+    # region Properties
+    @property
+    def item(self) -> DownloadItem:
+        """Gets the download item."""
+        return self._item
+
+    @property
+    def future(self) -> Future[CacheResult]:
+        """Gets the future that holds the ``CacheResult`` of the download."""
+        return self._future
+
+    @property
+    def read(self) -> int:
+        """Gets the number of bytes downloaded so far."""
+        with self._lock:
+            return self._read
+
+    @property
+    def total(self) -> int:
+        """Gets the total number of bytes or ``-1`` if not known."""
+        with self._lock:
+            return self._total
+
+    @property
+    def percent(self) -> float:
+        """Gets percent complete from ``0.0`` to ``100.0`` or ``-1.0`` if the total size is not known."""
+        with self._lock:
+            if self._total <= 0:
+                return 100.0 if self._future.done() else -1.0
+            return min(100.0, self._read * 100.0 / self._total)
+
+    @property
+    def done(self) -> bool:
+        """Gets if the download has finished, successful or not."""
+        return self._future.done()
+
+    # endregion Properties
+
+
+class MultiDownload:
+    """Downloads artifacts into an ``ArtifactCache`` concurrently."""
+
+    def __init__(self, cache: ArtifactCache, max_workers: int = 4) -> None:
+        """
+        Constructor
+
+        Args:
+            cache (ArtifactCache): Cache the artifacts are downloaded into.
+            max_workers (int, optional): Maximum number of concurrent downloads. Defaults to ``4``.
+        """
+        if max_workers < 1:
+            raise ValueError("max_workers must be greater than zero")
+        self._cache = cache
+        self._max_workers = max_workers
+
+    def start(
+        self,
+        items: Iterable[DownloadItem | str],
+        offline: bool = False,
+        on_progress: Callable[[DownloadTask], None] | None = None,
+    ) -> List[DownloadTask]:
+        """
+        Starts downloading the items and returns without waiting.
+
+        Args:
+            items (Iterable[DownloadItem | str]): Items or urls to download.
+            offline (bool, optional): Only use cached artifacts. Defaults to False.
+            on_progress (Callable[[DownloadTask], None], optional): Called from the worker thread as an item progresses.
+
+        Returns:
+            List[DownloadTask]: One task per item in the same order as ``items``.
+        """
+        tasks = [DownloadTask(DownloadItem(itm) if isinstance(itm, str) else itm) for itm in items]
+        if not tasks:
+            return tasks
+        executor = ThreadPoolExecutor(
+            max_workers=min(self._max_workers, len(tasks)), thread_name_prefix="lo_pip_download"
+        )
+        try:
+            for task in tasks:
+                executor.submit(self._run, task, offline, on_progress)
+        finally:
+            # workers exit once the queued downloads are done.
+            executor.shutdown(wait=False)
+        return tasks
+
+    def _run(self, task: DownloadTask, offline: bool, on_progress: Callable[[DownloadTask], None] | None) -> None:
+        if not task.future.set_running_or_notify_cancel():
+            return
+
+        def progress(read: int, total: int) -> None:
+            task._set_progress(read, total)
+            if on_progress is not None:
+                on_progress(task)
+
+        try:
+            result = self._cache.fetch(
+                task.item.url,
+                filename=task.item.filename,
+                verify=task.item.verify,
+                offline=offline,
+                on_progress=progress,
+                mirrors=task.item.mirrors,
+            )
+        except Exception as e:
+            task.future.set_exception(e)
+        else:
+            task.future.set_result(result)
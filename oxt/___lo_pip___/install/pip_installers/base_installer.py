@@ -9,7 +9,7 @@ from typing import Any, List, Dict
 
 
 from ...config import Config
-from ...oxt_logger import OxtLogger
+from ...oxt_logger import OxtLogger, get_logger
 from ..download import Download
 from ...lo_util.resource_resolver import ResourceResolver
 
@@ -38,7 +38,7 @@ class BaseInstaller:
         self._resource_resolver = ResourceResolver(ctx=self.ctx)
 
     def _get_logger(self) -> OxtLogger:
-        return OxtLogger(log_name=__name__)
+        return get_logger(log_name=__name__)
 
     @abstractmethod
     def install_pip(self) -> None:
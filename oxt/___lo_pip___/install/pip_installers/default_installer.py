@@ -1,11 +1,9 @@
 from __future__ import annotations
 
-import tempfile
-from pathlib import Path
-
 from ...config import Config
-from ...oxt_logger import OxtLogger
+from ...oxt_logger import OxtLogger, get_logger
 from ..download import Download
+from ..multi_download import DownloadItem
 
 from .base_installer import BaseInstaller
 from ..progress import Progress
@@ -15,12 +13,11 @@ class DefaultInstaller(BaseInstaller):
     """class for the PIP install."""
 
     def _get_logger(self) -> OxtLogger:
-        return OxtLogger(log_name=__name__)
+        return get_logger(log_name=__name__)
 
     def install_pip(self) -> None:
         if not self.is_internet:
-            self._logger.error("No internet connection")
-            return
+            self._logger.warning("No internet connection, attempting to use cached PIP installation file")
         pip_installed = False
         cfg = Config()
         progress: Progress | None = None
@@ -34,28 +31,28 @@ class DefaultInstaller(BaseInstaller):
             self._logger.debug("Progress Window is disabled")
 
         try:
-            with tempfile.TemporaryDirectory() as temp_dir:
-                # Do something with the temporary directory
-                # print(f"Temporary directory created at {temp_dir}")
-                path_pip = Path(temp_dir)
-
-                url = cfg.url_pip
-                filename = path_pip / "get-pip.py"
-                dl = Download()
-                data, _, err = dl.url_open(url, verify=False)
-                if err:
-                    self._logger.error("Unable to download PIP installation file")
-                    return
-                dl.save_binary(pth=filename, data=data)
-
-                if filename.exists():
-                    self._logger.info("PIP installation file has been saved")
-                else:
-                    self._logger.error("Unable to copy PIP installation file")
-                    return
-
+            dl = Download()
+            items = [
+                DownloadItem(cfg.url_pip, filename="get-pip.py", verify=False, mirrors=tuple(cfg.url_pip_mirrors))
+            ]
+            if cfg.pip_wheel_url:
+                # the wheel is used if PIP can not be installed with get-pip.py, it is downloaded at the same time.
+                items.append(
+                    DownloadItem(
+                        cfg.pip_wheel_url,
+                        filename="pip-wheel.whl",
+                        verify=False,
+                        mirrors=tuple(cfg.pip_wheel_url_mirrors),
+                    )
+                )
+            # the files are kept in the artifact cache so a retry does not download them again.
+            results = dl.fetch_many(items)
+            filename = results[0].path
+            if filename is None or not filename.exists():
+                self._logger.error("Unable to download PIP installation file")
+            else:
                 # PIP installation file has been saved
-
+                self._logger.info("PIP installation file has been saved")
                 try:
                     # "Starting PIP installation…"
                     if self._install_pip(filename=filename) and self.is_pip_installed():
@@ -65,6 +62,17 @@ class DefaultInstaller(BaseInstaller):
                 except Exception as err:
                     # "PIP installation has failed, see log"
                     self._logger.error(err)
+
+            wheel_file = results[1].path if len(results) > 1 else None
+            if wheel_file is not None and wheel_file.exists():
+                self._logger.info("Attempting to install PIP from wheel file")
+                from ..install_pip_from_wheel import InstallPipFromWheel
+
+                InstallPipFromWheel(ctx=self.ctx).install(wheel_file=wheel_file)
+                if self.is_pip_installed():
+                    self._logger.info("PIP was installed successfully from wheel file")
+                    pip_installed = True
+                    return
         finally:
             if progress:
                 self._logger.debug("Ending Progress Window")
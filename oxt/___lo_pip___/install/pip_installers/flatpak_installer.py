@@ -5,7 +5,7 @@ import subprocess
 from pathlib import Path
 
 from ...config import Config
-from ...oxt_logger import OxtLogger
+from ...oxt_logger import OxtLogger, get_logger
 from .base_installer import BaseInstaller
 from ..progress import Progress
 
@@ -14,15 +14,14 @@ class FlatpakInstaller(BaseInstaller):
     """Class for the Flatpak PIP install."""
 
     def _get_logger(self) -> OxtLogger:
-        return OxtLogger(log_name=__name__)
+        return get_logger(log_name=__name__)
 
     def install_pip(self) -> None:
         if self.is_pip_installed():
             self._logger.info("PIP is already installed")
             return
         if not self.is_internet:
-            self._logger.error("No internet connection")
-            return
+            self._logger.warning("No internet connection, attempting to use cached PIP wheel file")
         if self._install_wheel():
             if self.is_pip_installed():
                 self._logger.info("PIP was installed successfully")
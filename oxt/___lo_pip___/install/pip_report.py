@@ -0,0 +1,33 @@
+"""Reads the result of a ``pip install`` command."""
+from __future__ import annotations
+from typing import Set
+
+_SUCCESS_PREFIX = "Successfully installed "
+
+
+def normalize_name(name: str) -> str:
+    """Normalizes a distribution name so that ``Foo.Bar``, ``foo-bar`` and ``foo_bar`` are equal."""
+    return name.lower().replace("-", "_").replace(".", "_")
+
+
+def get_installed_from_output(output: str) -> Set[str]:
+    """
+    Gets the distributions installed by pip, including dependencies, from the pip output.
+
+    Args:
+        output (str): Standard output of ``pip install`` that contains a line such as
+            ``Successfully installed numpy-1.26.0 pandas-2.1.0``.
+
+    Returns:
+        Set[str]: Normalized distribution names such as ``{"numpy", "pandas"}``.
+    """
+    result: Set[str] = set()
+    for line in output.splitlines():
+        line = line.strip()
+        if not line.startswith(_SUCCESS_PREFIX):
+            continue
+        for item in line[len(_SUCCESS_PREFIX) :].split():
+            name = item.rsplit("-", 1)[0] if "-" in item else item
+            if name:
+                result.add(normalize_name(name))
+    return result
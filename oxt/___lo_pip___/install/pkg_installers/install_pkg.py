@@ -2,7 +2,8 @@ from __future__ import annotations
 import os
 import sys
 import subprocess
-from typing import Any, Dict, List, Tuple
+import time
+from typing import Any, Dict, List, Set, Tuple
 
 
 # import pkg_resources
@@ -12,9 +13,10 @@ from pathlib import Path
 from ...config import Config
 from ...lo_util.resource_resolver import ResourceResolver
 from ...lo_util.target_path import TargetPath
-from ...oxt_logger import OxtLogger
+from ...oxt_logger import OxtLogger, get_logger
 from ...ver.rules.ver_rules import VerRules, VerProto
 from ..download import Download
+from ..pip_report import get_installed_from_output
 from ..progress import Progress
 
 
@@ -55,9 +57,10 @@ class InstallPkg:
         self._show_progress = bool(kwargs.get("show_progress", self._config.show_progress))
         self._resource_resolver = ResourceResolver(ctx=self.ctx)
         self._target_path = TargetPath()
+        self._installed_packages: Set[str] = set()
 
     def _get_logger(self) -> OxtLogger:
-        return OxtLogger(log_name=__name__)
+        return get_logger(log_name=__name__)
 
     def get_package_version(self, package_name: str) -> str:
         """
@@ -122,8 +125,6 @@ class InstallPkg:
             cmd.append("--user")
 
         pkg_cmd = f"{pkg}{ver}" if ver else pkg
-        cmd = self._cmd_pip(*[*cmd, pkg_cmd])
-        self._logger.debug(f"Running command {cmd}")
         self._logger.info(f"Installing package {pkg}")
         if self._flag_upgrade:
             msg = f"Pip Install - Upgrading success for: {pkg_cmd}"
@@ -143,12 +144,9 @@ class InstallPkg:
         else:
             self._logger.debug("Progress Window is disabled")
 
-        if STARTUP_INFO:
-            process = subprocess.run(
-                cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, env=self._get_env(), startupinfo=STARTUP_INFO
-            )
-        else:
-            process = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, env=self._get_env())
+        start_time = time.perf_counter()
+        process = self._run_install(cmd, pkg_cmd)
+        duration = time.perf_counter() - start_time
 
         result = False
         if process.returncode == 0:
@@ -160,6 +158,7 @@ class InstallPkg:
                 self._logger.error(process.stderr.decode("utf-8"))
             except Exception as err:
                 self._logger.error(f"Error decoding stderr: {err}")
+        self._logger.log_timing(phase="install", duration=duration, package=pkg, result="ok" if result else "failed")
 
         if progress:
             self._logger.debug("Ending Progress Window")
@@ -167,6 +166,61 @@ class InstallPkg:
 
         return result
 
+    def _run_cmd(self, cmd: List[str]) -> subprocess.CompletedProcess:
+        self._logger.debug(f"Running command {cmd}")
+        if STARTUP_INFO:
+            return subprocess.run(
+                cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, env=self._get_env(), startupinfo=STARTUP_INFO
+            )
+        return subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, env=self._get_env())
+
+    def _run_install(self, args: List[str], pkg_cmd: str) -> subprocess.CompletedProcess:
+        """
+        Runs pip install for a package.
+
+        When the extension has a wheelhouse the package is first installed from it with ``--no-index``.
+        The package index is only used when the wheelhouse can not satisfy the package.
+
+        When index mirrors are configured they are tried from fastest to slowest until one succeeds.
+
+        Args:
+            args (List[str]): pip arguments such as ``["install", "--upgrade"]``.
+            pkg_cmd (str): The package requirement such as ``verr>=1.1.2``.
+
+        Returns:
+            subprocess.CompletedProcess: The completed pip process.
+        """
+        process = self._run_install_sources(args, pkg_cmd)
+        if process.returncode == 0:
+            try:
+                installed = get_installed_from_output(process.stdout.decode("utf-8", errors="replace"))
+            except Exception as err:
+                self._logger.debug(f"Unable to read installed packages from pip output: {err}")
+            else:
+                self._installed_packages.update(installed)
+        return process
+
+    def _run_install_sources(self, args: List[str], pkg_cmd: str) -> subprocess.CompletedProcess:
+        wheelhouse = self.wheelhouse_path
+        if wheelhouse is not None:
+            process = self._run_cmd(self._cmd_pip(*[*args, "--no-index", f"--find-links={wheelhouse}", pkg_cmd]))
+            if process.returncode == 0:
+                self._logger.debug(f"Installed {pkg_cmd} from wheelhouse")
+                return process
+            if not self.is_internet:
+                self._logger.error(f"Wheelhouse does not satisfy {pkg_cmd} and there is no internet connection!")
+                return process
+            self._logger.info(f"Wheelhouse does not satisfy {pkg_cmd}, installing from package index.")
+        index_urls = Download().rank_mirrors(self._config.index_url_mirrors)
+        if not index_urls:
+            return self._run_cmd(self._cmd_pip(*[*args, pkg_cmd]))
+        for index_url in index_urls:
+            process = self._run_cmd(self._cmd_pip(*[*args, f"--index-url={index_url}", pkg_cmd]))
+            if process.returncode == 0:
+                break
+            self._logger.warning(f"Unable to install {pkg_cmd} from index {index_url}")
+        return process
+
     def _uninstall_pkg(self, pkg: str) -> bool:
         # pip uninstall -y package1 package2 package3
         cmd = ["uninstall", "-y"]
@@ -234,7 +288,7 @@ class InstallPkg:
             if valid == 1:
                 continue
 
-            if not self.is_internet:
+            if not self.is_internet and self.wheelhouse_path is None:
                 self._logger.error("No internet connection!")
                 break
 
@@ -316,6 +370,13 @@ class InstallPkg:
     def config(self) -> Config:
         return self._config
 
+    @property
+    def installed_packages(self) -> Set[str]:
+        """
+        Gets the normalized names of the distributions installed by this instance, including dependencies pulled in by pip.
+        """
+        return set(self._installed_packages)
+
     @property
     def is_internet(self) -> bool:
         """Gets if there is an internet connection."""
@@ -325,6 +386,16 @@ class InstallPkg:
             self._is_internet = Download().is_internet
             return self._is_internet
 
+    @property
+    def wheelhouse_path(self) -> Path | None:
+        """Gets the wheelhouse folder bundled with the extension or ``None`` if there is no wheelhouse."""
+        try:
+            return self._wheelhouse_path
+        except AttributeError:
+            pth = self._config.wheelhouse_path
+            self._wheelhouse_path = pth if self._config.has_wheelhouse and pth.is_dir() else None
+            return self._wheelhouse_path
+
     @property
     def python_path(self) -> Path:
         return self._path_python
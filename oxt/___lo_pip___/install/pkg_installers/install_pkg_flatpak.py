@@ -1,19 +1,17 @@
 from __future__ import annotations
-import subprocess
-
+import time
 
 # import pkg_resources
-from ...oxt_logger import OxtLogger
+from ...oxt_logger import OxtLogger, get_logger
 from .install_pkg import InstallPkg
 from ..progress import Progress
-from .install_pkg import STARTUP_INFO
 
 
 class InstallPkgFlatpak(InstallPkg):
     """Install pip packages for flatpak."""
 
     def _get_logger(self) -> OxtLogger:
-        return OxtLogger(log_name=__name__)
+        return get_logger(log_name=__name__)
 
     def _install_pkg(self, pkg: str, ver: str, force: bool) -> bool:
         """
@@ -42,8 +40,6 @@ class InstallPkgFlatpak(InstallPkg):
         cmd.append(f"--target={self.config.site_packages}")
 
         pkg_cmd = f"{pkg}{ver}" if ver else pkg
-        cmd = self._cmd_pip(*[*cmd, pkg_cmd])
-        self._logger.debug(f"Running command {cmd}")
         self._logger.info(f"Installing package {pkg}")
         if self._flag_upgrade:
             msg = f"Pip Install - Upgrading success for: {pkg_cmd}"
@@ -63,12 +59,14 @@ class InstallPkgFlatpak(InstallPkg):
         else:
             self._logger.debug("Progress Window is disabled")
 
-        if STARTUP_INFO:
-            process = subprocess.run(
-                cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, env=self._get_env(), startupinfo=STARTUP_INFO
-            )
-        else:
-            process = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, env=self._get_env())
+        start_time = time.perf_counter()
+        process = self._run_install(cmd, pkg_cmd)
+        self._logger.log_timing(
+            phase="install",
+            duration=time.perf_counter() - start_time,
+            package=pkg,
+            result="ok" if process.returncode == 0 else "failed",
+        )
 
         if progress:
             self._logger.debug("Ending Progress Window")
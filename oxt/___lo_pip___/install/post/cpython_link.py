@@ -4,16 +4,30 @@ cpython suffix used by the embedded python interpreter.
 
 This class creates symlinks for all .so files in site-packages that match the current python embedded suffix.
 
+The .so files are read from the ``RECORD`` file of each installed distribution and only distributions that changed
+since the last run are linked. Only the top level entries of site-packages that no ``RECORD`` owns,
+such as packages installed with ``.egg-info`` metadata, are walked.
+
 For example a file named ``indexers.cpython-38-x86_64-linux-gnu.so`` would be symlinked to ``indexers.cpython-3.8.so``.
 This renaming allows the python interpreter to find the import.
 """
 from __future__ import annotations
-from typing import List
+from typing import Iterable, List
 from pathlib import Path
 from importlib import machinery
-import logging
 from ...config import Config
-from ...oxt_logger import OxtLogger
+from ...input_output import file_util
+from ...oxt_logger import get_logger
+from .cpython_scan import CPythonScanResult, get_extension_suffix, scan_cpython
+from .cpython_record import (
+    CPythonLinkManifest,
+    get_dist_infos,
+    get_dist_name,
+    get_record_extensions,
+    get_record_top_levels,
+    get_unowned_entries,
+)
+from ..pip_report import normalize_name
 
 
 class CPythonLink:
@@ -25,16 +39,15 @@ class CPythonLink:
             overwrite (bool, optional): Override any existing sys links. Defaults to False.
         """
         self._overwrite = overwrite
-        self._logger = OxtLogger(log_name=__name__)
+        self._logger = get_logger(log_name=__name__)
         self._current_suffix = self._get_current_suffix()
         self._logger.debug("CPythonLink.__init__")
         # self._suffix = self._get_current_suffix()
         self._config = Config()
         self._site_packages: Path | None = None
-        self._file_suffix = ""
+        self._scan: CPythonScanResult | None = None
         if self._config.site_packages:
             self._site_packages = Path(self._config.site_packages)
-            self._file_suffix = self._find_current_installed_suffix(self._site_packages)
         self._logger.debug("CPythonLink.__init__ done")
 
     def _get_current_suffix(self) -> str:
@@ -45,23 +58,25 @@ class CPythonLink:
                 return suffix[1:][:-3]
         return ""
 
+    def _get_scan(self, path: Path) -> CPythonScanResult:
+        """Gets the extension files of path. The folder is only walked once."""
+        if self._scan is None:
+            self._scan = scan_cpython(path, self._current_suffix, max_workers=4)
+        return self._scan
+
     def _get_all_files(self, path: Path) -> List[Path]:
-        return [p for p in path.glob(f"**/*{self._file_suffix}.so") if p.is_file()]
+        return self._get_scan(path).get_files(self.file_suffix)
 
     def _create_symlink(self, src: Path, dst: Path) -> None:
-        log = self._config.log_level <= logging.DEBUG
         if dst.is_symlink():
             if self._overwrite:
-                if log:
-                    self._logger.debug(f"Removing existing symlink {dst}")
+                self._logger.debug("Removing existing symlink %s", dst)
                 dst.unlink()
             else:
-                if log:
-                    self._logger.debug(f"Symlink already exists {dst}")
+                self._logger.debug("Symlink already exists %s", dst)
                 return
         dst.symlink_to(src)
-        if log:
-            self._logger.debug(f"Created symlink {dst} -> {src}")
+        self._logger.debug("Created symlink %s -> %s", dst, src)
 
     def _find_current_installed_suffix(self, path: Path) -> str:
         """
@@ -73,45 +88,112 @@ class CPythonLink:
         Returns:
             str: suffix if found, otherwise empty string.
         """
-        return next(
-            (str(p).rsplit(".", 2)[1] for p in path.glob("**/*.cpython-*.so") if not p.is_symlink()),
-            "",
-        )
+        if not path.exists():
+            return ""
+        return self._get_scan(path).file_suffix
 
-    def link(self) -> None:
+    def link(self, dists: Iterable[str] | None = None) -> None:
         """
         Creates symlinks for all .so files in site-packages that match the current suffix.
+
+        Only distributions that are new or changed since the last run are linked, unless ``overwrite`` is set.
+        Entries that no distribution ``RECORD`` owns are always walked.
+
+        Args:
+            dists (Iterable[str], optional): Names of the distributions to link such as those just installed.
+                Defaults to all distributions in site-packages.
         """
         self._logger.debug("CPythonLink.link starting")
         if not self._site_packages:
             self._logger.debug("No site-packages found")
             return
-        if not self._file_suffix:
-            self._logger.debug("No current file suffix found")
+        if not self._current_suffix:
+            self._logger.debug("No embedded python suffix found")
             return
         if not self._site_packages.exists():
             self._logger.debug(f"Site-packages does not exist {self._site_packages}")
             return
         self._logger.debug(f"Python current suffix: {self._current_suffix}")
-        self._logger.debug(f"Found file suffix: {self._file_suffix}")
-        files = self._get_all_files(self._site_packages)
+        dist_infos = get_dist_infos(self._site_packages)
+        if dist_infos:
+            self._link_records(self._site_packages, dist_infos, dists)
+        else:
+            self._logger.debug("No distribution info found, scanning site-packages")
+            self._link_scanned(self._site_packages)
+        self._logger.debug("CPythonLink.link done")
+
+    def _link_file(self, file: Path, file_suffix: str) -> Path | None:
+        """Links a single file. Returns the link path or ``None`` if the file does not need a link."""
+        if not file_suffix or file_suffix == self._current_suffix:
+            return None
+        ln_name = file.name.replace(file_suffix, self._current_suffix)
+        src = file
+        if not src.is_absolute():
+            src = file.resolve()
+        dst = src.parent / ln_name
+        self._create_symlink(src, dst)
+        return dst
+
+    def _get_manifest_file(self) -> Path:
+        """Gets the manifest file, it is kept in the user profile with the other state files of the extension."""
+        return Path(file_util.get_user_profile_path(True), f"{self._config.lo_identifier}.cpython_links.json")
+
+    def _link_records(self, site_packages: Path, dist_infos: List[Path], dists: Iterable[str] | None) -> None:
+        """Links the .so files listed in the ``RECORD`` of each changed distribution."""
+        manifest = CPythonLinkManifest(site_packages, self._get_manifest_file())
+        manifest.prune(dist_infos)
+        candidates = dist_infos
+        if dists is not None:
+            names = {normalize_name(name) for name in dists}
+            candidates = [d for d in dist_infos if get_dist_name(d) in names]
+        if self._overwrite:
+            changed = list(candidates)
+        else:
+            changed = manifest.get_changed(candidates, self._current_suffix)
+        self._logger.debug("%d of %d distributions need linking", len(changed), len(dist_infos))
+        for dist_info in changed:
+            links: List[Path] = []
+            for file in get_record_extensions(dist_info):
+                dst = self._link_file(file, get_extension_suffix(file.name))
+                if dst is not None:
+                    links.append(dst)
+            manifest.mark(dist_info, self._current_suffix, links, get_record_top_levels(dist_info))
+        owned = set()
+        for dist_info in dist_infos:
+            owned.update(manifest.get_top_levels(dist_info))
+        manifest.save()
+        self._link_unowned(site_packages, owned)
+
+    def _link_unowned(self, site_packages: Path, owned: Iterable[str]) -> None:
+        """Links the .so files in the top level entries of site-packages that no ``RECORD`` owns."""
+        entries = get_unowned_entries(site_packages, owned)
+        if not entries:
+            return
+        self._logger.debug("Scanning %d entries not owned by a distribution record", len(entries))
+        for entry in entries:
+            if entry.is_dir() and not entry.is_symlink():
+                scan = scan_cpython(entry, self._current_suffix)
+                for suffix in scan.suffixes:
+                    for file in scan.get_files(suffix):
+                        self._link_file(file, suffix)
+            elif not entry.is_symlink():
+                self._link_file(entry, get_extension_suffix(entry.name))
+
+    def _link_scanned(self, site_packages: Path) -> None:
+        """Links the .so files found by walking site-packages."""
+        if not self.file_suffix:
+            self._logger.debug("No current file suffix found")
+            return
+        self._logger.debug(f"Found file suffix: {self.file_suffix}")
+        files = self._get_all_files(site_packages)
         if not files:
-            self._logger.debug(f"No files found in {self._site_packages}")
+            self._logger.debug(f"No files found in {site_packages}")
             return
-        cp_old = self._file_suffix
-        cp_new = self._current_suffix
-        if cp_old == cp_new:
-            self._logger.debug(f"Suffixes match, no need to link: {cp_old} == {cp_new}")
+        if self.file_suffix == self._current_suffix:
+            self._logger.debug(f"Suffixes match, no need to link: {self.file_suffix} == {self._current_suffix}")
             return
-
         for file in files:
-            ln_name = file.name.replace(cp_old, cp_new)
-            src = file
-            if not src.is_absolute():
-                src = file.resolve()
-            dst = src.parent / ln_name
-            self._create_symlink(src, dst)
-        self._logger.debug("CPythonLink.link done")
+            self._link_file(file, self.file_suffix)
 
     # region Properties
     @property
@@ -140,6 +222,12 @@ class CPythonLink:
     @property
     def file_suffix(self) -> str:
         """Current Suffix such as ``cpython-38-x86_64-linux-gnu``"""
-        return self._file_suffix
+        try:
+            return self._file_suffix
+        except AttributeError:
+            self._file_suffix = ""
+            if self._site_packages:
+                self._file_suffix = self._find_current_installed_suffix(self._site_packages)
+            return self._file_suffix
 
     # endregion Properties
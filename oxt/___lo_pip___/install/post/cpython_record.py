@@ -0,0 +1,282 @@
+"""
+Finds CPython extension files from the ``RECORD`` file of each installed distribution.
+
+Reading the file list pip wrote at install time is much cheaper than walking site-packages,
+which for packages such as numpy or scipy holds tens of thousands of files.
+
+``CPythonLinkManifest`` remembers the ``RECORD`` size and modification time of every distribution that has been linked
+so that only distributions installed or updated since the last run are linked again.
+The manifest is kept in the user profile with the other state files of the extension, not in site-packages.
+It also remembers the top level entries each ``RECORD`` owns. Entries that no ``RECORD`` owns, such as packages
+installed with ``.egg-info`` metadata, are found with ``get_unowned_entries()`` and still have to be walked.
+"""
+from __future__ import annotations
+from typing import Any, Dict, Iterable, List, Set
+from pathlib import Path
+import csv
+import json
+import os
+
+from ...input_output.atomic_file import write_json_atomic
+from .cpython_scan import get_extension_suffix
+from ..pip_report import normalize_name
+
+
+def get_dist_infos(site_packages: str | Path) -> List[Path]:
+    """
+    Gets the ``.dist-info`` folders in a site-packages folder.
+
+    Args:
+        site_packages (str | Path): Site-packages folder.
+
+    Returns:
+        List[Path]: ``.dist-info`` folders sorted by name.
+    """
+    result: List[Path] = []
+    try:
+        with os.scandir(site_packages) as it:
+            for entry in it:
+                if entry.name.endswith(".dist-info") and entry.is_dir():
+                    result.append(Path(entry.path))
+    except OSError:
+        return []
+    return sorted(result)
+
+
+def get_dist_name(dist_info: Path) -> str:
+    """
+    Gets the normalized distribution name of a ``.dist-info`` folder such as ``numpy`` for ``numpy-1.26.0.dist-info``.
+
+    Args:
+        dist_info (Path): ``.dist-info`` folder.
+
+    Returns:
+        str: Lower case name with ``-`` and ``.`` replaced by ``_``.
+    """
+    name = dist_info.name[: -len(".dist-info")].split("-", 1)[0]
+    return normalize_name(name)
+
+
+def _read_record(dist_info: Path) -> List[str]:
+    """Gets the file names listed in the ``RECORD`` file of a distribution, empty if it can not be read."""
+    try:
+        with open(dist_info / "RECORD", "r", encoding="utf-8", newline="") as f:
+            return [row[0] for row in csv.reader(f) if row]
+    except OSError:
+        return []
+
+
+def get_record_top_levels(dist_info: Path) -> List[str]:
+    """
+    Gets the top level site-packages entries a distribution owns such as ``numpy`` or ``six.py``.
+
+    Files installed outside site-packages, such as scripts, are not included.
+
+    Args:
+        dist_info (Path): ``.dist-info`` folder.
+
+    Returns:
+        List[str]: Entry names sorted by name.
+    """
+    result: Set[str] = set()
+    for name in _read_record(dist_info):
+        top = name.replace("\\", "/").split("/", 1)[0]
+        if top and top not in (".", ".."):
+            result.add(top)
+    return sorted(result)
+
+
+def get_unowned_entries(site_packages: str | Path, owned: Iterable[str]) -> List[Path]:
+    """
+    Gets the top level site-packages entries that no ``RECORD`` owns.
+
+    Metadata folders, hidden entries and ``__pycache__`` are not included.
+
+    Args:
+        site_packages (str | Path): Site-packages folder.
+        owned (Iterable[str]): Entry names owned by a ``RECORD``, see ``get_record_top_levels()``.
+
+    Returns:
+        List[Path]: Entries sorted by name.
+    """
+    owned_names = set(owned)
+    result: List[Path] = []
+    try:
+        with os.scandir(site_packages) as it:
+            for entry in it:
+                name = entry.name
+                if name in owned_names or name.startswith(".") or name == "__pycache__":
+                    continue
+                if name.endswith((".dist-info", ".egg-info")) and entry.is_dir():
+                    continue
+                result.append(Path(entry.path))
+    except OSError:
+        return []
+    return sorted(result)
+
+
+def get_record_extensions(dist_info: Path) -> List[Path]:
+    """
+    Gets the CPython extension files listed in the ``RECORD`` file of a distribution.
+
+    Symlinks are not included and files that no longer exist are skipped.
+
+    Args:
+        dist_info (Path): ``.dist-info`` folder.
+
+    Returns:
+        List[Path]: Absolute paths of extension files.
+    """
+    root = dist_info.parent
+    result: List[Path] = []
+    for name in _read_record(dist_info):
+        if not get_extension_suffix(name.rsplit("/", 1)[-1]):
+            continue
+        pth = Path(os.path.normpath(root / name))
+        if pth.is_symlink() or not pth.is_file():
+            continue
+        result.append(pth)
+    return result
+
+
+class CPythonLinkManifest:
+    """Json manifest of the distributions that have been linked."""
+
+    LEGACY_FILE_NAME = ".lo_pip_cpython_links.json"
+    """Manifest file that older versions kept in site-packages. It is removed when the manifest is saved."""
+
+    def __init__(self, site_packages: str | Path, file: str | Path) -> None:
+        """
+        Constructor
+
+        Args:
+            site_packages (str | Path): Site-packages folder.
+            file (str | Path): Manifest file. It is only used for this site-packages folder.
+        """
+        self._root = Path(site_packages)
+        self._file = Path(file)
+        self._data: Dict[str, Dict[str, Any]] = self._load()
+
+    # region Methods
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        if not self._file.exists():
+            return {}
+        try:
+            with open(self._file, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(data, dict) or data.get("site_packages") != str(self._root):
+            return {}
+        dists = data.get("dists")
+        return dists if isinstance(dists, dict) else {}
+
+    def _get_stamp(self, dist_info: Path) -> List[int]:
+        try:
+            st = (dist_info / "RECORD").stat()
+        except OSError:
+            return []
+        return [st.st_mtime_ns, st.st_size]
+
+    def is_changed(self, dist_info: Path, link_suffix: str) -> bool:
+        """
+        Gets if a distribution needs to be linked.
+
+        A distribution needs linking when it has not been linked before, its ``RECORD`` changed,
+        the link suffix changed or one of its links has been removed.
+
+        Args:
+            dist_info (Path): ``.dist-info`` folder.
+            link_suffix (str): Suffix of the embedded python such as ``cpython-3.8``.
+
+        Returns:
+            bool: ``True`` if the distribution should be linked.
+        """
+        entry = self._data.get(dist_info.name)
+        if not entry:
+            return True
+        if entry.get("suffix") != link_suffix or entry.get("stamp") != self._get_stamp(dist_info):
+            return True
+        return not all((self._root / link).is_symlink() for link in entry.get("links", []))
+
+    def get_changed(self, dist_infos: Iterable[Path], link_suffix: str) -> List[Path]:
+        """
+        Gets the distributions that need to be linked.
+
+        Args:
+            dist_infos (Iterable[Path]): ``.dist-info`` folders.
+            link_suffix (str): Suffix of the embedded python such as ``cpython-3.8``.
+
+        Returns:
+            List[Path]: Changed ``.dist-info`` folders.
+        """
+        return [d for d in dist_infos if self.is_changed(d, link_suffix)]
+
+    def get_top_levels(self, dist_info: Path) -> List[str]:
+        """
+        Gets the top level entries a distribution owns.
+
+        The entries recorded by ``mark()`` are used while the ``RECORD`` is unchanged, otherwise the ``RECORD`` is read.
+
+        Args:
+            dist_info (Path): ``.dist-info`` folder.
+
+        Returns:
+            List[str]: Entry names.
+        """
+        entry = self._data.get(dist_info.name)
+        if entry and entry.get("stamp") == self._get_stamp(dist_info) and isinstance(entry.get("top_levels"), list):
+            return [str(name) for name in entry["top_levels"]]
+        return get_record_top_levels(dist_info)
+
+    def mark(
+        self, dist_info: Path, link_suffix: str, links: Iterable[Path], top_levels: Iterable[str] | None = None
+    ) -> None:
+        """
+        Records that a distribution has been linked.
+
+        Args:
+            dist_info (Path): ``.dist-info`` folder.
+            link_suffix (str): Suffix of the embedded python such as ``cpython-3.8``.
+            links (Iterable[Path]): Links of the distribution.
+            top_levels (Iterable[str], optional): Top level entries the distribution owns.
+                Defaults to the entries read from its ``RECORD``.
+        """
+        rel_links: List[str] = []
+        for link in links:
+            try:
+                rel_links.append(Path(os.path.relpath(link, self._root)).as_posix())
+            except ValueError:
+                # different drive on windows
+                continue
+        self._data[dist_info.name] = {
+            "suffix": link_suffix,
+            "stamp": self._get_stamp(dist_info),
+            "links": rel_links,
+            "top_levels": sorted(get_record_top_levels(dist_info) if top_levels is None else top_levels),
+        }
+
+    def prune(self, dist_infos: Iterable[Path]) -> None:
+        """Forgets distributions that are no longer installed."""
+        names = {d.name for d in dist_infos}
+        for key in list(self._data.keys()):
+            if key not in names:
+                del self._data[key]
+
+    def save(self) -> None:
+        """Saves the manifest. If it is not written all distributions are linked again next time."""
+        write_json_atomic(self._file, {"site_packages": str(self._root), "dists": self._data})
+        try:
+            (self._root / self.LEGACY_FILE_NAME).unlink()
+        except OSError:
+            pass
+
+    # endregion Methods
+
+    # region Properties
+    @property
+    def file(self) -> Path:
+        """Gets the manifest file path."""
+        return self._file
+
+    # endregion Properties
@@ -0,0 +1,169 @@
+"""
+Single pass scan of a site-packages folder for CPython extension modules.
+
+``LinkCPython`` and ``CPythonLink`` need the installed extension suffix, the extension files that use it and
+the symlinks that already exist. All three are collected here by one ``os.scandir`` walk instead of a glob per question.
+"""
+from __future__ import annotations
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List
+from pathlib import Path
+import os
+
+_MARKER = ".cpython-"
+
+
+class CPythonScanResult:
+    """Extension files and symlinks found by ``scan_cpython()``."""
+
+    def __init__(self) -> None:
+        self._files: Dict[str, List[Path]] = {}
+        self._links: List[Path] = []
+
+    def _add_file(self, suffix: str, pth: Path) -> None:
+        self._files.setdefault(suffix, []).append(pth)
+
+    def _merge(self, other: CPythonScanResult) -> None:
+        for suffix, files in other._files.items():
+            self._files.setdefault(suffix, []).extend(files)
+        self._links.extend(other._links)
+
+    def get_files(self, suffix: str) -> List[Path]:
+        """
+        Gets the extension files that use a suffix.
+
+        Args:
+            suffix (str): Suffix such as ``cpython-38-x86_64-linux-gnu``.
+
+        Returns:
+            List[Path]: Files. Symlinks are not included.
+        """
+        return list(self._files.get(suffix, []))
+
+    # region Properties
+    @property
+    def file_suffix(self) -> str:
+        """
+        Gets the suffix of the installed extension files such as ``cpython-38-x86_64-linux-gnu``.
+
+        When files with several suffixes are found the most common suffix is used.
+        Empty string if no extension files were found.
+        """
+        if not self._files:
+            return ""
+        counts = Counter({suffix: len(files) for suffix, files in self._files.items()})
+        return counts.most_common(1)[0][0]
+
+    @property
+    def suffixes(self) -> List[str]:
+        """Gets all the suffixes found."""
+        return list(self._files.keys())
+
+    @property
+    def links(self) -> List[Path]:
+        """Gets symlinks named with the link suffix passed to ``scan_cpython()``."""
+        return list(self._links)
+
+    # endregion Properties
+
+
+def get_extension_suffix(name: str) -> str:
+    """
+    Gets the cpython suffix of an extension file name.
+
+    Args:
+        name (str): File name such as ``indexers.cpython-38-x86_64-linux-gnu.so``.
+
+    Returns:
+        str: Suffix such as ``cpython-38-x86_64-linux-gnu`` or empty string if the name is not a cpython extension.
+    """
+    if not name.endswith(".so"):
+        return ""
+    idx = name.find(_MARKER)
+    if idx < 1:
+        return ""
+    return name[idx + 1 : -3]
+
+
+def _scan_dir(root: str, link_name_end: str, result: CPythonScanResult) -> None:
+    stack = [root]
+    while stack:
+        current = stack.pop()
+        try:
+            it = os.scandir(current)
+        except OSError:
+            continue
+        dirs: List[str] = []
+        with it:
+            for entry in it:
+                _scan_entry(entry, link_name_end, result, dirs)
+        # keep a stable depth first order similar to glob
+        stack.extend(sorted(dirs, reverse=True))
+
+
+def _scan_entry(entry: os.DirEntry, link_name_end: str, result: CPythonScanResult, dirs: List[str]) -> None:
+    try:
+        is_link = entry.is_symlink()
+        if not is_link and entry.is_dir(follow_symlinks=False):
+            dirs.append(entry.path)
+            return
+    except OSError:
+        return
+    name = entry.name
+    if not name.endswith(".so"):
+        return
+    if is_link:
+        if link_name_end and name.endswith(link_name_end):
+            result._links.append(Path(entry.path))
+        return
+    suffix = get_extension_suffix(name)
+    if suffix:
+        result._add_file(suffix, Path(entry.path))
+
+
+def _split_top_level(root: str, link_name_end: str, result: CPythonScanResult) -> List[str]:
+    """Scans the files in root and returns its sub directories."""
+    dirs: List[str] = []
+    try:
+        with os.scandir(root) as it:
+            for entry in it:
+                _scan_entry(entry, link_name_end, result, dirs)
+    except OSError:
+        return []
+    return sorted(dirs)
+
+
+def scan_cpython(root: str | Path, link_suffix: str = "", max_workers: int = 1) -> CPythonScanResult:
+    """
+    Walks a folder once and collects cpython extension files and symlinks.
+
+    Symlinked folders are not followed.
+
+    Args:
+        root (str | Path): Folder to scan, usually site-packages.
+        link_suffix (str, optional): Suffix of the embedded python such as ``cpython-3.8``.
+            Symlinks ending in ``<link_suffix>.so`` are collected as links.
+        max_workers (int, optional): Number of threads used to scan top level folders in parallel. Defaults to ``1``.
+
+    Returns:
+        CPythonScanResult: Scan result.
+    """
+    link_name_end = f"{link_suffix}.so" if link_suffix else ""
+    result = CPythonScanResult()
+    root_str = str(root)
+    if max_workers <= 1:
+        _scan_dir(root_str, link_name_end, result)
+        return result
+
+    top_dirs = _split_top_level(root_str, link_name_end, result)
+
+    def scan(pth: str) -> CPythonScanResult:
+        sub = CPythonScanResult()
+        _scan_dir(pth, link_name_end, sub)
+        return sub
+
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="lo_pip_scan") as executor:
+        for sub in executor.map(scan, top_dirs):
+            result._merge(sub)
+    return result
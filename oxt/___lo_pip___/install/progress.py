@@ -4,7 +4,7 @@ import subprocess
 import os
 import signal
 
-from ..oxt_logger import OxtLogger
+from ..oxt_logger import get_logger
 from .progress_window.progress_rules import ProgressRules
 from ..config import Config
 
@@ -14,7 +14,7 @@ class Progress:
         self._start_msg = start_msg
         self._title = title
         self._config = Config()
-        self._logger = OxtLogger(log_name=__name__)
+        self._logger = get_logger(log_name=__name__)
         rules = ProgressRules()
         self._progress_obj = rules.get_progress()
 
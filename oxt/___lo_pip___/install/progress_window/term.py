@@ -1,6 +1,6 @@
 from __future__ import annotations
 from ...config import Config
-from ...oxt_logger import OxtLogger
+from ...oxt_logger import OxtLogger, get_logger
 
 
 class Term:
@@ -8,7 +8,7 @@ class Term:
 
     def __init__(self) -> None:
         self._config = Config()
-        self._logger = OxtLogger(log_name=__name__)
+        self._logger = get_logger(log_name=__name__)
 
     def get_code(self, msg: str) -> str:
         """Get the code to run in the terminal."""
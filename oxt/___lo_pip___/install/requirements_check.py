@@ -9,7 +9,7 @@ from importlib.metadata import PackageNotFoundError, version
 
 from ..config import Config
 from ..ver.rules.ver_rules import VerRules
-from ..oxt_logger import OxtLogger
+from ..oxt_logger import get_logger
 from ..meta.singleton import Singleton
 
 
@@ -17,7 +17,7 @@ class RequirementsCheck(metaclass=Singleton):
     """Requirements Check class."""
 
     def __init__(self) -> None:
-        self._logger = OxtLogger(log_name=__name__)
+        self._logger = get_logger(log_name=__name__)
         self._config = Config()
         self._ver_rules = VerRules()
 
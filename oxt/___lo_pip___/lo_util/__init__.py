@@ -1,7 +1,9 @@
+from .async_callback import AsyncCallback as AsyncCallback
 from .util import Util as Util
+from .uno_services import UnoServices as UnoServices
 from .session import Session as Session
 from .session import PathKind as PathKind
 from .session import RegisterPathKind as RegisterPathKind
 from .session import UnRegisterPathKind as UnRegisterPathKind
 
-__all__ = ["Util", "Session", "PathKind", "RegisterPathKind", "UnRegisterPathKind"]
+__all__ = ["AsyncCallback", "Util", "UnoServices", "Session", "PathKind", "RegisterPathKind", "UnRegisterPathKind"]
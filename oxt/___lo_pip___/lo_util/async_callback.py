@@ -0,0 +1,33 @@
+from __future__ import annotations
+from typing import Any, Callable
+
+import unohelper
+from com.sun.star.awt import XCallback
+
+from .uno_services import UnoServices
+
+
+class AsyncCallback(unohelper.Base, XCallback):
+    """
+    Runs a callback on the LibreOffice main thread.
+
+    Work done on a background thread posts its result with ``post()``,
+    the callback then runs on the main thread where it is safe to update dialogs.
+    """
+
+    def __init__(self, callback: Callable[[], None]) -> None:
+        """
+        Constructor
+
+        Args:
+            callback (Callable[[], None]): Callback to run on the main thread.
+        """
+        self._callback = callback
+
+    def notify(self, aData: Any) -> None:
+        self._callback()
+
+    def post(self) -> None:
+        """Queues the callback to run on the main thread."""
+        async_callback = UnoServices().get_service("com.sun.star.awt.AsyncCallback")
+        async_callback.addCallback(self, None)
@@ -1,6 +1,8 @@
 from __future__ import annotations
-from typing import Any, cast, Dict, Tuple, TYPE_CHECKING
+from typing import Any, cast, Dict, Iterator, Tuple, TYPE_CHECKING
 from typing import TypedDict
+import contextlib
+import threading
 import uno
 from com.sun.star.beans import PropertyValue
 
@@ -31,11 +33,34 @@ class Configuration(metaclass=Singleton):
     def __init__(self) -> None:
         # shared events that other objects can subscribe to such as settings.Settings
         self._events = Events()
+        self._lock = threading.Lock()
+        self._provider: Any = None
+        # read only access objects by node path, cleared when the node is saved.
+        self._access: Dict[str, Any] = {}
+        # pending batch changes, per thread.
+        self._batch_local = threading.local()
+
+    def _get_provider(self) -> Any:
+        if self._provider is None:
+            self._provider = Util().create_uno_service("com.sun.star.configuration.ConfigurationProvider")
+        return self._provider
+
+    def _create_access(self, node_value: str, updatable: bool) -> Any:
+        node = PropertyValue("nodepath", 0, node_value, 0)
+        if updatable:
+            service = "com.sun.star.configuration.ConfigurationUpdateAccess"
+        else:
+            service = "com.sun.star.configuration.ConfigurationAccess"
+        return self._get_provider().createInstanceWithArguments(service, (node,))
 
     def get_configuration_access(self, node_value: str, updatable: bool = False) -> Any:
         """
         Access configuration value.
 
+        The configuration provider is created once. Read only access objects are cached by node path
+        until the node or one of its parent or child nodes is saved.
+        Updatable access objects are created on each call.
+
         Args:
             node_value (str): The configuration key node as a string.
             updatable (bool, optional): Set True when accessor needs to modify the key value. Defaults to False.
@@ -43,19 +68,94 @@ class Configuration(metaclass=Singleton):
         Returns:
             Any: The configuration value.
         """
-
-        util = Util()
-        cp = util.create_uno_service("com.sun.star.configuration.ConfigurationProvider")
-        node = PropertyValue("nodepath", 0, node_value, 0)
-        if updatable:
-            result = cp.createInstanceWithArguments("com.sun.star.configuration.ConfigurationUpdateAccess", (node,))
-        else:
-            result = cp.createInstanceWithArguments("com.sun.star.configuration.ConfigurationAccess", (node,))
+        with self._lock:
+            if updatable:
+                result = self._create_access(node_value, True)
+            else:
+                result = self._access.get(node_value)
+                if result is None:
+                    result = self._create_access(node_value, False)
+                    self._access[node_value] = result
         event_args = EventArgs(source="Configuration.get_configuration_access")
         event_args.event_data = {"node_value": node_value, "updatable": updatable, "result": result}
         self._events.trigger(event_name=ConfigurationNamedEvent.GET_CONFIGURATION, event_args=event_args)
         return result
 
+    def clear_cache(self, node_value: str = "") -> None:
+        """
+        Clears cached read only access objects.
+
+        Args:
+            node_value (str, optional): Node path such as "/OooPipRunner.Settings/Logging".
+                Clears the node, its parents and its children. Defaults to all nodes.
+        """
+        with self._lock:
+            if not node_value:
+                self._access.clear()
+                return
+            for key in list(self._access.keys()):
+                if key.startswith(node_value) or node_value.startswith(key):
+                    del self._access[key]
+
+    @contextlib.contextmanager
+    def batch(self) -> Iterator[None]:
+        """
+        Collects the changes saved in the ``with`` block and commits them once when the block exits.
+
+        ``save_configuration()`` and ``save_configuration_str_lst()`` still raise their saving events in the block,
+        but the changes are only written when the outermost block exits and then a single
+        ``CONFIGURATION_SAVED`` event is raised with ``event_data`` ``{"batch": True, "nodes": [...]}``.
+        If the block raises an error the collected changes are discarded.
+
+        Batches are per thread, saves from other threads are not collected.
+
+        Example:
+            .. code-block:: python
+
+                with Configuration().batch():
+                    settings.py_paths = paths
+                    settings.py_path_verify = True
+        """
+        local = self._batch_local
+        depth = getattr(local, "depth", 0)
+        if depth == 0:
+            local.props = {}
+            local.str_lst = {}
+        local.depth = depth + 1
+        ok = False
+        try:
+            yield
+            ok = True
+        finally:
+            local.depth -= 1
+            if local.depth == 0:
+                props: Dict[str, Dict[str, Any]] = local.props
+                str_lst: Dict[str, Dict[str, Tuple[str, ...]]] = local.str_lst
+                local.props = {}
+                local.str_lst = {}
+                if ok:
+                    self._commit_batch(props, str_lst)
+
+    def _in_batch(self) -> bool:
+        return getattr(self._batch_local, "depth", 0) > 0
+
+    def _commit_batch(self, props: Dict[str, Dict[str, Any]], str_lst: Dict[str, Dict[str, Tuple[str, ...]]]) -> None:
+        nodes = list(dict.fromkeys([*props.keys(), *str_lst.keys()]))
+        if not nodes:
+            return
+        for node_value in nodes:
+            writer = cast("ConfigurationUpdateAccess", self.get_configuration_access(node_value, True))
+            node_props = props.get(node_value)
+            if node_props:
+                writer.setPropertyValues(tuple(node_props.keys()), tuple(node_props.values()))
+            for name, value in str_lst.get(node_value, {}).items():
+                uno.invoke(writer, "replaceByName", (name, uno.Any("[]string", value)))  # type: ignore
+            writer.commitChanges()
+            self.clear_cache(node_value)
+        event_args = EventArgs(source="Configuration.batch")
+        event_args.event_data = {"batch": True, "nodes": nodes}
+        self._events.trigger(event_name=ConfigurationNamedEvent.CONFIGURATION_SAVED, event_args=event_args)
+
     def save_configuration(self, node_value: str, settings: SettingsT) -> None:
         """
         Save Configuration settings.
@@ -84,11 +184,16 @@ class Configuration(metaclass=Singleton):
 
         if not settings:
             return
+        if self._in_batch():
+            node_props = self._batch_local.props.setdefault(node_value, {})
+            node_props.update(zip(settings["names"], settings["values"]))
+            return
         try:
             writer = cast("ConfigurationUpdateAccess", self.get_configuration_access(node_value, True))
             writer.setPropertyValues(settings["names"], settings["values"])
             # uno.invoke(writer, "setPropertyValue", (settings["names"], settings["values"]))  # type: ignore
             writer.commitChanges()
+            self.clear_cache(node_value)
 
         except Exception as err:
             # self._logger.error(f"Error saving configuration: {err}", exc_info=True)
@@ -105,12 +210,16 @@ class Configuration(metaclass=Singleton):
         )
         if cancel_event_args.cancel and not cancel_event_args.handled:
             return
+        if self._in_batch():
+            self._batch_local.str_lst.setdefault(node_value, {})[name] = tuple(value)
+            return
 
         try:
             vals = uno.Any("[]string", value)  # type: ignore
             writer = cast("ConfigurationUpdateAccess", self.get_configuration_access(node_value, True))
             uno.invoke(writer, "replaceByName", (name, vals))  # type: ignore
             writer.commitChanges()
+            self.clear_cache(node_value)
 
         except Exception as err:
             # self._logger.error(f"Error saving configuration: {err}", exc_info=True)
@@ -11,9 +11,9 @@ from __future__ import annotations
 from typing import List
 from pathlib import Path
 from importlib import machinery
-import logging
 from ..config import Config
-from ..oxt_logger import OxtLogger
+from ..oxt_logger import get_logger
+from ..install.post.cpython_scan import CPythonScanResult, scan_cpython
 
 
 class LinkCPython:
@@ -25,13 +25,14 @@ class LinkCPython:
             pth (str): Path to site-packages folder.
             overwrite (bool, optional): Override any existing sys links. Defaults to False.
         """
-        self._logger = OxtLogger(log_name=__name__)
+        self._logger = get_logger(log_name=__name__)
         self._current_suffix = self._get_current_suffix()
         self._logger.debug("CPythonLink.__init__")
         self._config = Config()
         self._link_root = Path(pth)
         if not self._link_root.exists():
             raise FileNotFoundError(f"Path does not exist {self._link_root}")
+        self._scan: CPythonScanResult | None = None
         self._logger.debug("CPythonLink.__init__ done")
 
     def _get_current_suffix(self) -> str:
@@ -42,26 +43,28 @@ class LinkCPython:
                 return suffix[1:][:-3]
         return ""
 
+    def _get_scan(self) -> CPythonScanResult:
+        """Gets the extension files and links of the link root. The folder is only walked once until links change."""
+        if self._scan is None:
+            self._scan = scan_cpython(self._link_root, self.current_suffix, max_workers=4)
+        return self._scan
+
     def _get_all_files(self, path: Path) -> List[Path]:
-        return [p for p in path.glob(f"**/*{self.file_suffix}.so") if p.is_file()]
+        return self._get_scan().get_files(self.file_suffix)
 
     def _get_all_links(self, path: Path) -> List[Path]:
-        return [p for p in path.glob(f"**/*{self.current_suffix}.so") if p.is_symlink()]
+        return self._get_scan().links
 
     def _create_symlink(self, src: Path, dst: Path, overwrite: bool) -> bool:
-        log = self._config.log_level <= logging.DEBUG
         if dst.is_symlink():
             if overwrite:
-                if log:
-                    self._logger.debug(f"Removing existing symlink {dst}")
+                self._logger.debug("Removing existing symlink %s", dst)
                 dst.unlink()
             else:
-                if log:
-                    self._logger.debug(f"Symlink already exists {dst}")
+                self._logger.debug("Symlink already exists %s", dst)
                 return False
         dst.symlink_to(src)
-        if log:
-            self._logger.debug(f"Created symlink {dst} -> {src}")
+        self._logger.debug("Created symlink %s -> %s", dst, src)
         return True
 
     def _find_current_installed_suffix(self, path: Path) -> str:
@@ -74,10 +77,7 @@ class LinkCPython:
         Returns:
             str: suffix if found, otherwise empty string.
         """
-        return next(
-            (str(p).rsplit(".", 2)[1] for p in path.glob("**/*.cpython-*.so") if not p.is_symlink()),
-            "",
-        )
+        return self._get_scan().file_suffix
 
     def link(self, overwrite: bool = False) -> int:
         """
@@ -120,6 +120,8 @@ class LinkCPython:
             dst = src.parent / ln_name
             if self._create_symlink(src, dst, overwrite):
                 count += 1
+        if count:
+            self._scan = None
         self._logger.debug(f"Created {count} symlinks")
         return count
 
@@ -147,6 +149,8 @@ class LinkCPython:
             else:
                 link.unlink()
                 count += 1
+        if count:
+            self._scan = None
         if broken_only:
             self._logger.debug(f"Removed {count} broken symlinks")
         else:
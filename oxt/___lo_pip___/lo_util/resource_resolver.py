@@ -3,13 +3,13 @@ import uno
 from typing import Any, cast, TYPE_CHECKING
 
 from ..config import Config
-from ..oxt_logger import OxtLogger
+from ..oxt_logger import get_logger
+from .uno_services import UnoServices
 
 from com.sun.star.lang import Locale
 from com.sun.star.resource import MissingResourceException
 
 if TYPE_CHECKING:
-    from com.sun.star.util import PathSubstitution  # service
     from com.sun.star.resource import StringResourceWithLocation  # service
 
 
@@ -18,7 +18,7 @@ class ResourceResolver:
 
     def __init__(self, ctx: Any):
         self._config = Config()
-        self._logger = OxtLogger(log_name=__name__)
+        self._logger = get_logger(log_name=__name__)
         try:
             self.ctx = ctx
             self.service_manager = self.ctx.getServiceManager()
@@ -56,11 +56,7 @@ class ResourceResolver:
 
     def _get_env_locale(self):
         """Get interface locale"""
-        ps = cast(
-            "PathSubstitution",
-            self.service_manager.createInstanceWithContext("com.sun.star.util.PathSubstitution", self.ctx),
-        )
-        v_lang = ps.getSubstituteVariableValue("vlang")
+        v_lang = UnoServices().get_substitute_variable_value("vlang")
         # self._logger.debug(f"ResourceResolver._get_env_locale: v_lang={v_lang}")
         a_lang = v_lang.split("-") + 2 * [""]
         # self._logger.debug(f"ResourceResolver._get_env_locale: a_lang={a_lang}")
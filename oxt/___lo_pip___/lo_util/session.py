@@ -1,12 +1,14 @@
 # coding: utf-8
 from __future__ import annotations, unicode_literals
 import sys
-from typing import Any, TYPE_CHECKING, cast
+from typing import List, TYPE_CHECKING, cast
 from enum import Enum
 from pathlib import Path
 import uno
 import getpass, os, os.path
 from ..meta.singleton import Singleton
+from ..py_paths.path_normalizer import get_lexical_key
+from .uno_services import UnoServices
 
 
 # com.sun.star.uno.DeploymentException
@@ -56,14 +58,7 @@ class Session(metaclass=Singleton):
 
     @property
     def path_sub(self) -> PathSubstitution:
-        try:
-            return self._path_substitution  # type: ignore
-        except AttributeError:
-            ctx: Any = uno.getComponentContext()
-            self._path_substitution = cast(
-                "PathSubstitution", ctx.ServiceManager.createInstance("com.sun.star.util.PathSubstitution")
-            )
-        return self._path_substitution  # type: ignore
+        return cast("PathSubstitution", UnoServices().get_service("com.sun.star.util.PathSubstitution"))
 
     def substitute(self, var_name: str):
         """
@@ -78,7 +73,7 @@ class Session(metaclass=Singleton):
         Raises:
             com.sun.star.container.NoSuchElementException: ``NoSuchElementException``
         """
-        return self.path_sub.getSubstituteVariableValue(var_name)
+        return UnoServices().get_substitute_variable_value(var_name)
 
     @property
     def share(self) -> str:
@@ -163,16 +158,20 @@ class Session(metaclass=Singleton):
             script_path = cast(str, self.user_py_scripts)
         if not script_path:
             return
-        if script_path not in sys.path:
-            if append:
-                sys.path.append(script_path)
-            else:
-                sys.path.insert(0, script_path)
+        self.register_path(script_path, append)
+
+    def _find_sys_paths(self, key: str) -> List[str]:
+        """Gets the ``sys.path`` entries that are a spelling of the path with the key, see ``get_lexical_key()``."""
+        return [p for p in sys.path if p and get_lexical_key(p) == key]
 
     def register_path(self, pth: str | Path, append: bool = False) -> RegisterPathKind:
         """
         Register a path into ``sys.path`` if it does not exist
 
+        The path is registered as it is given. A path that is another spelling of a registered path,
+        such as ``~/x`` for ``/home/user/x/``, is already registered. Paths are compared by their text,
+        see ``get_lexical_key()``, so registering does not stall on a dead network mount in ``sys.path``.
+
         Args:
             pth (str | Path): Path to register.
             append (bool, optional): If True, appends to ``sys.path`` otherwise prepends. Defaults to False.
@@ -181,27 +180,31 @@ class Session(metaclass=Singleton):
             pth = str(pth)
         if not pth:
             return RegisterPathKind.NOT_REGISTERED
-        if pth not in sys.path:
-            if append:
-                sys.path.append(pth)
-            else:
-                sys.path.insert(0, pth)
-            return RegisterPathKind.REGISTERED
-        return RegisterPathKind.ALREADY_REGISTERED
+        key = get_lexical_key(pth)
+        if key in {get_lexical_key(p) for p in sys.path if p}:
+            return RegisterPathKind.ALREADY_REGISTERED
+        if append:
+            sys.path.append(pth)
+        else:
+            sys.path.insert(0, pth)
+        return RegisterPathKind.REGISTERED
 
     def unregister_path(self, pth: str | Path) -> UnRegisterPathKind:
         """
         Unregister a path into ``sys.path``
 
+        Every spelling of the path is removed, see ``get_lexical_key()``.
+
         Args:
             pth (str | Path): Path to unregister.
-            append (bool, optional): If True, appends to ``sys.path`` otherwise prepends. Defaults to False.
         """
         if not isinstance(pth, str):
             pth = str(pth)
         if not pth:
             return UnRegisterPathKind.NOT_UN_REGISTERED
-        if pth in sys.path:
-            sys.path.remove(pth)
-            return UnRegisterPathKind.UN_REGISTERED
-        return UnRegisterPathKind.ALREADY_UN_REGISTERED
+        found = self._find_sys_paths(get_lexical_key(pth))
+        if not found:
+            return UnRegisterPathKind.ALREADY_UN_REGISTERED
+        for sys_path in found:
+            sys.path.remove(sys_path)
+        return UnRegisterPathKind.UN_REGISTERED
@@ -0,0 +1,149 @@
+from __future__ import annotations
+from typing import Any, Callable, Dict, Tuple
+import threading
+import uno
+
+from ..meta.singleton import Singleton
+
+
+class UnoServices(metaclass=Singleton):
+    """
+    Singleton Class. Session scoped cache of UNO services and resolved values.
+
+    Services such as ``PathSubstitution`` and ``PathSettings``, singletons such as ``PackageInformationProvider``
+    and the values resolved from them do not change while LibreOffice is running,
+    so they are created or resolved once and shared by all callers.
+
+    ``hits`` counts the bridge calls saved, ``misses`` the bridge calls made.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.RLock()
+        self._cache: Dict[Tuple[str, str], Any] = {}
+        self._hits = 0
+        self._misses = 0
+
+    def _get(self, kind: str, name: str, factory: Callable[[], Any]) -> Any:
+        key = (kind, name)
+        with self._lock:
+            if key in self._cache:
+                self._hits += 1
+                return self._cache[key]
+            self._misses += 1
+            result = factory()
+            self._cache[key] = result
+            return result
+
+    def get_service(self, service: str) -> Any:
+        """
+        Gets a shared instance of a UNO service.
+
+        Args:
+            service (str): Service name such as ``com.sun.star.util.PathSubstitution``.
+
+        Returns:
+            Any: Service instance.
+        """
+
+        def create() -> Any:
+            ctx: Any = uno.getComponentContext()
+            return ctx.ServiceManager.createInstanceWithContext(service, ctx)
+
+        return self._get("service", service, create)
+
+    def get_singleton(self, name: str) -> Any:
+        """
+        Gets a UNO singleton from the component context.
+
+        Args:
+            name (str): Singleton name such as ``com.sun.star.deployment.PackageInformationProvider``.
+
+        Returns:
+            Any: Singleton or ``None`` if it is not available. ``None`` is not cached.
+        """
+
+        def create() -> Any:
+            ctx: Any = uno.getComponentContext()
+            return ctx.getValueByName(f"/singletons/{name}")
+
+        result = self._get("singleton", name, create)
+        if result is None:
+            with self._lock:
+                self._cache.pop(("singleton", name), None)
+        return result
+
+    def substitute_variables(self, text: str) -> str:
+        """
+        Substitutes the path variables in a text such as ``$(user)``.
+
+        Args:
+            text (str): Text with variables.
+
+        Returns:
+            str: Text with the variables replaced, usually a ``file:///`` url.
+        """
+
+        def resolve() -> str:
+            path_sub = self.get_service("com.sun.star.util.PathSubstitution")
+            return str(path_sub.substituteVariables(text, True))
+
+        return self._get("substitute_variables", text, resolve)
+
+    def get_substitute_variable_value(self, var_name: str) -> str:
+        """
+        Gets the value of a path variable such as ``vlang`` or ``$(prog)``.
+
+        Args:
+            var_name (str): Variable name.
+
+        Returns:
+            str: Value.
+
+        Raises:
+            com.sun.star.container.NoSuchElementException: If the variable is unknown.
+        """
+
+        def resolve() -> str:
+            path_sub = self.get_service("com.sun.star.util.PathSubstitution")
+            return str(path_sub.getSubstituteVariableValue(var_name))
+
+        return self._get("substitute_variable_value", var_name, resolve)
+
+    def get_path_setting(self, name: str) -> str:
+        """
+        Gets a ``com.sun.star.util.PathSettings`` value such as ``Module``.
+
+        Args:
+            name (str): Path setting name.
+
+        Returns:
+            str: Value, usually a ``file:///`` url.
+        """
+
+        def resolve() -> str:
+            path_settings = self.get_service("com.sun.star.util.PathSettings")
+            return str(getattr(path_settings, name))
+
+        return self._get("path_setting", name, resolve)
+
+    def clear(self) -> None:
+        """Clears the cache and the counters."""
+        with self._lock:
+            self._cache.clear()
+            self._hits = 0
+            self._misses = 0
+
+    @property
+    def hits(self) -> int:
+        """Gets the number of calls served from the cache, each one a saved bridge call."""
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        """Gets the number of calls that went over the UNO bridge."""
+        return self._misses
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        """Gets the counters such as ``{"hits": 12, "misses": 5}``."""
+        return {"hits": self._hits, "misses": self._misses}
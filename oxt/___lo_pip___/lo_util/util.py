@@ -1,9 +1,11 @@
 from __future__ import annotations
 from typing import Any
+import platform
 import uno
 from pathlib import Path
 
 from ..meta.singleton import Singleton
+from .uno_services import UnoServices
 
 
 class Util(metaclass=Singleton):
@@ -46,8 +48,25 @@ class Util(metaclass=Singleton):
             ``config("Work")``
             ``/home/user/Documents``
         """
-        path = self.create_uno_service("com.sun.star.util.PathSettings")
-        return self.to_system(getattr(path, name))
+        return self.to_system(UnoServices().get_path_setting(name))
+
+    def get_build_id(self) -> str:
+        """
+        Gets the build id of LibreOffice, such as ``6b8ed514a9f8b44d37a1b96673cbbdd077e24059``.
+
+        The build id is read from the LibreOffice version file with one macro expansion.
+
+        Returns:
+            str: Build id or an empty string if it is not available.
+        """
+        expander = UnoServices().get_singleton("com.sun.star.util.theMacroExpander")
+        if platform.system() == "Windows":
+            version_file = "program/version.ini"
+        elif platform.system() == "Darwin":
+            version_file = "Resources/versionrc"
+        else:
+            version_file = "program/versionrc"
+        return str(expander.expandMacros(f"${{$BRAND_BASE_DIR/{version_file}:buildid}}"))
 
     def to_system(self, path: str) -> str:
         if path.startswith("file://"):
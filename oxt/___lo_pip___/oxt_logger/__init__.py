@@ -1,3 +1,3 @@
-from .oxt_logger import OxtLogger
+from .oxt_logger import OxtLogger, get_logger
 
-__all__ = ["OxtLogger"]
+__all__ = ["OxtLogger", "get_logger"]
@@ -0,0 +1,44 @@
+"""
+Json lines output for timing records.
+
+A timing record is a log record that has a ``phase`` attribute, see ``OxtLogger.log_timing()``.
+Each record is written as one json object per line so that startup and install metrics can be
+aggregated without parsing the human readable log format.
+"""
+from __future__ import annotations
+import json
+import logging
+
+TIMING_FIELDS = ("phase", "duration", "package", "result")
+
+
+class TimingFilter(logging.Filter):
+    """Only passes timing records."""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        return hasattr(record, "phase")
+
+
+class JsonFormatter(logging.Formatter):
+    """
+    Formats a record as a single json line.
+
+    Example output:
+
+    .. code-block:: json
+
+        {"time": 1700000000.123, "name": "LO PY Path", "level": "INFO", "phase": "install", "duration": 4.211, "package": "numpy", "result": "ok", "message": "..."}
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        data = {
+            "time": round(record.created, 3),
+            "name": record.name,
+            "level": record.levelname,
+        }
+        for field in TIMING_FIELDS:
+            value = getattr(record, field, None)
+            if value is not None:
+                data[field] = value
+        data["message"] = record.getMessage()
+        return json.dumps(data, ensure_ascii=False)
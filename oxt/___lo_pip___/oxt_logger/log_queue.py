@@ -0,0 +1,142 @@
+"""
+Shared queue logging for all ``OxtLogger`` instances.
+
+Loggers only put records on a queue. A single ``QueueListener`` thread per log file formats the records
+and writes them, so there is only one file handler, one file lock and one file descriptor for the log file
+no matter how many loggers are created, and logging does not block the calling thread on file io.
+"""
+from __future__ import annotations
+from typing import Dict, List, NamedTuple
+from logging.handlers import QueueHandler, QueueListener, TimedRotatingFileHandler
+import atexit
+import logging
+import queue
+import sys
+import threading
+
+from ..meta.singleton import Singleton
+from .json_formatter import JsonFormatter, TimingFilter
+from .ring_buffer_handler import RingBufferHandler
+
+
+class _QueueKey(NamedTuple):
+    log_file: str
+    add_console: bool
+    level: int
+    log_format: str
+    json_file: str
+    ring_size: int
+
+
+class CaptureQueueHandler(QueueHandler):
+    """
+    Queue handler that also takes the records below the log level for the ring buffer.
+
+    ``capture()`` puts a record on the queue as it is. The message is not formatted on the calling thread,
+    the listener formats it only if the ring buffer is written, so keeping a record costs a ``queue.put``.
+    Arguments of a captured record are formatted later and should not be changed after logging.
+    """
+
+    def capture(self, record: logging.LogRecord) -> None:
+        """
+        Puts a record below the log level on the queue for the ring buffer.
+
+        Args:
+            record (logging.LogRecord): Record.
+        """
+        self.enqueue(record)
+
+
+class LogQueue(metaclass=Singleton):
+    """Singleton that owns the logging queues and their listener threads."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._handlers: Dict[_QueueKey, QueueHandler] = {}
+        self._listeners: List[QueueListener] = []
+        atexit.register(self.stop)
+
+    def get_handler(
+        self, log_file: str, add_console: bool, level: int, log_format: str, json_file: str = "", ring_size: int = 0
+    ) -> logging.Handler:
+        """
+        Gets the queue handler for a log file. The handler and its listener are created on first use and then shared.
+
+        Args:
+            log_file (str): Log file. Empty string for no file.
+            add_console (bool): Also write to the console.
+            level (int): Log level. ``0`` for no logging.
+            log_format (str): Log format.
+            json_file (str, optional): Json lines file for timing records. Empty string for no file.
+            ring_size (int, optional): Number of records below ``level`` kept in memory and written to the log file
+                when an error is logged. ``0`` to not keep records. Defaults to ``0``.
+
+        Returns:
+            logging.Handler: Queue handler, or a ``NullHandler`` if there is nothing to log to.
+            When records are kept in a ring buffer it is a ``CaptureQueueHandler``.
+        """
+        use_file = bool(log_file) and level >= logging.DEBUG
+        use_console = add_console and level > 0
+        use_json = bool(json_file)
+        use_ring = use_file and ring_size > 0 and level > logging.DEBUG
+        if not use_file and not use_console and not use_json:
+            return logging.NullHandler()
+
+        key = _QueueKey(log_file, add_console, level, log_format, json_file, ring_size if use_ring else 0)
+        with self._lock:
+            handler = self._handlers.get(key)
+            if handler is not None:
+                return handler
+            formatter = logging.Formatter(log_format)
+            targets: List[logging.Handler] = []
+            if use_ring:
+                file_handler = self._get_file_handler(log_file, logging.DEBUG, formatter)
+                targets.append(RingBufferHandler(file_handler, capacity=ring_size, level=level))
+            elif use_file:
+                targets.append(self._get_file_handler(log_file, level, formatter))
+            if use_console:
+                targets.append(self._get_console_handler(level, formatter))
+            if use_json:
+                targets.append(self._get_json_handler(json_file))
+
+            q: queue.SimpleQueue = queue.SimpleQueue()
+            handler = CaptureQueueHandler(q) if use_ring else QueueHandler(q)  # type: ignore
+            listener = QueueListener(q, *targets, respect_handler_level=True)  # type: ignore
+            listener.start()
+            self._handlers[key] = handler
+            self._listeners.append(listener)
+            return handler
+
+    def stop(self) -> None:
+        """Writes any queued records and stops the listener threads."""
+        with self._lock:
+            listeners = self._listeners
+            self._listeners = []
+            self._handlers = {}
+        for listener in listeners:
+            listener.stop()
+            for handler in listener.handlers:
+                handler.close()
+
+    def _get_console_handler(self, level: int, formatter: logging.Formatter) -> logging.Handler:
+        console_handler = logging.StreamHandler(sys.stdout)
+        console_handler.setFormatter(formatter)
+        console_handler.setLevel(level)
+        return console_handler
+
+    def _get_file_handler(self, log_file: str, level: int, formatter: logging.Formatter) -> logging.Handler:
+        file_handler = TimedRotatingFileHandler(
+            log_file, when="W0", interval=1, backupCount=3, encoding="utf8", delay=True
+        )
+        file_handler.setFormatter(formatter)
+        file_handler.setLevel(level)
+        return file_handler
+
+    def _get_json_handler(self, json_file: str) -> logging.Handler:
+        # timing records are written regardless of the log level.
+        json_handler = TimedRotatingFileHandler(
+            json_file, when="W0", interval=1, backupCount=3, encoding="utf8", delay=True
+        )
+        json_handler.setFormatter(JsonFormatter())
+        json_handler.addFilter(TimingFilter())
+        return json_handler
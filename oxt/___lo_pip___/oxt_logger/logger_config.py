@@ -21,8 +21,9 @@ class LoggerConfig(metaclass=Singleton):
         self._lo_implementation_name = basic_config.lo_implementation_name
         # self._lo_implementation_name = settings.current_settings["lo_implementation_name"]
         configuration_settings = self._get_settings()
+        self._user_profile_path = file_util.get_user_profile_path(True)
         log_file = str(configuration_settings["LogFile"])
-        self._log_file = str(Path(file_util.get_user_profile_path(True), log_file))
+        self._log_file = str(Path(self._user_profile_path, log_file))
 
         self._log_format = str(configuration_settings["LogFormat"])
         self._log_name = str(configuration_settings["LogName"])
@@ -31,6 +32,12 @@ class LoggerConfig(metaclass=Singleton):
         self._log_level = self._get_log_level(log_level)
         self._log_ready_event_raised = False
         self._log_add_console = bool(configuration_settings["LogAddConsole"])
+        self._log_ring_buffer_size = basic_config.log_ring_buffer_size
+        log_json_file = basic_config.log_json_file
+        if log_json_file:
+            self._log_json_file = str(Path(self._user_profile_path, log_json_file))
+        else:
+            self._log_json_file = ""
 
     def _get_settings(self) -> Dict[str, Any]:
         # sourcery skip: dict-assign-update-to-union
@@ -85,6 +92,11 @@ class LoggerConfig(metaclass=Singleton):
         """Gets if a console logger should be added to logging."""
         return self._log_add_console
 
+    @property
+    def user_profile_path(self) -> str:
+        """Gets the LibreOffice user profile folder."""
+        return self._user_profile_path
+
     @property
     def log_file(self) -> str:
         """
@@ -94,6 +106,24 @@ class LoggerConfig(metaclass=Singleton):
         """
         return self._log_file
 
+    @property
+    def log_json_file(self) -> str:
+        """
+        Gets the json lines file for timing records. Empty string if not set.
+
+        The value for this property can be set in pyproject.toml (tool.oxt.config.log_json_file)
+        """
+        return self._log_json_file
+
+    @property
+    def log_ring_buffer_size(self) -> int:
+        """
+        Gets the number of debug records kept in memory and written to the log file when an error is logged.
+
+        The value for this property can be set in pyproject.toml (tool.oxt.config.log_ring_buffer_size)
+        """
+        return self._log_ring_buffer_size
+
     @property
     def log_format(self) -> str:
         """
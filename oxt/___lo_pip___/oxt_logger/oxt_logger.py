@@ -1,10 +1,13 @@
+from __future__ import annotations
+from typing import Any, Dict, Tuple
 import logging
 import sys
+import threading
 from logging import Logger
-from logging.handlers import TimedRotatingFileHandler
 
 # from .. import config
 from .logger_config import LoggerConfig
+from .log_queue import CaptureQueueHandler, LogQueue
 
 
 # https://stackoverflow.com/questions/13521981/implementing-an-optional-logger-in-code
@@ -16,6 +19,8 @@ class OxtLogger(Logger):
         """
         Creates a logger.
 
+        Prefer ``get_logger()``, which reuses loggers by name, over creating a new logger.
+
         Each time a logger is created it will raise the ``LogNamedEvent.LOGGING_READY`` event,
         unless the ``trigger`` keyword argument is set to ``False``.
         If you are creating a logger from the ``LogNamedEvent.LOGGING_READY`` event handler, then set ``trigger`` to ``False``;
@@ -43,18 +48,18 @@ class OxtLogger(Logger):
         # Logger.__init__(self, name=log_name, level=cfg.log_level)
         super().__init__(name=log_name, level=self._config.log_level)
 
-        has_handler = False
-
-        if self._log_file and self._config.log_level >= 10:  # DEBUG
-            self.addHandler(self._get_file_handler())
-            has_handler = True
-
-        if self._config.log_add_console and self._config.log_level > 0:
-            self.addHandler(self._get_console_handler())
-            has_handler = True
-
-        if not has_handler:
-            self.addHandler(self._get_null_handler())
+        # all loggers share one queue handler per log file, a single listener thread writes the records.
+        handler = LogQueue().get_handler(
+            log_file=self._log_file,
+            add_console=self._config.log_add_console,
+            level=self._config.log_level,
+            log_format=self._config.log_format,
+            json_file=self._config.log_json_file,
+            ring_size=self._config.log_ring_buffer_size,
+        )
+        self.addHandler(handler)
+        # records below the log level go to the ring buffer through capture(), see _capture().
+        self._capture_handler = handler if isinstance(handler, CaptureQueueHandler) else None
 
         # with this pattern, it's rarely necessary to propagate the| error up to parent
         self.propagate = False
@@ -63,26 +68,116 @@ class OxtLogger(Logger):
         if trigger:
             self._config.trigger_log_ready_event()
 
-    def _get_console_handler(self):
-        console_handler = logging.StreamHandler(sys.stdout)
-        console_handler.setFormatter(self.formatter)
-        console_handler.setLevel(self._config.log_level)
-        return console_handler
-    
-    def _get_null_handler(self):
-        return logging.NullHandler()
-
-    def _get_file_handler(self):
-        log_file = self._log_file
-        file_handler = TimedRotatingFileHandler(
-            log_file, when="W0", interval=1, backupCount=3, encoding="utf8", delay=True
+    def _capture(self, level: int, msg: object, args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> None:
+        """
+        Keeps a record below the log level for the ring buffer.
+
+        The caller is not looked up and the message is not formatted, the record is only formatted if it is written.
+        """
+        exc_info = kwargs.get("exc_info")
+        if exc_info:
+            if isinstance(exc_info, BaseException):
+                exc_info = (type(exc_info), exc_info, exc_info.__traceback__)
+            elif not isinstance(exc_info, tuple):
+                exc_info = sys.exc_info()
+        record = self.makeRecord(
+            self.name, level, "(unknown file)", 0, msg, args, exc_info or None, extra=kwargs.get("extra")
         )
-        # file_handler = logging.FileHandler(log_file, mode="w", encoding="utf8", delay=True)
-        file_handler.setFormatter(self.formatter)
-        file_handler.setLevel(self._config.log_level)
-        return file_handler
+        self._capture_handler.capture(record)  # type: ignore
+
+    def debug(self, msg: object, *args: Any, **kwargs: Any) -> None:
+        if self.isEnabledFor(logging.DEBUG):
+            self._log(logging.DEBUG, msg, args, **kwargs)
+        elif self._capture_handler is not None:
+            self._capture(logging.DEBUG, msg, args, kwargs)
+
+    def info(self, msg: object, *args: Any, **kwargs: Any) -> None:
+        if self.isEnabledFor(logging.INFO):
+            self._log(logging.INFO, msg, args, **kwargs)
+        elif self._capture_handler is not None:
+            self._capture(logging.INFO, msg, args, kwargs)
+
+    def warning(self, msg: object, *args: Any, **kwargs: Any) -> None:
+        if self.isEnabledFor(logging.WARNING):
+            self._log(logging.WARNING, msg, args, **kwargs)
+        elif self._capture_handler is not None:
+            self._capture(logging.WARNING, msg, args, kwargs)
 
     @property
     def log_file(self):
         """Log file path."""
         return self._log_file
+
+    @property
+    def is_debug(self) -> bool:
+        """
+        Gets if debug messages are logged.
+
+        Use it to skip building debug output that is expensive, such as output that needs UNO calls.
+        For plain messages pass ``%`` style arguments, ``logger.debug("Path: %s", pth)``,
+        so the message is only formatted when it is logged.
+
+        This follows the configured log level. Debug records kept for the ring buffer do not make it ``True``.
+        The ``NONE`` log level is ``0``, which ``isEnabledFor()`` treats as logging everything, so it is checked here.
+        """
+        return 0 < self.level <= logging.DEBUG
+
+    def log_timing(self, phase: str, duration: float, package: str = "", result: str = "", msg: str = "") -> None:
+        """
+        Logs how long a phase took.
+
+        The record is logged at ``INFO`` level and, when ``log_json_file`` is set, is always written to the json lines file
+        with ``phase``, ``duration``, ``package`` and ``result`` fields, even when the log level is higher than ``INFO``.
+
+        Args:
+            phase (str): Phase such as ``execute`` or ``install``.
+            duration (float): Duration in seconds.
+            package (str, optional): Package the phase applies to. Defaults to "".
+            result (str, optional): Result such as ``ok`` or ``failed``. Defaults to "".
+            msg (str, optional): Human readable message. Defaults to a message built from the other arguments.
+        """
+        if not self._config.log_json_file and not self.isEnabledFor(logging.INFO):
+            return
+        extra = {"phase": phase, "duration": round(duration, 3), "package": package, "result": result}
+        if msg:
+            args = ()
+        else:
+            msg = "Timing - phase: %s, package: %s, result: %s, duration: %.3f seconds"
+            args = (phase, package, result, duration)
+        # handle() skips the level check so the json file gets the record.
+        # the human readable handlers still apply the log level.
+        record = self.makeRecord(self.name, logging.INFO, "(timing)", 0, msg, args, None, extra=extra)
+        self.handle(record)
+
+
+_loggers: Dict[Tuple[str, str], OxtLogger] = {}
+_loggers_lock = threading.Lock()
+
+
+def get_logger(log_name: str = "", log_file: str = "", trigger: bool = True) -> OxtLogger:
+    """
+    Gets a logger from the logger registry.
+
+    The first call for a name creates the logger and raises the ``LogNamedEvent.LOGGING_READY`` event.
+    Following calls for the same name return the same logger and do not raise the event.
+
+    Args:
+        log_name (str, optional): Log Name. Defaults to configuration value.
+        log_file (str, optional): Log file. Defaults to configuration value.
+        trigger (bool, optional): Trigger log ready event when the logger is created. Defaults to True.
+            Set to ``False`` when called from a ``LogNamedEvent.LOGGING_READY`` event handler.
+
+    Returns:
+        OxtLogger: Logger.
+    """
+    key = (log_name, log_file)
+    with _loggers_lock:
+        logger = _loggers.get(key)
+        if logger is not None:
+            return logger
+        logger = OxtLogger(log_file=log_file, log_name=log_name, trigger=False)
+        _loggers[key] = logger
+    # raised outside the lock, handlers may get a logger of their own.
+    if trigger:
+        logger._config.trigger_log_ready_event()
+    return logger
@@ -0,0 +1,58 @@
+"""
+Keeps the records below the log level in memory and writes them only when an error is logged.
+
+With a production log level such as ``ERROR`` the debug records that lead up to a failure are normally lost.
+``RingBufferHandler`` keeps the last records in a bounded ring buffer. Adding a record is a ``deque.append``,
+nothing is written until an error is logged, then the buffered records are written ahead of the error.
+"""
+from __future__ import annotations
+from typing import Deque
+from collections import deque
+import logging
+
+
+class RingBufferHandler(logging.Handler):
+    """Buffers records below a level and passes them to a target handler when an error is logged."""
+
+    def __init__(self, target: logging.Handler, capacity: int, level: int, flush_level: int = logging.ERROR) -> None:
+        """
+        Constructor
+
+        Args:
+            target (logging.Handler): Handler that records are passed to.
+            capacity (int): Maximum number of buffered records. Older records are dropped.
+            level (int): Records at or above this level are passed to ``target`` right away.
+            flush_level (int, optional): A record at or above this level writes the buffer. Defaults to ``ERROR``.
+        """
+        super().__init__()
+        self._target = target
+        self._pass_level = level
+        self._flush_level = max(flush_level, level)
+        self._buffer: Deque[logging.LogRecord] = deque(maxlen=capacity)
+
+    def emit(self, record: logging.LogRecord) -> None:
+        # emit() is called with the handler lock held.
+        if record.levelno >= self._flush_level:
+            self.flush()
+        if record.levelno >= self._pass_level:
+            self._target.handle(record)
+        else:
+            self._buffer.append(record)
+
+    def flush(self) -> None:
+        """Passes the buffered records to the target handler."""
+        with self.lock:  # type: ignore
+            while self._buffer:
+                self._target.handle(self._buffer.popleft())
+
+    def close(self) -> None:
+        """Drops the buffered records and closes the target handler."""
+        with self.lock:  # type: ignore
+            self._buffer.clear()
+        self._target.close()
+        super().close()
+
+    @property
+    def buffered(self) -> int:
+        """Gets the number of buffered records."""
+        return len(self._buffer)
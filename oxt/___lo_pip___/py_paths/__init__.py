@@ -1,4 +1,9 @@
+from .path_glob import PathGlobCache as PathGlobCache
 from .path_item import PathItem as PathItem
 from .path_items import PathItems as PathItems
+from .path_normalizer import PathNormalizer as PathNormalizer
+from .path_verifier import PathVerifier as PathVerifier
+from .venv_discovery import VenvDiscovery as VenvDiscovery
+from .venv_discovery import VenvInfo as VenvInfo
 
-__all__ = ["PathItem", "PathItems"]
+__all__ = ["PathGlobCache", "PathItem", "PathItems", "PathNormalizer", "PathVerifier", "VenvDiscovery", "VenvInfo"]
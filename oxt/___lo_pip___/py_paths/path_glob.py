@@ -0,0 +1,235 @@
+"""
+Python path entries with glob patterns such as ``~/envs/*/lib/python3.*/site-packages``.
+
+A pattern is expanded one path part at a time. Every directory that is looked at is recorded with its mtime,
+adding or removing an entry in a directory changes its mtime. An expansion is reused while all the recorded
+directories keep their mtime, so a launch that finds nothing changed costs one stat per directory
+instead of listing them again.
+"""
+from __future__ import annotations
+from typing import Any, Dict, Iterable, List, Set, Tuple
+from pathlib import Path
+import fnmatch
+import json
+import os
+import re
+import threading
+
+from ..input_output.atomic_file import write_json_atomic
+
+_MAGIC = re.compile("[*?[]")
+
+CACHE_VERSION = 1
+MISSING = -1
+"""Recorded mtime of a directory that does not exist."""
+
+
+def is_glob_pattern(pth: str) -> bool:
+    """Gets if a path has glob wildcards, ``*``, ``?`` or ``[``."""
+    return _MAGIC.search(pth) is not None
+
+
+def dirs_unchanged(dirs: Dict[str, int]) -> bool:
+    """
+    Gets if recorded paths still have their mtime.
+
+    Args:
+        dirs (Dict[str, int]): Paths with their mtime in ns, ``MISSING`` for a path that did not exist.
+
+    Returns:
+        bool: ``True`` if no path changed. ``False`` if one changed or nothing is recorded.
+    """
+    if not dirs:
+        return False
+    for pth, mtime in dirs.items():
+        try:
+            current = os.stat(pth).st_mtime_ns
+        except OSError:
+            current = MISSING
+        if current != mtime:
+            return False
+    return True
+
+
+def expand_glob(pattern: str) -> Tuple[List[str], Dict[str, int]]:
+    """
+    Expands a glob pattern.
+
+    ``~`` is expanded and, as with ``glob``, names starting with ``.`` only match a part that starts with ``.``.
+
+    Args:
+        pattern (str): Pattern.
+
+    Returns:
+        Tuple[List[str], Dict[str, int]]: Sorted paths that match and the directories
+        looked at with their mtime in ns.
+    """
+    parts = Path(os.path.abspath(os.path.expanduser(pattern))).parts
+    # the literal parts ahead of the first wildcard are one base, its parents are not recorded,
+    # they change whenever something is added next to the base such as a file in the home folder.
+    first = next((i for i, part in enumerate(parts) if is_glob_pattern(part)), len(parts))
+    prefix = os.path.join(*parts[:first])
+    if not os.path.isdir(prefix):
+        # recorded as missing, creating it invalidates the expansion.
+        return [], {prefix: MISSING}
+    bases = [prefix]
+    dirs: Dict[str, int] = {}
+    for part in parts[first:]:
+        found: List[str] = []
+        for base in bases:
+            try:
+                dirs[base] = os.stat(base).st_mtime_ns
+            except OSError:
+                continue
+            if not is_glob_pattern(part):
+                found.append(os.path.join(base, part))
+                continue
+            try:
+                names = os.listdir(base)
+            except OSError:
+                continue
+            if not part.startswith("."):
+                names = [name for name in names if not name.startswith(".")]
+            found.extend(os.path.join(base, name) for name in fnmatch.filter(names, part))
+        bases = found
+    return sorted(pth for pth in bases if os.path.exists(pth)), dirs
+
+
+class PathGlobCache:
+    """
+    Expands glob patterns and reuses the expansion while the directories it looked at are unchanged.
+
+    The cache is saved to a json file so it is reused on the next launch.
+    Only the patterns expanded since the cache was loaded are saved.
+
+    A pattern under a dead network mount blocks the stat of the cache check and the listing of the expansion.
+    ``expand_all()`` can be given a deadline, the patterns are then expanded on a daemon thread and a pattern that
+    is not expanded in time has no matches.
+    """
+
+    def __init__(self, file: str | Path | None = None) -> None:
+        """
+        Constructor
+
+        Args:
+            file (str | Path, optional): Cache file. If omitted the cache is only kept in memory.
+        """
+        self._file = None if file is None else Path(file)
+        self._lock = threading.Lock()
+        self._entries = self._load()
+        self._used: Set[str] = set()
+        self._changed = False
+        self._hits = 0
+        self._misses = 0
+        self._timeouts = 0
+
+    def _load(self) -> Dict[str, Any]:
+        if self._file is None:
+            return {}
+        try:
+            with open(self._file, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(data, dict) or data.get("version") != CACHE_VERSION:
+            return {}
+        patterns = data.get("patterns")
+        return patterns if isinstance(patterns, dict) else {}
+
+    def _is_current(self, entry: Any) -> bool:
+        if not isinstance(entry, dict) or not isinstance(entry.get("paths"), list):
+            return False
+        dirs = entry.get("dirs")
+        return isinstance(dirs, dict) and dirs_unchanged(dirs)
+
+    def expand(self, pattern: str) -> List[str]:
+        """
+        Expands a glob pattern.
+
+        Args:
+            pattern (str): Pattern.
+
+        Returns:
+            List[str]: Sorted paths that match.
+        """
+        with self._lock:
+            self._used.add(pattern)
+            entry = self._entries.get(pattern)
+        if self._is_current(entry):
+            with self._lock:
+                self._hits += 1
+            return [str(pth) for pth in entry["paths"]]
+        paths, dirs = expand_glob(pattern)
+        with self._lock:
+            self._misses += 1
+            self._entries[pattern] = {"paths": paths, "dirs": dirs}
+            self._changed = True
+        return paths
+
+    def expand_all(self, paths: Iterable[str], timeout: float | None = None) -> List[str]:
+        """
+        Expands the glob patterns in a list of paths.
+
+        Args:
+            paths (Iterable[str]): Paths and patterns.
+            timeout (float, optional): Seconds to wait for the patterns. A pattern that is not expanded in time
+                has no matches. Defaults to waiting for all patterns on the calling thread.
+
+        Returns:
+            List[str]: Paths, each pattern replaced by the paths it matches.
+        """
+        paths = list(paths)
+        patterns = [pth for pth in dict.fromkeys(paths) if is_glob_pattern(pth)]
+        expanded = self._expand_patterns(patterns, timeout)
+        result: List[str] = []
+        for pth in paths:
+            if is_glob_pattern(pth):
+                result.extend(expanded.get(pth, []))
+            else:
+                result.append(pth)
+        return result
+
+    def _expand_patterns(self, patterns: List[str], timeout: float | None) -> Dict[str, List[str]]:
+        if timeout is None or not patterns:
+            return {pattern: self.expand(pattern) for pattern in patterns}
+        results: Dict[str, List[str]] = {}
+        results_lock = threading.Lock()
+
+        def work() -> None:
+            for pattern in patterns:
+                paths = self.expand(pattern)
+                with results_lock:
+                    results[pattern] = paths
+
+        # a daemon thread, a stat that hangs on a dead mount must not block shutdown.
+        t = threading.Thread(target=work, name="lo_pip_path_glob", daemon=True)
+        t.start()
+        t.join(timeout)
+        with results_lock:
+            done = dict(results)
+        with self._lock:
+            self._timeouts += len(patterns) - len(done)
+        return done
+
+    def save(self) -> None:
+        """Saves the cache if it changed. Errors are ignored, without a cache the patterns are expanded again."""
+        with self._lock:
+            if self._file is None or not (self._changed or set(self._entries) != self._used):
+                return
+            patterns = {k: v for k, v in self._entries.items() if k in self._used}
+        write_json_atomic(self._file, {"version": CACHE_VERSION, "patterns": patterns})
+
+    @property
+    def hits(self) -> int:
+        """Gets the number of patterns served from the cache."""
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        """Gets the number of patterns that were expanded."""
+        return self._misses
+
+    @property
+    def timeouts(self) -> int:
+        """Gets the number of patterns that were not expanded before the deadline."""
+        return self._timeouts
@@ -1,17 +1,34 @@
 from __future__ import annotations
-import contextlib
-from typing import List, Set, Sequence
+from typing import Dict, Iterable, List, Mapping, Set, Sequence
 from .path_item import PathItem
+from .path_normalizer import get_lexical_key
+
+
+def _get_key(pth: str) -> str:
+    """
+    Gets the key of a path, ``~/x`` and ``/home/user/x/`` have the same key.
+
+    The key is worked out from the path text only so building a collection does not stall on a dead network mount.
+    A symlink and its target have different keys, py_runner resolves symlinks once the paths are verified.
+    """
+    return get_lexical_key(pth)
 
 
 class PathItems:
-    """Represents a collection of path item."""
+    """
+    Represents a collection of path item.
+
+    The items are kept in an ordered dict keyed by normalized path,
+    so finding, adding and removing a path does not scan the collection and a path is only added once.
+    Items keep the path as it was given.
+    The ``sort_order`` of the items is renumbered when it is next read, not on every change.
+    """
 
     def __init__(self, items: Sequence[str] | None = None) -> None:
-        self._paths: List[PathItem] = []
+        self._paths: Dict[str, PathItem] = {}
+        self._sort_order_dirty = False
         if items:
-            for i, pth in enumerate(items):
-                self._paths.append(PathItem(pth, i + 1))
+            self.extend(items)
         self._iter_index = 0
 
     def __eq__(self, value: object) -> bool:
@@ -24,10 +41,19 @@ class PathItems:
         """Returns the length of the collection."""
         return len(self._paths)
 
+    def __contains__(self, pth: object) -> bool:
+        """Returns True if the path or path item is in the collection."""
+        if isinstance(pth, PathItem):
+            return self._paths.get(_get_key(pth.path)) is pth
+        if isinstance(pth, str) and pth:
+            return _get_key(pth) in self._paths
+        return False
+
     def __iter__(self):
+        items = self._get_items()
         self._iter_index = 0
-        while self._iter_index < len(self):
-            yield self._paths[self._iter_index]
+        while self._iter_index < len(items):
+            yield items[self._iter_index]
             self._iter_index += 1
 
     def __next__(self):
@@ -35,117 +61,206 @@ class PathItems:
             raise StopIteration
         else:
             self._iter_index += 1
-            return self._paths[self._iter_index - 1]
+            return self._get_items()[self._iter_index - 1]
 
     def __reversed__(self):
-        self._iter_index = len(self) - 1
+        items = self._get_items()
+        self._iter_index = len(items) - 1
         while self._iter_index >= 0:
-            yield self._paths[self._iter_index]
+            yield items[self._iter_index]
             self._iter_index -= 1
 
+    def _get_items(self) -> List[PathItem]:
+        """Gets the path items in order with an up to date sort order."""
+        self._update_sort_order()
+        return list(self._paths.values())
+
+    def _set_items(self, items: Sequence[PathItem]) -> None:
+        """Replaces the path items, keeping the first item of a duplicate path."""
+        self._paths = {}
+        for item in items:
+            self._paths.setdefault(_get_key(item.path), item)
+        self._sort_order_dirty = True
+
     def add(self, path: PathItem) -> None:
         """Adds a path item to the collection."""
-        itm = self.find_path_item(path.path)
-        if not itm:
-            self._paths.append(path)
-            self._update_sort_order()
+        key = _get_key(path.path)
+        if key not in self._paths:
+            self._paths[key] = path
+            self._sort_order_dirty = True
 
     def add_path(self, pth: str) -> PathItem:
         """Adds a path item to the collection."""
-        itm = self.find_path_item(pth)
+        key = _get_key(pth)
+        itm = self._paths.get(key)
         if itm:
             return itm
-        else:
-            index = len(self._paths) + 1
-            pi = PathItem(pth, index)
-            self._paths.append(pi)
+        pi = PathItem(pth, len(self._paths) + 1)
+        self._paths[key] = pi
         return pi
 
+    def extend(self, paths: Iterable[str | PathItem]) -> None:
+        """
+        Adds paths or path items to the collection in one pass.
+
+        Paths already in the collection, or repeated in ``paths``, are skipped.
+
+        Args:
+            paths (Iterable[str | PathItem]): Paths or path items such as the lines of an imported file.
+        """
+        for pth in paths:
+            item = pth if isinstance(pth, PathItem) else PathItem(pth, 0)
+            if not item.path:
+                continue
+            key = _get_key(item.path)
+            if key not in self._paths:
+                self._paths[key] = item
+                item.sort_order = len(self._paths)
+
+    def remove_many(self, paths: Iterable[str | PathItem]) -> int:
+        """
+        Removes paths or path items from the collection in one pass.
+
+        Args:
+            paths (Iterable[str | PathItem]): Paths or path items.
+
+        Returns:
+            int: Number of path items removed.
+        """
+        count = 0
+        for pth in paths:
+            if isinstance(pth, PathItem):
+                key = _get_key(pth.path)
+                if self._paths.get(key) is not pth:
+                    continue
+            elif pth:
+                key = _get_key(pth)
+            else:
+                continue
+            if self._paths.pop(key, None) is not None:
+                count += 1
+        if count:
+            self._sort_order_dirty = True
+        return count
+
+    def reorder(self, mapping: Mapping[str, int]) -> None:
+        """
+        Moves path items to new positions in one pass.
+
+        Args:
+            mapping (Mapping[str, int]): Path to new sort order. Path items that are not in the mapping keep
+                their current sort order, ties keep the current order.
+        """
+        self._update_sort_order()
+        orders = {_get_key(pth): order for pth, order in mapping.items() if pth}
+        items = sorted(
+            enumerate(self._paths.items()),
+            key=lambda x: (orders.get(x[1][0], x[1][1].sort_order), x[0]),
+        )
+        self._paths = {key: item for _, (key, item) in items}
+        self._sort_order_dirty = True
+
+    def merge(self, paths: PathItems | Iterable[str]) -> None:
+        """
+        Adds the paths of another collection that are not in this collection, in place.
+
+        Args:
+            paths (PathItems | Iterable[str]): Other collection or paths.
+        """
+        self.extend(paths.get_as_tuple() if isinstance(paths, PathItems) else paths)
+
     def remove(self, path: PathItem) -> None:
         """Removes a path item from the collection."""
-        with contextlib.suppress(ValueError):
-            self._paths.remove(path)
-            self._update_sort_order()
+        key = _get_key(path.path)
+        if self._paths.get(key) is path:
+            del self._paths[key]
+            self._sort_order_dirty = True
 
     def remove_path(self, pth: str) -> None:
         """Removes a path item from the collection."""
         if not pth:
             return
-        for path in self._paths:
-            if path.path == pth:
-                self._paths.remove(path)
-                self._update_sort_order()
+        if self._paths.pop(_get_key(pth), None) is not None:
+            self._sort_order_dirty = True
 
     def find_path_item(self, pth: str) -> PathItem | None:
         """Gets a path item from the collection."""
         if not pth:
             return None
-        for path in self._paths:
-            if path.path == pth:
-                return path
-        return None
+        return self._paths.get(_get_key(pth))
 
     def sort(self) -> None:
         """Sorts the path items by sort order."""
-        self._paths.sort(key=lambda x: x.sort_order)
+        self._update_sort_order()
+        self._set_items(sorted(self._paths.values(), key=lambda x: x.sort_order))
 
     def _update_sort_order(self) -> None:
-        """Updates the sort order of the path items."""
-        for i, path in enumerate(self._paths):
+        """Updates the sort order of the path items if the collection changed since the last update."""
+        if not self._sort_order_dirty:
+            return
+        for i, path in enumerate(self._paths.values()):
             path.sort_order = i + 1
+        self._sort_order_dirty = False
+
+    def _swap(self, index1: int, index2: int) -> None:
+        items = list(self._paths.values())
+        items[index1], items[index2] = items[index2], items[index1]
+        self._set_items(items)
+
+    def _index(self, path: PathItem) -> int:
+        if path not in self:
+            raise ValueError(f"{path.path} is not in the collection")
+        return list(self._paths.values()).index(path)
 
     def move_up(self, path: PathItem) -> None:
         """Moves a path item up in the sort order."""
-        index = self._paths.index(path)
+        index = self._index(path)
         if index > 0:
-            self._paths[index - 1], self._paths[index] = self._paths[index], self._paths[index - 1]
-            self._update_sort_order()
+            self._swap(index - 1, index)
 
     def move_down(self, path: PathItem) -> None:
         """Moves a path item down in the sort order."""
-        index = self._paths.index(path)
+        index = self._index(path)
         if index < len(self._paths) - 1:
-            self._paths[index + 1], self._paths[index] = self._paths[index], self._paths[index + 1]
-            self._update_sort_order()
+            self._swap(index, index + 1)
 
     def get_as_path_set(self) -> Set[str]:
         """Gets the path items as a set."""
-        return set(p.path for p in self._paths)
+        return set(p.path for p in self._paths.values())
 
     def get_as_item_set(self) -> Set[PathItem]:
         """Gets the path items as a set."""
-        return set(path for path in self._paths)
+        return set(self._get_items())
 
     def get_as_tuple(self) -> tuple[str, ...]:
         """Gets the path items as a tuple."""
-        return tuple(path.path for path in self._paths)
+        return tuple(path.path for path in self._paths.values())
 
     def update_from_set(self, paths: Set[PathItem]) -> None:
         """Updates the path items from a set."""
-        self._paths = list(paths)
-        self.sort()
+        self._set_items(sorted(paths, key=lambda x: x.sort_order))
 
     def clone(self) -> PathItems:
         """Clones the path items."""
-        return PathItems(self.get_as_tuple())
+        items = PathItems()
+        items.extend(self.get_as_tuple())
+        return items
 
     def union(self, paths: PathItems) -> PathItems:
         """Returns the union of the path items."""
-        items = PathItems(self.get_as_tuple() + paths.get_as_tuple())
-        items.remove_duplicates()
+        items = self.clone()
+        items.merge(paths)
         return items
 
     def clear(self) -> None:
         """Clears the path items."""
         self._paths.clear()
+        self._sort_order_dirty = False
 
     def remove_duplicates(self) -> None:
-        """Removes duplicate path items by path."""
-        orig = self.clone()
-        found = set()
-        self.clear()
-        for p in orig:
-            if p.path not in found:
-                self._paths.append(p)
-                found.add(p.path)
-        self.sort()
+        """
+        Removes duplicate path items by path.
+
+        The collection is keyed by path so it never holds duplicates, this only brings the sort order up to date.
+        """
+        self._update_sort_order()
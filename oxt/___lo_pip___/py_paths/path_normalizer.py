@@ -0,0 +1,131 @@
+from __future__ import annotations
+from typing import Dict, Iterable, List, Tuple
+from pathlib import Path
+import os
+import threading
+import time
+
+from ..meta.singleton import Singleton
+
+
+def get_lexical_key(pth: str | Path) -> str:
+    """
+    Gets the key of a path from its text only, ``~/x`` and ``/home/user/x/`` have the same key.
+
+    Nothing is read from the file system, so it can not stall on a dead network mount.
+    A symlink and its target have different keys, see ``PathNormalizer`` to resolve symlinks.
+
+    Args:
+        pth (str | Path): Path.
+
+    Returns:
+        str: Key.
+    """
+    return os.path.normcase(os.path.normpath(os.path.abspath(os.path.expanduser(str(pth)))))
+
+
+class PathNormalizer(metaclass=Singleton):
+    """
+    Singleton Class. Turns the spellings of a path into one canonical path.
+
+    ``~/x``, ``/home/user/x/`` and a symlink to ``/home/user/x`` are one path,
+    registering each of them adds an entry to ``sys.path`` that is searched on every import.
+    A path is expanded, made absolute, stripped of trailing separators and resolved with ``realpath``.
+    ``realpath`` needs a stat for each part of the path, a path on a dead network mount blocks it,
+    so only pass paths that have been checked with ``PathVerifier``.
+    Resolved paths are cached for ``ttl`` seconds so a symlink that is pointed elsewhere is picked up again.
+    """
+
+    def __init__(self, ttl: float = 30.0) -> None:
+        """
+        Constructor
+
+        Args:
+            ttl (float, optional): Seconds a resolved path is cached. Defaults to ``30.0``.
+        """
+        self._ttl = ttl
+        self._lock = threading.Lock()
+        self._real_paths: Dict[str, Tuple[str, float]] = {}
+        self._hits = 0
+        self._misses = 0
+
+    def normalize(self, pth: str | Path) -> str:
+        """
+        Gets the canonical path.
+
+        Args:
+            pth (str | Path): Path such as ``~/x`` or ``/home/user/x/``.
+
+        Returns:
+            str: Canonical path. An empty path is returned as is.
+        """
+        pth = str(pth)
+        if not pth:
+            return pth
+        expanded = os.path.abspath(os.path.expanduser(pth))
+        now = time.monotonic()
+        with self._lock:
+            cached = self._real_paths.get(expanded)
+            if cached is not None and cached[1] > now:
+                self._hits += 1
+                return cached[0]
+            self._misses += 1
+        real_path = os.path.realpath(expanded)
+        with self._lock:
+            self._real_paths[expanded] = (real_path, now + self._ttl)
+        return real_path
+
+    def get_key(self, pth: str | Path) -> str:
+        """
+        Gets the key used to compare paths, the canonical path case folded on case insensitive platforms.
+
+        Args:
+            pth (str | Path): Path.
+
+        Returns:
+            str: Key.
+        """
+        return os.path.normcase(self.normalize(pth))
+
+    def dedupe(self, paths: Iterable[str | Path], resolve: bool = True) -> Tuple[List[str], Dict[str, List[str]]]:
+        """
+        Removes the paths that are another spelling of an earlier path.
+
+        Args:
+            paths (Iterable[str | Path]): Paths.
+            resolve (bool, optional): Resolve symlinks. If ``False`` the paths are compared with ``get_lexical_key()``
+                and the file system is not read. Defaults to ``True``.
+
+        Returns:
+            Tuple[List[str], Dict[str, List[str]]]: Paths that are kept, in order, and the duplicates that were
+            collapsed keyed by the path they were collapsed into.
+        """
+        kept: Dict[str, str] = {}
+        collapsed: Dict[str, List[str]] = {}
+        for pth in paths:
+            pth = str(pth)
+            if not pth:
+                continue
+            key = self.get_key(pth) if resolve else get_lexical_key(pth)
+            if key in kept:
+                collapsed.setdefault(kept[key], []).append(pth)
+            else:
+                kept[key] = pth
+        return list(kept.values()), collapsed
+
+    def clear(self) -> None:
+        """Clears the cache of resolved paths and the counters."""
+        with self._lock:
+            self._real_paths.clear()
+            self._hits = 0
+            self._misses = 0
+
+    @property
+    def hits(self) -> int:
+        """Gets the number of paths resolved from the cache."""
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        """Gets the number of paths resolved with ``realpath``."""
+        return self._misses
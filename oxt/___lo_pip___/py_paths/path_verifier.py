@@ -0,0 +1,114 @@
+from __future__ import annotations
+from typing import Dict, Iterable, List, Set
+import os
+import queue
+import threading
+import time
+
+from ..meta.singleton import Singleton
+
+
+class PathVerifier(metaclass=Singleton):
+    """
+    Singleton Class. Checks that paths exist, in parallel and with a deadline.
+
+    A path on a dead network mount can block a stat for the full mount timeout.
+    Paths are put on a queue that is read by at most ``max_workers`` daemon threads and a path that does not answer
+    before the deadline is treated as missing. ``ThreadPoolExecutor`` is not used, its threads are joined at exit
+    and a hung stat would block shutdown. A worker stuck on a dead mount still counts toward ``max_workers``.
+    A path that is still being checked is not checked again, it stays missing until the check finishes.
+    Paths that exist are cached for ``ttl`` seconds.
+    """
+
+    def __init__(self, timeout: float = 2.0, ttl: float = 30.0, max_workers: int = 8) -> None:
+        """
+        Constructor
+
+        Args:
+            timeout (float, optional): Seconds to wait for the paths. Defaults to ``2.0``.
+            ttl (float, optional): Seconds a path that exists is cached. Defaults to ``30.0``.
+            max_workers (int, optional): Maximum number of threads that check paths. Defaults to ``8``.
+        """
+        self._timeout = timeout
+        self._ttl = ttl
+        self._max_workers = max(1, max_workers)
+        self._lock = threading.Lock()
+        self._done = threading.Condition(self._lock)
+        self._queue: queue.SimpleQueue[str] = queue.SimpleQueue()
+        self._workers = 0
+        self._exists_until: Dict[str, float] = {}
+        self._pending: Set[str] = set()
+        self._results: Dict[str, bool] = {}
+
+    def _exists(self, pth: str) -> bool:
+        return os.path.exists(pth)
+
+    def _work(self) -> None:
+        while True:
+            pth = self._queue.get()
+            try:
+                exists = self._exists(pth)
+            except OSError:
+                exists = False
+            with self._done:
+                self._results[pth] = exists
+                if exists:
+                    self._exists_until[pth] = time.monotonic() + self._ttl
+                self._pending.discard(pth)
+                self._done.notify_all()
+
+    def verify(self, paths: Iterable[str], timeout: float | None = None) -> Dict[str, bool]:
+        """
+        Checks that paths exist.
+
+        Args:
+            paths (Iterable[str]): Paths.
+            timeout (float, optional): Seconds to wait for the paths. Defaults to the constructor value.
+
+        Returns:
+            Dict[str, bool]: ``True`` for each path that exists,
+            ``False`` for a path that is missing or did not answer in time.
+        """
+        timeout = self._timeout if timeout is None else timeout
+        result: Dict[str, bool] = {}
+        started: List[str] = []
+        started_set: Set[str] = set()
+        now = time.monotonic()
+        with self._lock:
+            for pth in paths:
+                if pth in result or pth in started_set:
+                    continue
+                if self._exists_until.get(pth, 0.0) > now:
+                    result[pth] = True
+                elif pth in self._pending:
+                    result[pth] = False
+                else:
+                    self._results.pop(pth, None)
+                    self._pending.add(pth)
+                    started.append(pth)
+                    started_set.add(pth)
+                    self._queue.put(pth)
+            # one worker per pending path, up to the limit. Workers wait on the queue for the next call.
+            while self._workers < min(self._max_workers, len(self._pending)):
+                threading.Thread(target=self._work, name="lo_pip_path_verify", daemon=True).start()
+                self._workers += 1
+        with self._done:
+            self._done.wait_for(lambda: self._pending.isdisjoint(started_set), timeout)
+            for pth in started:
+                result[pth] = self._results.pop(pth, False)
+        return result
+
+    def clear(self) -> None:
+        """Clears the cached paths."""
+        with self._lock:
+            self._exists_until.clear()
+
+    @property
+    def workers(self) -> int:
+        """Gets the number of worker threads."""
+        return self._workers
+
+    @property
+    def timeout(self) -> float:
+        """Gets the seconds to wait for the paths."""
+        return self._timeout
@@ -0,0 +1,220 @@
+"""
+Finds the virtual environments under root folders that match the LibreOffice python version.
+
+A virtual environment is a folder with a ``pyvenv.cfg`` file. The ``version`` (or ``version_info``) it records is
+matched on major and minor version and the ``site-packages`` folder of a matching environment can be registered.
+
+Each root is scanned down to ``max_depth`` levels. The folders looked at and the ``pyvenv.cfg`` files read are
+recorded with their mtime and a root is only scanned again when one of them changed.
+"""
+from __future__ import annotations
+from typing import Any, Dict, Iterable, List, NamedTuple, Tuple
+from pathlib import Path
+import json
+import os
+
+from ..input_output.atomic_file import write_json_atomic
+from .path_glob import dirs_unchanged
+
+VENV_CFG = "pyvenv.cfg"
+CACHE_VERSION = 1
+
+_SKIP_DIRS = {"__pycache__", "node_modules", "site-packages", ".git", ".hg", ".svn"}
+
+
+class VenvInfo(NamedTuple):
+    path: str
+    """Virtual environment folder."""
+    version: str
+    """Python version from ``pyvenv.cfg`` such as ``3.11.4``."""
+    site_packages: str
+    """``site-packages`` folder, empty if it was not found."""
+
+
+def get_venv_version(cfg_file: str | Path) -> str:
+    """
+    Gets the python version from a ``pyvenv.cfg`` file.
+
+    Args:
+        cfg_file (str | Path): ``pyvenv.cfg`` file.
+
+    Returns:
+        str: Version such as ``3.11.4``, empty if it can not be read.
+    """
+    values: Dict[str, str] = {}
+    try:
+        with open(cfg_file, "r", encoding="utf-8") as f:
+            for line in f:
+                key, sep, value = line.partition("=")
+                if sep:
+                    values[key.strip().lower()] = value.strip()
+    except (OSError, UnicodeDecodeError):
+        return ""
+    return values.get("version", "") or values.get("version_info", "")
+
+
+def get_major_minor(version: str) -> str:
+    """Gets the major and minor version such as ``3.11`` from a version such as ``3.11.4.final.0``."""
+    return ".".join(version.split(".")[:2])
+
+
+def get_site_packages(venv: str, version: str) -> str:
+    """
+    Gets the ``site-packages`` folder of a virtual environment.
+
+    Args:
+        venv (str): Virtual environment folder.
+        version (str): Python version of the environment.
+
+    Returns:
+        str: ``site-packages`` folder, empty if it does not exist.
+    """
+    candidates = (
+        os.path.join(venv, "lib", f"python{get_major_minor(version)}", "site-packages"),
+        os.path.join(venv, "Lib", "site-packages"),
+    )
+    return next((pth for pth in candidates if os.path.isdir(pth)), "")
+
+
+def scan_root(root: str, max_depth: int = 3) -> Tuple[List[VenvInfo], Dict[str, int]]:
+    """
+    Finds the virtual environments under a root folder.
+
+    Symbolic links are not followed and a virtual environment is not searched for nested environments.
+
+    Args:
+        root (str): Root folder.
+        max_depth (int, optional): Levels of folders below the root to search. Defaults to ``3``.
+
+    Returns:
+        Tuple[List[VenvInfo], Dict[str, int]]: Environments sorted by folder and the folders and
+        ``pyvenv.cfg`` files looked at with their mtime in ns.
+    """
+    venvs: List[VenvInfo] = []
+    dirs: Dict[str, int] = {}
+    level = [root]
+    for depth in range(max_depth + 1):
+        next_level: List[str] = []
+        for folder in level:
+            try:
+                dirs[folder] = os.stat(folder).st_mtime_ns
+                cfg_file = os.path.join(folder, VENV_CFG)
+                if os.path.isfile(cfg_file):
+                    dirs[cfg_file] = os.stat(cfg_file).st_mtime_ns
+                    version = get_venv_version(cfg_file)
+                    venvs.append(VenvInfo(folder, version, get_site_packages(folder, version)))
+                    continue
+                if depth == max_depth:
+                    continue
+                with os.scandir(folder) as it:
+                    for entry in it:
+                        if entry.name not in _SKIP_DIRS and entry.is_dir(follow_symlinks=False):
+                            next_level.append(entry.path)
+            except OSError:
+                continue
+        level = next_level
+    venvs.sort(key=lambda v: v.path)
+    return venvs, dirs
+
+
+class VenvDiscovery:
+    """
+    Finds the virtual environments that match a python version under root folders.
+
+    The scan of each root is cached in a json file and reused while none of the recorded folders changed,
+    so only the roots that changed are scanned again.
+    """
+
+    def __init__(self, python_major_minor: str, cache_file: str | Path | None = None, max_depth: int = 3) -> None:
+        """
+        Constructor
+
+        Args:
+            python_major_minor (str): Python version to match such as ``3.11``.
+            cache_file (str | Path, optional): Cache file. If omitted the cache is only kept in memory.
+            max_depth (int, optional): Levels of folders below a root to search. Defaults to ``3``.
+        """
+        self._version = python_major_minor
+        self._file = None if cache_file is None else Path(cache_file)
+        self._max_depth = max_depth
+        self._roots = self._load()
+        self._hits = 0
+        self._misses = 0
+
+    def _load(self) -> Dict[str, Any]:
+        if self._file is None:
+            return {}
+        try:
+            with open(self._file, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(data, dict) or data.get("version") != CACHE_VERSION:
+            return {}
+        if data.get("max_depth") != self._max_depth:
+            return {}
+        roots = data.get("roots")
+        return roots if isinstance(roots, dict) else {}
+
+    def _save(self) -> None:
+        if self._file is None:
+            return
+        write_json_atomic(self._file, {"version": CACHE_VERSION, "max_depth": self._max_depth, "roots": self._roots})
+
+    def scan(self, root: str) -> List[VenvInfo]:
+        """
+        Gets all the virtual environments under a root folder, from the cache if the root did not change.
+
+        Args:
+            root (str): Root folder, ``~`` is expanded.
+
+        Returns:
+            List[VenvInfo]: Environments sorted by folder.
+        """
+        root = os.path.abspath(os.path.expanduser(root))
+        entry = self._roots.get(root)
+        if isinstance(entry, dict) and isinstance(entry.get("dirs"), dict) and dirs_unchanged(entry["dirs"]):
+            try:
+                venvs = [VenvInfo(*v) for v in entry["venvs"]]
+                self._hits += 1
+                return venvs
+            except (KeyError, TypeError):
+                pass
+        self._misses += 1
+        venvs, dirs = scan_root(root, self._max_depth)
+        self._roots[root] = {"venvs": [list(v) for v in venvs], "dirs": dirs}
+        return venvs
+
+    def discover(self, roots: Iterable[str]) -> List[VenvInfo]:
+        """
+        Finds the virtual environments that match the python version and have a ``site-packages`` folder.
+
+        Args:
+            roots (Iterable[str]): Root folders.
+
+        Returns:
+            List[VenvInfo]: Matching environments in root order.
+        """
+        result: List[VenvInfo] = []
+        seen = set()
+        misses = self._misses
+        for root in roots:
+            for venv in self.scan(root):
+                if venv.path in seen or not venv.site_packages:
+                    continue
+                if get_major_minor(venv.version) == self._version:
+                    seen.add(venv.path)
+                    result.append(venv)
+        if self._misses != misses:
+            self._save()
+        return result
+
+    @property
+    def hits(self) -> int:
+        """Gets the number of roots served from the cache."""
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        """Gets the number of roots that were scanned."""
+        return self._misses
@@ -8,7 +8,12 @@ from ..py_paths import PathItems, PathItem
 
 
 class PyPathsSettings(metaclass=Singleton):
-    """Singleton Class. Manages Settings for Python Paths."""
+    """
+    Singleton Class. Manages Settings for Python Paths.
+
+    Each setter commits its own change. Set several values inside ``Configuration().batch()``
+    to commit them together and reload the settings once.
+    """
 
     def __init__(self) -> None:
         settings = Settings()
@@ -16,6 +21,7 @@ class PyPathsSettings(metaclass=Singleton):
         self._py_paths = PathItems(cast(Tuple, settings.current_settings.get("PyPathsList", ())))
         self._py_path_verify = bool(settings.current_settings.get("PyPathVerify", True))
         self._py_path_append = bool(settings.current_settings.get("PyPathAppend", True))
+        self._venv_roots = tuple(cast(Tuple, settings.current_settings.get("PyPathsVenvRoots", ())))
         self._node_value = f"/{settings.lo_implementation_name}.Settings/PyPaths"
 
     def append(self, pth: str) -> None:
@@ -59,3 +65,15 @@ class PyPathsSettings(metaclass=Singleton):
         settings: SettingsT = {"names": ("PyPathAppend",), "values": (value,)}
         self._configuration.save_configuration(node_value=self._node_value, settings=settings)
         self._py_path_append = value
+
+    @property
+    def venv_roots(self) -> Tuple[str, ...]:
+        """Gets/Sets the folders that are searched for virtual environments."""
+        return self._venv_roots
+
+    @venv_roots.setter
+    def venv_roots(self, value: Tuple[str, ...]) -> None:
+        self._configuration.save_configuration_str_lst(
+            node_value=self._node_value, name="PyPathsVenvRoots", value=tuple(value)
+        )
+        self._venv_roots = tuple(value)
@@ -4,7 +4,7 @@ import uno
 
 from ..lo_util.configuration import Configuration
 from ..meta.singleton import Singleton
-from ..oxt_logger import OxtLogger
+from ..oxt_logger import OxtLogger, get_logger
 from ..basic_config import BasicConfig
 
 from ..events.lo_events import Events
@@ -44,7 +44,7 @@ class Settings(metaclass=Singleton):
             # if so, we'll get a logger when the event is raised.
             # it is critical that trigger=False, otherwise we'll get an infinite loop.
             if self._logger is None:
-                self._logger = OxtLogger(log_name=__name__, trigger=False)
+                self._logger = get_logger(log_name=__name__, trigger=False)
                 self._logger.debug("Created Logger.")
 
         # keep callbacks in scope
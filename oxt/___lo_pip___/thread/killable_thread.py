@@ -26,7 +26,7 @@ class KillableThread(threading.Thread):
 
             @run_in_thread
             def actual_log_progress() -> None:
-                logger = OxtLogger(log_name=__name__)
+                logger = get_logger(log_name=__name__)
                 logger.debug("Log_progress: Start")
                 my_progress = KillableThread(target=log_runner, args=(logger,))
                 my_progress.start()
@@ -19,7 +19,7 @@ def run_in_thread(fn: Callable[..., Any]) -> Callable[..., threading.Thread]:
 
             @run_in_thread
             def actual_log_progress() -> None:
-                logger = OxtLogger(log_name=__name__)
+                logger = get_logger(log_name=__name__)
                 logger.debug("Log_progress: Start")
                 my_progress = KillableThread(target=log_runner, args=(logger,))
                 my_progress.start()
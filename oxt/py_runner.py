@@ -1,7 +1,7 @@
 # region imports
 from __future__ import unicode_literals, annotations
 import contextlib
-from typing import TYPE_CHECKING, Any, cast, Tuple
+from typing import TYPE_CHECKING, Any, cast, Set, Tuple
 from pathlib import Path
 import uno
 import unohelper
@@ -45,6 +45,10 @@ from ___lo_pip___.events.named_events.startup_events import StartupNamedEvent
 from ___lo_pip___.events.startup.startup_monitor import StartupMonitor
 from ___lo_pip___.install.install_pip import InstallPip
 from ___lo_pip___.lo_util.util import Util
+from ___lo_pip___.lo_util.uno_services import UnoServices
+from ___lo_pip___.py_paths.path_glob import PathGlobCache, is_glob_pattern
+from ___lo_pip___.py_paths.path_normalizer import PathNormalizer
+from ___lo_pip___.py_paths.path_verifier import PathVerifier
 from ___lo_pip___.settings.py_paths_settings import PyPathsSettings
 
 # endregion imports
@@ -145,13 +149,13 @@ class ___lo_implementation_name___(unohelper.Base, XJob):
             self._logger.error(f"Invalid job event name: {self._job_event_name}")
             self._logger.info(f"Valid job event names: {self._valid_job_event_names}")
             return
-        self._logger.debug(f"Job event name: {self._job_event_name}")
+        self._logger.debug("Job event name: %s", self._job_event_name)
         try:
             self._add_py_pkgs_to_sys_path()
             self._add_py_req_pkgs_to_sys_path()
             self._add_pure_pkgs_to_sys_path()
             self._add_py_paths_to_sys_path()
-            if self._config.log_level < 20:  # Less than INFO
+            if self._logger.is_debug:
                 self._show_extra_debug_info()
                 # self._config.extension_info.log_extensions(self._logger)
 
@@ -161,7 +165,7 @@ class ___lo_implementation_name___(unohelper.Base, XJob):
 
             if requirements_met:
                 self._logger.debug("Requirements are met. Nothing more to do.")
-                self._log_ex_time(self._start_time)
+                self._log_ex_time(self._start_time, result="skipped")
                 return
 
             if self._config.py_pkg_dir:
@@ -169,7 +173,7 @@ class ___lo_implementation_name___(unohelper.Base, XJob):
                 pth = os.path.join(os.path.dirname(__file__), f"{self._config.py_pkg_dir}.zip")
 
                 if os.path.exists(pth) and os.path.isfile(pth) and os.path.getsize(pth) > 0 and pth not in sys.path:
-                    self._logger.debug(f"sys.path appended: {pth}")
+                    self._logger.debug("sys.path appended: %s", pth)
                     sys.path.append(pth)
 
             if not self.has_internet_connection:
@@ -191,7 +195,7 @@ class ___lo_implementation_name___(unohelper.Base, XJob):
         except Exception as err:
             if self._logger:
                 self._logger.error(err)
-            self._log_ex_time(self._start_time)
+            self._log_ex_time(self._start_time, result="error")
             return
         finally:
             # self._remove_local_path_from_sys_path()
@@ -216,6 +220,7 @@ class ___lo_implementation_name___(unohelper.Base, XJob):
             else:
                 self._logger.debug("No other Installers are running. Starting...")
 
+        ex_result = "ok"
         try:
             with self._thread_lock:
                 os.environ["OOOPIP_RUNNER_WAIT_IN_LINE"] = "1"
@@ -230,30 +235,34 @@ class ___lo_implementation_name___(unohelper.Base, XJob):
             else:
                 self._logger.info("Pip is not installed. Attempting to install")
                 if not pip_installer.is_internet:
-                    self._logger.error("No internet connection!")
-                    return
+                    self._logger.warning("No internet connection! Attempting to install PIP from cache.")
                 pip_installer.install_pip()
                 if pip_installer.is_pip_installed():
                     self._logger.info("Pip has been installed")
                 else:
                     self._logger.info("Pip was not successfully installed")
+                    ex_result = "failed"
                     return
 
             # install wheel if needed
             self._install_wheel()
 
             # install any packages that are not installed
+            installed: Set[str] = set()
             if self._config.has_locals:
-                self._install_locals()
+                installed.update(self._install_locals())
             pkg_installer = InstallPkg(ctx=self.ctx)
             self._logger.debug("Created InstallPkg instance")
             pkg_installer.install()
+            installed.update(pkg_installer.installed_packages)
+            self._link_cpython(installed)
 
             if has_window:
                 self._display_complete_dialog()
 
             self._logger.info(f"{self._config.lo_implementation_name} execute Done!")
         except Exception as err:
+            ex_result = "error"
             if self._logger:
                 self._logger.error(err)
         finally:
@@ -261,7 +270,7 @@ class ___lo_implementation_name___(unohelper.Base, XJob):
             with self._thread_lock:
                 del os.environ["OOOPIP_RUNNER_WAIT_IN_LINE"]
             self._remove_py_req_pkgs_from_sys_path()
-            self._log_ex_time(start_time)
+            self._log_ex_time(start_time, result=ex_result)
 
     # endregion execute
 
@@ -348,42 +357,68 @@ class ___lo_implementation_name___(unohelper.Base, XJob):
         py_paths = path_settings.py_paths
         if not py_paths:
             self._logger.debug("No python paths to add to sys.path")
-        if path_settings.py_path_append:
-            the_paths = [pth for pth in py_paths]
+        paths = [pth.path for pth in py_paths]
+        if any(is_glob_pattern(pth) for pth in paths):
+            glob_cache = PathGlobCache(
+                Path(self._get_user_profile_path(), f"{self._config.lo_identifier}.path_globs.json")
+            )
+            # patterns are expanded under the verifier deadline, a pattern on a dead network mount has no matches.
+            paths = glob_cache.expand_all(paths, timeout=PathVerifier().timeout)
+            glob_cache.save()
+            self._logger.debug(
+                "Python path patterns expanded: %d from cache, %d scanned, %d timed out",
+                glob_cache.hits,
+                glob_cache.misses,
+                glob_cache.timeouts,
+            )
+        if path_settings.py_path_verify:
+            # paths are checked in parallel so one dead network mount does not stall startup.
+            verified = PathVerifier().verify(paths)
+            for pth, exists in verified.items():
+                if not exists:
+                    self._logger.debug("Unable to register path. Path does not exist or did not respond: %s", pth)
+            paths = [pth for pth in paths if verified[pth]]
+            # symlinks are only resolved for paths that answered, realpath on a dead mount would block startup.
+            the_paths, collapsed = PathNormalizer().dedupe(paths)
         else:
-            the_paths = [pth for pth in reversed(py_paths)]
+            the_paths, collapsed = PathNormalizer().dedupe(paths, resolve=False)
+        for kept, duplicates in collapsed.items():
+            self._logger.info("Python paths %s are the same path as %s, registering it once", duplicates, kept)
+        if not path_settings.py_path_append:
+            the_paths.reverse()
         for pth in the_paths:
-            if path_settings.py_path_verify and not Path(pth.path).exists():
-                self._logger.debug(f"Unable to register path. Path does not exist: {pth}")
-                continue
-            result = self._session.register_path(pth.path, path_settings.py_path_append)
-            self._log_sys_path_register_result(pth.path, result)
+            result = self._session.register_path(pth, path_settings.py_path_append)
+            self._log_sys_path_register_result(pth, result)
 
     def _log_sys_path_register_result(self, pth: Path | str, result: RegisterPathKind) -> None:
+        if not self._logger.is_debug:
+            return
         if not isinstance(pth, str):
             pth = str(pth)
         if result == RegisterPathKind.NOT_REGISTERED:
             if not pth:
                 self._logger.debug("Path not registered. Can't register empty string")
             else:
-                self._logger.debug(f"Path Not Registered, unknown reason: {pth}")
+                self._logger.debug("Path Not Registered, unknown reason: %s", pth)
         elif result == RegisterPathKind.ALREADY_REGISTERED:
-            self._logger.debug(f"Path already registered: {pth}")
+            self._logger.debug("Path already registered: %s", pth)
         else:
-            self._logger.debug(f"Path registered: {pth}")
+            self._logger.debug("Path registered: %s", pth)
 
     def _log_sys_path_unregister_result(self, pth: Path | str, result: UnRegisterPathKind) -> None:
+        if not self._logger.is_debug:
+            return
         if not isinstance(pth, str):
             pth = str(pth)
         if result == UnRegisterPathKind.NOT_UN_REGISTERED:
             if not pth:
                 self._logger.debug("Path not unregistered. Can't unregister empty string")
             else:
-                self._logger.debug(f"Path Not unregistered, unknown reason: {pth}")
+                self._logger.debug("Path Not unregistered, unknown reason: %s", pth)
         elif result == UnRegisterPathKind.ALREADY_UN_REGISTERED:
-            self._logger.debug(f"Path already unregistered: {pth}")
+            self._logger.debug("Path already unregistered: %s", pth)
         else:
-            self._logger.debug(f"Path unregistered: {pth}")
+            self._logger.debug("Path unregistered: %s", pth)
 
     # endregion Register/Unregister sys paths
 
@@ -487,12 +522,19 @@ class ___lo_implementation_name___(unohelper.Base, XJob):
         except Exception as err:
             self._logger.error(err, exc_info=True)
 
-    def _log_ex_time(self, start_time: float, msg: str = "") -> None:
+    def _log_ex_time(self, start_time: float, msg: str = "", result: str = "ok") -> None:
         if not self._logger:
             return
         end_time = time.time()
         total_time = end_time - start_time
-        self._logger.info(f"{self._config.lo_implementation_name} execution time: {total_time:.3f} seconds")
+        self._logger.log_timing(
+            phase="execute",
+            duration=total_time,
+            result=result,
+            msg=msg or f"{self._config.lo_implementation_name} execution time: {total_time:.3f} seconds",
+        )
+        uno_services = UnoServices()
+        self._logger.debug("UNO service cache: %d bridge calls saved, %d made", uno_services.hits, uno_services.misses)
 
     def _get_user_profile_path(self, as_sys_path: bool = True, ctx: Any = None) -> str:
         """
@@ -503,22 +545,28 @@ class ___lo_implementation_name___(unohelper.Base, XJob):
                 Defaults to True.
         """
         if ctx is None:
-            ctx = uno.getComponentContext()
-        result = ctx.ServiceManager.createInstance(
-            "com.sun.star.util.PathSubstitution"
-        ).substituteVariables(  # type: ignore
-            "$(user)", True
-        )
+            result = UnoServices().substitute_variables("$(user)")
+        else:
+            result = ctx.ServiceManager.createInstance(
+                "com.sun.star.util.PathSubstitution"
+            ).substituteVariables(  # type: ignore
+                "$(user)", True
+            )
         return uno.fileUrlToSystemPath(result) if as_sys_path else result
 
     # endregion other methods
 
     # region install local
-    def _install_locals(self) -> None:
-        """Pip installs any ``.whl`` or ``.tar.gz`` files in the ``locals`` directory."""
+    def _install_locals(self) -> Set[str]:
+        """
+        Pip installs any ``.whl`` or ``.tar.gz`` files in the ``locals`` directory.
+
+        Returns:
+            Set[str]: Names of the distributions that were installed.
+        """
         if not self._config.has_locals:
             self._logger.debug("Install local is set to False. Skipping local installation.")
-            return
+            return set()
         self._logger.debug("Install local is set to True. Installing local packages.")
         try:
             from ___lo_pip___.install.install_pkg_local import InstallPkgLocal
@@ -527,20 +575,54 @@ class ___lo_implementation_name___(unohelper.Base, XJob):
             _ = installer.install()
         except Exception as err:
             self._logger.error(f"Unable to install local packages: {err}", exc_info=True)
-            return
+            return set()
         self._logger.debug("Install local done.")
+        return installer.installed_packages
 
     # endregion install local
 
+    # region CPython link
+    def _link_cpython(self, dists: Set[str]) -> None:
+        """
+        Links the CPython extension files of newly installed distributions in a background thread.
+
+        Only runs when ``sym_link_cpython`` is set and running on Mac or a Linux AppImage.
+
+        Args:
+            dists (Set[str]): Names of the distributions that were installed.
+        """
+        if not dists:
+            return
+        if not self._config.sym_link_cpython:
+            self._logger.debug("sym_link_cpython is set to False. Skipping CPython link.")
+            return
+        if not (self._config.is_mac or self._config.is_app_image):
+            self._logger.debug("Not Mac or AppImage. Skipping CPython link.")
+            return
+
+        def link() -> None:
+            try:
+                from ___lo_pip___.install.post.cpython_link import CPythonLink
+
+                CPythonLink().link(dists=dists)
+            except Exception as err:
+                self._logger.error(f"Unable to link CPython files: {err}", exc_info=True)
+
+        self._logger.debug(f"Linking CPython files for {len(dists)} installed distributions.")
+        t = threading.Thread(target=link, name="lo_pip_cpython_link", daemon=True)
+        t.start()
+
+    # endregion CPython link
+
     # region Logging
 
     def _get_local_logger(self) -> OxtLogger:
-        from ___lo_pip___.oxt_logger import OxtLogger
+        from ___lo_pip___.oxt_logger import get_logger
 
         # if self._user_path:
         #     log_file = os.path.join(self._user_path, "py_runner.log")
         #     return OxtLogger(log_file=log_file, log_name=__name__)
-        return OxtLogger(log_name=__name__)
+        return get_logger(log_name=__name__)
 
     # endregion Logging
 
@@ -15,6 +15,10 @@ from .processing.locale.publisher import Publisher
 from .processing.locale.publisher_update import PublisherUpdate
 from .processing.locale.name import Name
 from .install.pre_install_pure import PreInstallPure
+# WheelhouseBuild imports the version rules from oxt/___lo_pip___/ver when the wheelhouse is enabled.
+# That package must stay free of uno imports, the build runs from the project root outside of LibreOffice.
+from .install.wheelhouse_build import WheelhouseBuild
+from .install.local_wheel_build import LocalWheelBuild
 
 
 class Build:
@@ -41,6 +45,12 @@ class Build:
         if self._args.process_tokens:
             self._process_tokens()
 
+        if self._args.build_wheelhouse:
+            self._build_wheelhouse()
+
+        if self._args.build_local_wheels:
+            self._build_local_wheels()
+
         self._process_config()
 
         self._copy_py_req_packages()
@@ -178,6 +188,16 @@ class Build:
         pre_install = PreInstallPure()
         pre_install.install()
 
+    def _build_wheelhouse(self) -> None:
+        """Collects the requirement wheels into the wheelhouse."""
+        wheelhouse = WheelhouseBuild()
+        wheelhouse.build()
+
+    def _build_local_wheels(self) -> None:
+        """Converts the local source distributions into wheels."""
+        local_wheels = LocalWheelBuild()
+        local_wheels.build()
+
     def _zip_req_python_path(self) -> None:
         """Zips the required packages path."""
         pth = self._build_path / f"req_{self._config.py_pkg_dir}"
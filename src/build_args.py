@@ -16,3 +16,7 @@ class BuildArgs:
     """Whether to make the dist zip(oxt) file in the dist folder."""
     pre_install_pure_packages: bool = True
     """Whether to pre-install pure packages."""
+    build_wheelhouse: bool = True
+    """Whether to collect wheels for the requirements into the oxt wheelhouse folder."""
+    build_local_wheels: bool = True
+    """Whether to convert local source distributions into wheels."""
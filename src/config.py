@@ -144,11 +144,28 @@ class Config(metaclass=Singleton):
         """The path to the local directory."""
         return self.root_path / "oxt" / "local"
 
+    @property
+    def build_local_path(self) -> Path:
+        """The path to the local directory in the build directory."""
+        return self.build_path / "local"
+
     @property
     def has_locals(self) -> bool:
         """Whether there are any local packages."""
         return self._has_locals
 
+    @property
+    def wheelhouse_path(self) -> Path:
+        """The path to the build wheelhouse directory."""
+        return self.build_path / "wheelhouse"
+
+    @property
+    def has_wheelhouse(self) -> bool:
+        """Whether the build wheelhouse directory contains any wheel files."""
+        if not self.wheelhouse_path.exists():
+            return False
+        return any(self.wheelhouse_path.glob("*.whl"))
+
     @property
     def default_locale(self) -> List[str]:
         """
@@ -0,0 +1,100 @@
+from __future__ import annotations
+from pathlib import Path
+import os
+import sys
+import shutil
+import json
+import subprocess
+import tempfile
+from typing import cast, Dict, List
+
+import toml
+
+from ..meta.singleton import Singleton
+from ..config import Config
+
+
+# must match LOCAL_WHEELS_FILE in oxt/___lo_pip___/install/local_wheels.py, the extension reads this file.
+LOCAL_WHEELS_FILE = "local_wheels.json"
+
+# silent subprocess for Windows
+if os.name == "nt":
+    _si = subprocess.STARTUPINFO()
+    _si.dwFlags |= subprocess.STARTF_USESHOWWINDOW
+else:
+    _si = None
+
+
+class LocalWheelBuild(metaclass=Singleton):
+    """
+    Reads values from pyproject.toml and converts the local source distributions in the build ``local`` folder into wheels.
+
+    Each ``.tar.gz`` is built with ``pip wheel --no-deps`` and the wheel is shipped next to it.
+    The mapping from source distribution to wheel is written to ``LOCAL_WHEELS_FILE`` and is read by the extension.
+    A source distribution that builds a pure python wheel is removed;
+    one that builds a platform specific wheel is kept so it can still be installed on other platforms.
+    """
+
+    def __init__(self) -> None:
+        self._config = Config()
+        self._dst = self._config.build_local_path
+        cfg = toml.load(self._config.toml_path)
+        local_cfg = cast(Dict[str, object], cfg["tool"]["oxt"].get("local", {}))
+        self._enabled = bool(local_cfg.get("build_wheels", True))
+        python = str(local_cfg.get("python", ""))
+        self.path_python = Path(python) if python else Path(sys.executable)
+
+    def _cmd_pip(self, *args: str) -> List[str]:
+        cmd: List[str] = [str(self.path_python), "-m", "pip", *args]
+        return cmd
+
+    def _run(self, cmd: List[str]) -> subprocess.CompletedProcess:
+        if _si:
+            return subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, startupinfo=_si)
+        return subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+
+    def _build_wheel(self, sdist: Path) -> Path | None:
+        """Builds a wheel for a source distribution. Returns the wheel in the local folder or ``None`` on failure."""
+        with tempfile.TemporaryDirectory() as tmp:
+            cmd = self._cmd_pip("wheel", "--no-deps", f"--wheel-dir={tmp}", str(sdist))
+            process = self._run(cmd)
+            wheels = list(Path(tmp).glob("*.whl"))
+            if process.returncode != 0 or len(wheels) != 1:
+                err = process.stderr.decode("utf-8", errors="replace")
+                print(f"\nLocal wheel build failed for {sdist.name}, the source distribution is shipped.\n{err}")
+                return None
+            dst = self._dst / wheels[0].name
+            shutil.move(str(wheels[0]), dst)
+            return dst
+
+    def build(self) -> None:
+        """Convert the source distributions."""
+        if not self.enabled or not self._dst.exists():
+            return
+        mapping: Dict[str, str] = {}
+        for sdist in sorted(self._dst.glob("*.tar.gz")):
+            wheel = self._build_wheel(sdist)
+            if wheel is None:
+                continue
+            mapping[sdist.name] = wheel.name
+            if wheel.name.endswith("-none-any.whl"):
+                sdist.unlink()
+        if mapping:
+            self._write_mapping(mapping)
+
+    def _write_mapping(self, mapping: Dict[str, str]) -> None:
+        """Writes the mapping of source distribution file names to wheel file names into the local folder."""
+        with open(self._dst / LOCAL_WHEELS_FILE, "w", encoding="utf-8") as f:
+            json.dump(mapping, f, indent=4, sort_keys=True)
+
+    # region Properties
+    @property
+    def enabled(self) -> bool:
+        """
+        Gets if local source distributions are converted to wheels.
+
+        The value for this property can be set in pyproject.toml (tool.oxt.local.build_wheels)
+        """
+        return self._enabled
+
+    # endregion Properties
@@ -0,0 +1,122 @@
+from __future__ import annotations
+from pathlib import Path
+import os
+import sys
+import shutil
+import subprocess
+from typing import cast, Dict, List
+
+import toml
+
+from ..meta.singleton import Singleton
+from ..config import Config
+
+
+# silent subprocess for Windows
+if os.name == "nt":
+    _si = subprocess.STARTUPINFO()
+    _si.dwFlags |= subprocess.STARTF_USESHOWWINDOW
+else:
+    _si = None
+
+
+class WheelhouseBuild(metaclass=Singleton):
+    """
+    Reads values from pyproject.toml and collects wheels for ``tool.oxt.requirements`` into the build wheelhouse folder.
+
+    The wheelhouse is packed into the oxt and is used by the extension to install requirements
+    with ``pip --no-index`` before falling back to the package index.
+
+    When ``tool.oxt.wheelhouse.platforms`` or ``tool.oxt.wheelhouse.python_version`` is set then binary wheels
+    are downloaded for each platform tag using ``pip download``; otherwise wheels are built for the current
+    platform using ``pip wheel``.
+    """
+
+    def __init__(self) -> None:
+        self._config = Config()
+        self.path_python = Path(sys.executable)
+        self._dst = self._config.wheelhouse_path
+        cfg = toml.load(self._config.toml_path)
+        self._requirements = cast(Dict[str, str], cfg["tool"]["oxt"].get("requirements", {}))
+        wh_cfg = cast(Dict[str, object], cfg["tool"]["oxt"].get("wheelhouse", {}))
+        self._enabled = bool(wh_cfg.get("enabled", False))
+        self._python_version = str(wh_cfg.get("python_version", ""))
+        self._platforms = cast(List[str], wh_cfg.get("platforms", []))
+        self._validate()
+
+    def _validate(self) -> None:
+        """Validate"""
+        assert isinstance(self._requirements, dict), "requirements must be a dict"
+        assert isinstance(self._platforms, list), "wheelhouse platforms must be a list"
+        for platform in self._platforms:
+            assert isinstance(platform, str), "wheelhouse platforms must be a list of strings"
+
+    def _cmd_pip(self, *args: str) -> List[str]:
+        cmd: List[str] = [str(self.path_python), "-m", "pip", *args]
+        return cmd
+
+    def _get_requirement_specs(self) -> List[str]:
+        """Gets the requirements as pip requirement specifiers such as ``verr>=1.1.2, <2.0.0``."""
+        # the version rules of the extension are reused so the wheelhouse matches what the extension installs.
+        # oxt/___lo_pip___/ver has no uno imports and is importable from the project root, see build.py.
+        from oxt.___lo_pip___.ver.rules.ver_rules import VerRules
+
+        ver_rules = VerRules()
+        specs: List[str] = []
+        for name, ver in self._requirements.items():
+            rules = ver_rules.get_matched_rules(ver or "==*")
+            ver_lst = [rule.get_versions_str() for rule in rules]
+            specs.append(f"{name}{','.join(ver_lst)}")
+        return specs
+
+    def _run(self, cmd: List[str], err_msg: str) -> None:
+        # sourcery skip: raise-specific-error
+        if _si:
+            process = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, startupinfo=_si)
+        else:
+            process = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        if process.returncode != 0:
+            raise Exception(f"{err_msg}\n{process.stderr.decode('utf-8', errors='replace')}")
+
+    def _download(self, specs: List[str], platform: str) -> None:
+        """Downloads binary wheels for a platform tag. An empty platform downloads for the current platform."""
+        cmd = ["download", f"--dest={self._dst}", "--only-binary=:all:"]
+        if platform:
+            cmd.append(f"--platform={platform}")
+        if self._python_version:
+            cmd.append(f"--python-version={self._python_version}")
+        cmd = self._cmd_pip(*[*cmd, *specs])
+        self._run(cmd, f"Wheelhouse - Download failed for platform: {platform or 'current'}")
+
+    def _wheel(self, specs: List[str]) -> None:
+        """Builds wheels, including dependencies, for the current platform."""
+        cmd = self._cmd_pip("wheel", f"--wheel-dir={self._dst}", *specs)
+        self._run(cmd, "Wheelhouse - Building wheels failed")
+
+    def build(self) -> None:
+        """Collect the wheels."""
+        if self._dst.exists():
+            shutil.rmtree(self._dst)
+        if not self.enabled:
+            return
+        specs = self._get_requirement_specs()
+        if not specs:
+            return
+        self._dst.mkdir(parents=True, exist_ok=True)
+        if self._platforms or self._python_version:
+            for platform in self._platforms or [""]:
+                self._download(specs, platform)
+        else:
+            self._wheel(specs)
+
+    # region Properties
+    @property
+    def enabled(self) -> bool:
+        """
+        Gets if the wheelhouse is built.
+
+        The value for this property can be set in pyproject.toml (tool.oxt.wheelhouse.enabled)
+        """
+        return self._enabled
+
+    # endregion Properties
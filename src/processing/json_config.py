@@ -66,6 +66,26 @@ class JsonConfig(metaclass=Singleton):
             self._uninstall_on_update = cast(bool, cfg["tool"]["oxt"]["config"]["uninstall_on_update"])
         except Exception:
             self._uninstall_on_update = True
+        try:
+            self._download_retries = int(cfg["tool"]["oxt"]["config"]["download_retries"])
+        except Exception:
+            self._download_retries = 3
+        try:
+            self._download_backoff = float(cfg["tool"]["oxt"]["config"]["download_backoff"])
+        except Exception:
+            self._download_backoff = 0.5
+        try:
+            self._log_json_file = str(cfg["tool"]["oxt"]["config"]["log_json_file"])
+        except Exception:
+            self._log_json_file = ""
+        try:
+            self._log_ring_buffer_size = int(cfg["tool"]["oxt"]["config"]["log_ring_buffer_size"])
+        except Exception:
+            self._log_ring_buffer_size = 0
+        try:
+            self._mirrors = cast(Dict[str, List[str]], cfg["tool"]["oxt"]["mirrors"])
+        except Exception:
+            self._mirrors = {}
 
         self._validate()
 
@@ -75,6 +95,7 @@ class JsonConfig(metaclass=Singleton):
             json_config = json.load(f)
         token = Token()
         json_config["py_pkg_dir"] = token.get_token_value("py_pkg_dir")
+        json_config["extension_version"] = self._config.ver_str
         json_config["lo_identifier"] = token.get_token_value("lo_identifier")
         json_config["lo_implementation_name"] = token.get_token_value("lo_implementation_name")
 
@@ -89,10 +110,16 @@ class JsonConfig(metaclass=Singleton):
         json_config["isolate_windows"] = self._isolate_windows
         json_config["sym_link_cpython"] = self._sym_link_cpython
         json_config["uninstall_on_update"] = self._uninstall_on_update
+        json_config["download_retries"] = self._download_retries
+        json_config["download_backoff"] = self._download_backoff
+        json_config["log_json_file"] = self._log_json_file
+        json_config["log_ring_buffer_size"] = self._log_ring_buffer_size
+        json_config["mirrors"] = self._mirrors
         # json_config["log_pip_installs"] = self._log_pip_installs
         # update the requirements
         json_config["requirements"] = self._requirements
         json_config["has_locals"] = self._config.has_locals
+        json_config["has_wheelhouse"] = self._config.has_wheelhouse
 
         # save the file
         with open(json_config_path, "w", encoding="utf-8") as f:
@@ -115,3 +142,10 @@ class JsonConfig(metaclass=Singleton):
         assert len(self._resource_properties_prefix) > 0, "resource_properties_prefix must not be an empty string"
         assert isinstance(self._sym_link_cpython, bool), "sym_link_cpython must be a bool"
         assert isinstance(self._uninstall_on_update, bool), "uninstall_on_update must be a bool"
+        assert self._download_retries >= 0, "download_retries must not be negative"
+        assert self._download_backoff >= 0, "download_backoff must not be negative"
+        assert isinstance(self._log_json_file, str), "log_json_file must be a string"
+        assert self._log_ring_buffer_size >= 0, "log_ring_buffer_size must not be negative"
+        assert isinstance(self._mirrors, dict), "mirrors must be a dict"
+        for key, urls in self._mirrors.items():
+            assert isinstance(urls, list), f"mirrors {key} must be a list"
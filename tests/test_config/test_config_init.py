@@ -0,0 +1,158 @@
+from __future__ import annotations
+from pathlib import Path
+from typing import Dict
+import importlib
+import logging
+import sys
+import types
+import pytest
+
+if __name__ == "__main__":
+    pytest.main([__file__])
+
+from oxt.___lo_pip___.config_snapshot import ConfigSnapshot, get_snapshot_key
+from oxt.___lo_pip___.meta.singleton import Singleton
+
+PKG = "oxt.___lo_pip___"
+BUILD_ID = "build-1"
+EXTENSION_VERSION = "1.0.0"
+LO_IDENTIFIER = "org.openoffice.extensions.test"
+
+
+class _Calls:
+    """Counts the calls made to the UNO backed collaborators."""
+
+    def __init__(self) -> None:
+        self.counts: Dict[str, int] = {}
+
+    def add(self, name: str) -> None:
+        self.counts[name] = self.counts.get(name, 0) + 1
+
+
+def _module(name: str, **attrs: object) -> types.ModuleType:
+    mod = types.ModuleType(name)
+    mod.__dict__.update(attrs)
+    return mod
+
+
+@pytest.fixture
+def config_env(monkeypatch: pytest.MonkeyPatch, tmp_path: Path):
+    """
+    Imports ``Config`` with its LibreOffice collaborators replaced by fakes that count their calls.
+
+    The singleton instances and the imported modules are restored afterwards.
+    """
+    calls = _Calls()
+
+    class LoggerConfig:
+        log_file = ""
+        log_name = "test_config"
+        log_format = "%(message)s"
+        log_json_file = ""
+        log_ring_buffer_size = 0
+        log_level = 0
+        user_profile_path = str(tmp_path)
+
+    class BasicConfig:
+        auto_install_in_site_packages = False
+        extension_version = EXTENSION_VERSION
+        lo_identifier = LO_IDENTIFIER
+
+    class Util:
+        def __init__(self) -> None:
+            calls.add("Util")
+
+        def get_build_id(self) -> str:
+            calls.add("Util.get_build_id")
+            return BUILD_ID
+
+        def config(self, name: str) -> str:
+            calls.add("Util.config")
+            return ""
+
+    class Session:
+        def __init__(self) -> None:
+            calls.add("Session")
+
+    class ExtensionInfo:
+        def __init__(self) -> None:
+            calls.add("ExtensionInfo")
+
+        def get_extension_loc(self, *args: object) -> str:
+            calls.add("ExtensionInfo.get_extension_loc")
+            return str(tmp_path)
+
+        def get_extension_details(self, *args: object) -> tuple:
+            calls.add("ExtensionInfo.get_extension_details")
+            return ("user", None, None)
+
+    class GeneralSettings:
+        def __init__(self) -> None:
+            calls.add("GeneralSettings")
+
+    modules = {
+        f"{PKG}.oxt_logger": _module(f"{PKG}.oxt_logger", __path__=[]),
+        f"{PKG}.oxt_logger.logger_config": _module(f"{PKG}.oxt_logger.logger_config", LoggerConfig=LoggerConfig),
+        f"{PKG}.oxt_logger.oxt_logger": _module(
+            f"{PKG}.oxt_logger.oxt_logger", get_logger=lambda log_name="", **kwargs: logging.getLogger(log_name)
+        ),
+        f"{PKG}.lo_util": _module(f"{PKG}.lo_util", Util=Util, Session=Session),
+        f"{PKG}.info": _module(f"{PKG}.info", ExtensionInfo=ExtensionInfo),
+        f"{PKG}.settings": _module(f"{PKG}.settings", __path__=[]),
+        f"{PKG}.settings.general_settings": _module(
+            f"{PKG}.settings.general_settings", GeneralSettings=GeneralSettings
+        ),
+    }
+    for name, mod in modules.items():
+        monkeypatch.setitem(sys.modules, name, mod)
+    # a fresh import so that config binds the fakes.
+    monkeypatch.delitem(sys.modules, f"{PKG}.config", raising=False)
+    monkeypatch.delattr(sys.modules[PKG], "config", raising=False)
+    instances = dict(Singleton._instances)
+
+    config = importlib.import_module(f"{PKG}.config")
+
+    monkeypatch.setattr(config, "BasicConfig", BasicConfig)
+    try:
+        yield config, calls
+    finally:
+        Singleton._instances.clear()
+        Singleton._instances.update(instances)
+        sys.modules.pop(f"{PKG}.config", None)
+        if getattr(sys.modules[PKG], "config", None) is config:
+            delattr(sys.modules[PKG], "config")
+
+
+def test_construction_does_not_use_lo(config_env) -> None:
+    config, calls = config_env
+    cfg = config.Config()
+    assert calls.counts == {}
+    assert cfg.lo_identifier == LO_IDENTIFIER
+    assert cfg.python_major_minor == f"{sys.version_info.major}.{sys.version_info.minor}"
+    assert calls.counts == {}
+
+
+def test_site_packages_from_snapshot(config_env, tmp_path: Path) -> None:
+    config, calls = config_env
+    site_packages = tmp_path / "site-packages"
+    site_packages.mkdir()
+    python = tmp_path / "python"
+    python.write_bytes(b"")
+    values = {
+        "package_location": str(tmp_path),
+        "python_path": str(python),
+        "site_packages": str(site_packages),
+        "is_user_installed": True,
+        "is_shared_installed": False,
+        "is_bundled_installed": False,
+    }
+    snapshot_file = tmp_path / f"{LO_IDENTIFIER}.config_snapshot.json"
+    ConfigSnapshot(snapshot_file, get_snapshot_key(BUILD_ID, EXTENSION_VERSION)).save(values)
+
+    cfg = config.Config()
+    assert cfg.site_packages == str(site_packages)
+    assert cfg.is_user_installed
+    # only the build id is read to key the snapshot, the values are not worked out again.
+    assert calls.counts == {"Util": 1, "Util.get_build_id": 1}
+    assert cfg.python_path == python
+    assert calls.counts == {"Util": 1, "Util.get_build_id": 1}
@@ -0,0 +1,75 @@
+from __future__ import annotations
+from pathlib import Path
+import json
+import pytest
+
+if __name__ == "__main__":
+    pytest.main([__file__])
+
+from oxt.___lo_pip___.config_snapshot import ConfigSnapshot, get_snapshot_key
+
+
+def _values(root: Path) -> dict:
+    site_packages = root / "site-packages"
+    site_packages.mkdir()
+    python = root / "python"
+    python.write_bytes(b"")
+    return {
+        "package_location": str(root),
+        "python_path": str(python),
+        "site_packages": str(site_packages),
+        "is_user_installed": True,
+        "is_shared_installed": False,
+        "is_bundled_installed": False,
+    }
+
+
+def test_round_trip(tmp_path: Path) -> None:
+    values = _values(tmp_path)
+    file = tmp_path / "snap" / "config.json"
+    key = get_snapshot_key("build-1", "1.0.0")
+    ConfigSnapshot(file, key).save(values)
+    assert ConfigSnapshot(file, key).load() == values
+
+
+def test_empty_site_packages(tmp_path: Path) -> None:
+    values = _values(tmp_path)
+    values["site_packages"] = ""
+    file = tmp_path / "config.json"
+    key = get_snapshot_key("build-1", "1.0.0")
+    ConfigSnapshot(file, key).save(values)
+    assert ConfigSnapshot(file, key).load() == values
+    values["python_path"] = ""
+    ConfigSnapshot(file, key).save(values)
+    assert ConfigSnapshot(file, key).load() is None
+
+
+def test_key_mismatch(tmp_path: Path) -> None:
+    file = tmp_path / "config.json"
+    ConfigSnapshot(file, get_snapshot_key("build-1", "1.0.0")).save(_values(tmp_path))
+    assert ConfigSnapshot(file, get_snapshot_key("build-2", "1.0.0")).load() is None
+    assert ConfigSnapshot(file, get_snapshot_key("build-1", "1.0.1")).load() is None
+
+
+def test_missing_path(tmp_path: Path) -> None:
+    values = _values(tmp_path)
+    file = tmp_path / "config.json"
+    key = get_snapshot_key("build-1", "1.0.0")
+    ConfigSnapshot(file, key).save(values)
+    Path(values["site_packages"]).rmdir()
+    assert ConfigSnapshot(file, key).load() is None
+
+
+def test_invalid(tmp_path: Path) -> None:
+    file = tmp_path / "config.json"
+    key = get_snapshot_key("build-1", "1.0.0")
+    snapshot = ConfigSnapshot(file, key)
+    assert snapshot.load() is None
+    file.write_text("not json", encoding="utf-8")
+    assert snapshot.load() is None
+    values = _values(tmp_path)
+    values["is_user_installed"] = "yes"
+    file.write_text(json.dumps({"key": key, "values": values}), encoding="utf-8")
+    assert snapshot.load() is None
+    snapshot.clear()
+    assert not file.exists()
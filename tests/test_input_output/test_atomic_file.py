@@ -0,0 +1,37 @@
+from __future__ import annotations
+from pathlib import Path
+import json
+import os
+import pytest
+
+if __name__ == "__main__":
+    pytest.main([__file__])
+
+from oxt.___lo_pip___.input_output.atomic_file import write_atomic, write_json_atomic
+
+
+def test_write_json_atomic(tmp_path: Path) -> None:
+    file = tmp_path / "sub" / "data.json"
+    assert write_json_atomic(file, {"a": [1, 2]})
+    assert json.loads(file.read_text(encoding="utf-8")) == {"a": [1, 2]}
+    assert write_json_atomic(file, {"b": 1})
+    assert json.loads(file.read_text(encoding="utf-8")) == {"b": 1}
+    assert os.listdir(file.parent) == ["data.json"]
+
+
+def test_write_json_atomic_not_serializable(tmp_path: Path) -> None:
+    file = tmp_path / "data.json"
+    file.write_text("{}", encoding="utf-8")
+    assert not write_json_atomic(file, {"a": object()})
+    assert file.read_text(encoding="utf-8") == "{}"
+    assert os.listdir(tmp_path) == ["data.json"]
+
+
+def test_write_atomic_removes_tmp_on_failure(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    def fail(src, dst):
+        raise OSError("replace failed")
+
+    monkeypatch.setattr(os, "replace", fail)
+    with pytest.raises(OSError):
+        write_atomic(tmp_path / "data.bin", b"data")
+    assert os.listdir(tmp_path) == []
@@ -0,0 +1,87 @@
+from __future__ import annotations
+from email.utils import formatdate
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List
+import threading
+import pytest
+
+
+class FakeServerState:
+    """State shared between the test and the fake server."""
+
+    def __init__(self) -> None:
+        self.files: Dict[str, bytes] = {}
+        self.etags: Dict[str, str] = {}
+        self.redirects: Dict[str, str] = {}
+        self.last_modified = formatdate(usegmt=True)
+        self.url = ""
+        self.requests: List[Dict[str, str]] = []
+        self.fail_count = 0
+        """Number of upcoming requests that respond with ``503``."""
+        self.lock = threading.Lock()
+
+
+def _make_handler(state: FakeServerState):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def log_message(self, format, *args):  # noqa: A002
+            pass
+
+        def _respond(self, send_body: bool) -> None:
+            with state.lock:
+                state.requests.append({"path": self.path, "method": self.command, **dict(self.headers)})
+                if state.fail_count > 0:
+                    state.fail_count -= 1
+                    self.send_response(503)
+                    self.send_header("Content-Length", "0")
+                    self.end_headers()
+                    return
+            if self.path in state.redirects:
+                self.send_response(302)
+                self.send_header("Location", state.redirects[self.path])
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+            if self.path not in state.files:
+                self.send_response(404)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+            etag = state.etags.get(self.path, "")
+            if etag and self.headers.get("If-None-Match") == etag:
+                self.send_response(304)
+                self.send_header("ETag", etag)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+            data = state.files[self.path]
+            self.send_response(200)
+            if etag:
+                self.send_header("ETag", etag)
+            self.send_header("Last-Modified", state.last_modified)
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            if send_body:
+                self.wfile.write(data)
+
+        def do_GET(self) -> None:  # noqa: N802
+            self._respond(True)
+
+        def do_HEAD(self) -> None:  # noqa: N802
+            self._respond(False)
+
+    return Handler
+
+
+@pytest.fixture()
+def fake_server():
+    """Local http server that stands in for the real download servers."""
+    state = FakeServerState()
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _make_handler(state))
+    thread = threading.Thread(target=server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True)
+    thread.start()
+    state.url = f"http://127.0.0.1:{server.server_address[1]}"
+    yield state
+    server.shutdown()
+    server.server_close()
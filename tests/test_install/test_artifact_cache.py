@@ -0,0 +1,82 @@
+from __future__ import annotations
+import pytest
+
+if __name__ == "__main__":
+    pytest.main([__file__])
+
+
+from oxt.___lo_pip___.install.artifact_cache import ArtifactCache, CacheStatus
+
+
+def test_fetch_downloads_then_revalidates(fake_server, tmp_path) -> None:
+    fake_server.files["/get-pip.py"] = b"print('pip')"
+    fake_server.etags["/get-pip.py"] = '"v1"'
+    cache = ArtifactCache(tmp_path)
+    url = f"{fake_server.url}/get-pip.py"
+
+    result = cache.fetch(url)
+    assert result.status == CacheStatus.DOWNLOADED
+    assert result.path is not None
+    assert result.path.name == "get-pip.py"
+    assert result.path.read_bytes() == b"print('pip')"
+
+    result = cache.fetch(url)
+    assert result.status == CacheStatus.NOT_MODIFIED
+    assert result.path is not None
+    assert result.path.read_bytes() == b"print('pip')"
+    assert fake_server.requests[-1]["If-None-Match"] == '"v1"'
+    assert "If-Modified-Since" in fake_server.requests[-1]
+
+
+def test_fetch_changed_artifact(fake_server, tmp_path) -> None:
+    fake_server.files["/pip.whl"] = b"one"
+    fake_server.etags["/pip.whl"] = '"v1"'
+    cache = ArtifactCache(tmp_path)
+    url = f"{fake_server.url}/pip.whl"
+    assert cache.fetch(url, filename="pip-wheel.whl").status == CacheStatus.DOWNLOADED
+
+    fake_server.files["/pip.whl"] = b"two"
+    fake_server.etags["/pip.whl"] = '"v2"'
+    result = cache.fetch(url, filename="pip-wheel.whl")
+    assert result.status == CacheStatus.DOWNLOADED
+    assert result.path is not None
+    assert result.path.name == "pip-wheel.whl"
+    assert result.path.read_bytes() == b"two"
+
+
+def test_fetch_offline(fake_server, tmp_path) -> None:
+    fake_server.files["/get-pip.py"] = b"data"
+    cache = ArtifactCache(tmp_path)
+    url = f"{fake_server.url}/get-pip.py"
+
+    result = cache.fetch(url, offline=True)
+    assert result.status == CacheStatus.FAILED
+    assert result.path is None
+
+    assert cache.fetch(url).status == CacheStatus.DOWNLOADED
+    result = cache.fetch(url, offline=True)
+    assert result.status == CacheStatus.OFFLINE
+    assert result.path == cache.get_cached(url)
+    assert len(fake_server.requests) == 1
+
+
+def test_fetch_server_error_uses_cache(fake_server, tmp_path) -> None:
+    fake_server.files["/get-pip.py"] = b"data"
+    cache = ArtifactCache(tmp_path)
+    url = f"{fake_server.url}/get-pip.py"
+    assert cache.fetch(url).status == CacheStatus.DOWNLOADED
+
+    fake_server.fail_count = 1
+    result = cache.fetch(url)
+    assert result.status == CacheStatus.OFFLINE
+    assert result.err
+    assert result.path is not None
+    assert result.path.read_bytes() == b"data"
+
+
+def test_fetch_missing(fake_server, tmp_path) -> None:
+    cache = ArtifactCache(tmp_path)
+    result = cache.fetch(f"{fake_server.url}/nothing.whl")
+    assert result.status == CacheStatus.FAILED
+    assert result.path is None
+    assert cache.get_cached(f"{fake_server.url}/nothing.whl") is None
@@ -0,0 +1,177 @@
+from __future__ import annotations
+from pathlib import Path
+import os
+import pytest
+
+if __name__ == "__main__":
+    pytest.main([__file__])
+
+from oxt.___lo_pip___.install.post.cpython_record import (
+    CPythonLinkManifest,
+    get_dist_infos,
+    get_dist_name,
+    get_record_extensions,
+    get_record_top_levels,
+    get_unowned_entries,
+)
+
+pytestmark = pytest.mark.skipif(os.name == "nt", reason="symlinks require privileges on Windows")
+
+GNU = "cpython-38-x86_64-linux-gnu"
+EMBED = "cpython-3.8"
+
+
+def _make_dist(root: Path, name: str, ver: str, files: list) -> Path:
+    for file in files:
+        pth = root / file
+        pth.parent.mkdir(parents=True, exist_ok=True)
+        pth.write_bytes(b"")
+    dist_info = root / f"{name}-{ver}.dist-info"
+    dist_info.mkdir()
+    rows = [f"{file},sha256=abc,0" for file in files]
+    rows.append(f"{dist_info.name}/RECORD,,")
+    (dist_info / "RECORD").write_text("\n".join(rows) + "\n", encoding="utf-8")
+    return dist_info
+
+
+def test_dist_infos(tmp_path: Path) -> None:
+    _make_dist(tmp_path, "numpy", "1.24.0", ["numpy/__init__.py"])
+    _make_dist(tmp_path, "Foo.Bar", "1.0", ["foo_bar/__init__.py"])
+    dist_infos = get_dist_infos(tmp_path)
+    assert [d.name for d in dist_infos] == ["Foo.Bar-1.0.dist-info", "numpy-1.24.0.dist-info"]
+    assert [get_dist_name(d) for d in dist_infos] == ["foo_bar", "numpy"]
+
+
+def test_record_extensions(tmp_path: Path) -> None:
+    dist_info = _make_dist(
+        tmp_path,
+        "numpy",
+        "1.24.0",
+        [
+            "numpy/__init__.py",
+            f"numpy/core/_multiarray.{GNU}.so",
+            f"numpy/linalg/lapack_lite.{GNU}.so",
+            "numpy/.libs/libopenblas.so",
+        ],
+    )
+    # listed in RECORD but removed since
+    (tmp_path / f"numpy/linalg/lapack_lite.{GNU}.so").unlink()
+    files = get_record_extensions(dist_info)
+    assert files == [tmp_path / f"numpy/core/_multiarray.{GNU}.so"]
+
+
+def test_record_missing(tmp_path: Path) -> None:
+    dist_info = tmp_path / "empty-1.0.dist-info"
+    dist_info.mkdir()
+    assert get_record_extensions(dist_info) == []
+
+
+def _manifest_file(site_packages: Path) -> Path:
+    return site_packages.parent / f"{site_packages.name}_profile" / "cpython_links.json"
+
+
+def test_manifest(tmp_path: Path) -> None:
+    numpy = _make_dist(tmp_path, "numpy", "1.24.0", [f"numpy/core/_multiarray.{GNU}.so"])
+    pandas = _make_dist(tmp_path, "pandas", "2.0.0", [f"pandas/_libs/indexers.{GNU}.so"])
+    dist_infos = [numpy, pandas]
+
+    manifest = CPythonLinkManifest(tmp_path, _manifest_file(tmp_path))
+    assert manifest.get_changed(dist_infos, EMBED) == dist_infos
+
+    links = {}
+    for dist_info in dist_infos:
+        links[dist_info] = []
+        for file in get_record_extensions(dist_info):
+            link = file.parent / file.name.replace(GNU, EMBED)
+            link.symlink_to(file)
+            links[dist_info].append(link)
+        manifest.mark(dist_info, EMBED, links[dist_info])
+    manifest.save()
+    assert manifest.file.exists()
+
+    # a new manifest, as in a new session
+    manifest = CPythonLinkManifest(tmp_path, _manifest_file(tmp_path))
+    assert manifest.get_changed(dist_infos, EMBED) == []
+    # a new embedded python relinks everything
+    assert manifest.get_changed(dist_infos, "cpython-3.9") == dist_infos
+
+    # updated distribution
+    record = pandas / "RECORD"
+    st = record.stat()
+    os.utime(record, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+    assert manifest.get_changed(dist_infos, EMBED) == [pandas]
+
+    # removed link
+    links[numpy][0].unlink()
+    assert manifest.get_changed(dist_infos, EMBED) == [numpy, pandas]
+
+
+def test_manifest_prune(tmp_path: Path) -> None:
+    numpy = _make_dist(tmp_path, "numpy", "1.24.0", [f"numpy/core/_multiarray.{GNU}.so"])
+    manifest = CPythonLinkManifest(tmp_path, _manifest_file(tmp_path))
+    manifest.mark(numpy, EMBED, [])
+    manifest.prune([])
+    assert manifest.get_changed([numpy], EMBED) == [numpy]
+
+
+def test_manifest_corrupt(tmp_path: Path) -> None:
+    numpy = _make_dist(tmp_path, "numpy", "1.24.0", [])
+    file = _manifest_file(tmp_path)
+    file.parent.mkdir()
+    file.write_text("not json", encoding="utf-8")
+    manifest = CPythonLinkManifest(tmp_path, _manifest_file(tmp_path))
+    assert manifest.get_changed([numpy], EMBED) == [numpy]
+
+
+def test_record_top_levels(tmp_path: Path) -> None:
+    numpy = _make_dist(tmp_path, "numpy", "1.24.0", [f"numpy/core/_multiarray.{GNU}.so", "six.py"])
+    rows = (numpy / "RECORD").read_text(encoding="utf-8")
+    (numpy / "RECORD").write_text(rows + "../../bin/f2py,,\n", encoding="utf-8")
+    assert get_record_top_levels(numpy) == ["numpy", numpy.name, "six.py"]
+
+
+def test_unowned_entries(tmp_path: Path) -> None:
+    numpy = _make_dist(tmp_path, "numpy", "1.24.0", [f"numpy/core/_multiarray.{GNU}.so"])
+    legacy = tmp_path / "legacy" / f"_speedups.{GNU}.so"
+    legacy.parent.mkdir()
+    legacy.write_bytes(b"")
+    (tmp_path / "legacy-1.0.egg-info").mkdir()
+    (tmp_path / f"_top.{GNU}.so").write_bytes(b"")
+    (tmp_path / "__pycache__").mkdir()
+    (tmp_path / CPythonLinkManifest.LEGACY_FILE_NAME).write_text("{}", encoding="utf-8")
+
+    assert get_unowned_entries(tmp_path, get_record_top_levels(numpy)) == [
+        tmp_path / f"_top.{GNU}.so",
+        tmp_path / "legacy",
+    ]
+
+
+def test_manifest_top_levels(tmp_path: Path) -> None:
+    numpy = _make_dist(tmp_path, "numpy", "1.24.0", [f"numpy/core/_multiarray.{GNU}.so"])
+    manifest = CPythonLinkManifest(tmp_path, _manifest_file(tmp_path))
+    manifest.mark(numpy, EMBED, [], ["cached"])
+    manifest.save()
+    # an unchanged RECORD is not read again.
+    assert CPythonLinkManifest(tmp_path, _manifest_file(tmp_path)).get_top_levels(numpy) == ["cached"]
+
+    record = numpy / "RECORD"
+    st = record.stat()
+    os.utime(record, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+    assert CPythonLinkManifest(tmp_path, _manifest_file(tmp_path)).get_top_levels(numpy) == ["numpy", numpy.name]
+
+
+def test_manifest_location(tmp_path: Path) -> None:
+    numpy = _make_dist(tmp_path, "numpy", "1.24.0", [])
+    legacy = tmp_path / CPythonLinkManifest.LEGACY_FILE_NAME
+    legacy.write_text("{}", encoding="utf-8")
+    file = _manifest_file(tmp_path)
+    manifest = CPythonLinkManifest(tmp_path, file)
+    manifest.mark(numpy, EMBED, [])
+    manifest.save()
+    assert file.exists()
+    assert not legacy.exists()
+    assert sorted(p.name for p in tmp_path.iterdir()) == [numpy.name]
+    # the manifest of another site-packages folder is not used.
+    other = tmp_path / "other"
+    other.mkdir()
+    assert CPythonLinkManifest(other, file).get_changed([numpy], EMBED) == [numpy]
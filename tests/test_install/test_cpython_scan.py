@@ -0,0 +1,77 @@
+from __future__ import annotations
+from pathlib import Path
+import os
+import pytest
+
+if __name__ == "__main__":
+    pytest.main([__file__])
+
+from oxt.___lo_pip___.install.post.cpython_scan import get_extension_suffix, scan_cpython
+
+pytestmark = pytest.mark.skipif(os.name == "nt", reason="symlinks require privileges on Windows")
+
+GNU = "cpython-38-x86_64-linux-gnu"
+EMBED = "cpython-3.8"
+
+
+def _make_site_packages(root: Path) -> None:
+    files = [
+        f"numpy/core/_multiarray.{GNU}.so",
+        f"numpy/linalg/lapack_lite.{GNU}.so",
+        f"pandas/_libs/indexers.{GNU}.so",
+        f"top_level.{GNU}.so",
+        "pandas/_libs/plain.so",
+        "pandas/__init__.py",
+    ]
+    for name in files:
+        pth = root / name
+        pth.parent.mkdir(parents=True, exist_ok=True)
+        pth.write_bytes(b"")
+    # an existing link and a broken link
+    (root / f"numpy/core/_multiarray.{EMBED}.so").symlink_to(root / f"numpy/core/_multiarray.{GNU}.so")
+    (root / f"pandas/_libs/gone.{EMBED}.so").symlink_to(root / f"pandas/_libs/gone.{GNU}.so")
+
+
+def test_get_extension_suffix() -> None:
+    assert get_extension_suffix(f"indexers.{GNU}.so") == GNU
+    assert get_extension_suffix(f"indexers.{EMBED}.so") == EMBED
+    assert get_extension_suffix("indexers.so") == ""
+    assert get_extension_suffix(f"indexers.{GNU}.py") == ""
+
+
+@pytest.mark.parametrize("max_workers", [1, 4])
+def test_scan(tmp_path: Path, max_workers: int) -> None:
+    _make_site_packages(tmp_path)
+    result = scan_cpython(tmp_path, EMBED, max_workers=max_workers)
+    assert result.file_suffix == GNU
+    assert result.suffixes == [GNU]
+    files = {p.relative_to(tmp_path).as_posix() for p in result.get_files(GNU)}
+    assert files == {
+        f"numpy/core/_multiarray.{GNU}.so",
+        f"numpy/linalg/lapack_lite.{GNU}.so",
+        f"pandas/_libs/indexers.{GNU}.so",
+        f"top_level.{GNU}.so",
+    }
+    links = {p.name for p in result.links}
+    assert links == {f"_multiarray.{EMBED}.so", f"gone.{EMBED}.so"}
+
+
+def test_scan_serial_and_parallel_match(tmp_path: Path) -> None:
+    _make_site_packages(tmp_path)
+    serial = scan_cpython(tmp_path, EMBED)
+    parallel = scan_cpython(tmp_path, EMBED, max_workers=4)
+    assert sorted(serial.get_files(GNU)) == sorted(parallel.get_files(GNU))
+    assert sorted(serial.links) == sorted(parallel.links)
+
+
+def test_scan_does_not_follow_dir_links(tmp_path: Path) -> None:
+    _make_site_packages(tmp_path)
+    (tmp_path / "loop").symlink_to(tmp_path, target_is_directory=True)
+    result = scan_cpython(tmp_path, EMBED)
+    assert len(result.get_files(GNU)) == 4
+
+
+def test_scan_missing_root(tmp_path: Path) -> None:
+    result = scan_cpython(tmp_path / "missing", EMBED)
+    assert result.file_suffix == ""
+    assert result.links == []
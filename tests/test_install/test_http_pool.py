@@ -0,0 +1,128 @@
+from __future__ import annotations
+import socket
+import pytest
+
+if __name__ == "__main__":
+    pytest.main([__file__])
+
+from urllib.error import URLError
+
+from oxt.___lo_pip___.install.http_pool import HttpPool
+
+
+def test_connection_is_reused(fake_server) -> None:
+    fake_server.files["/a"] = b"aaa"
+    fake_server.files["/b"] = b"bbb"
+    pool = HttpPool()
+    try:
+        assert pool.request(f"{fake_server.url}/a").data == b"aaa"
+        assert pool.request(f"{fake_server.url}/b").data == b"bbb"
+        assert pool.request(f"{fake_server.url}/a", method="HEAD").data == b""
+        assert pool.created_count == 1
+        assert pool.reused_count == 2
+        assert pool.idle_count == 1
+    finally:
+        pool.close()
+    assert pool.idle_count == 0
+
+
+def _reset_idle(pool: HttpPool) -> None:
+    """Breaks the idle connections like a server that closed them."""
+    for conns in pool._idle.values():
+        for conn, _ in conns:
+            conn.sock.shutdown(socket.SHUT_RDWR)
+
+
+def test_reset_retried_for_get_only(fake_server) -> None:
+    fake_server.files["/a"] = b"aaa"
+    pool = HttpPool()
+    try:
+        assert pool.request(f"{fake_server.url}/a").data == b"aaa"
+        _reset_idle(pool)
+        assert pool.request(f"{fake_server.url}/a").data == b"aaa"
+        assert pool.created_count == 2
+        _reset_idle(pool)
+        with pytest.raises(URLError):
+            pool.request(f"{fake_server.url}/a", method="POST", data=b"data")
+        assert pool.created_count == 2
+    finally:
+        pool.close()
+
+
+def test_progress_error_closes_connection(fake_server) -> None:
+    fake_server.files["/big"] = b"z" * 200_000
+    pool = HttpPool()
+    conns = []
+    checkout = pool._checkout
+
+    def record_checkout(*args):
+        conn, reused = checkout(*args)
+        conns.append(conn)
+        return conn, reused
+
+    def fail(read: int, total: int) -> None:
+        if read:
+            raise RuntimeError("progress failed")
+
+    pool._checkout = record_checkout  # type: ignore
+    try:
+        with pytest.raises(RuntimeError):
+            pool.request(f"{fake_server.url}/big", on_progress=fail)
+        assert conns[0].sock is None
+        assert pool.idle_count == 0
+        assert pool.request(f"{fake_server.url}/big").data == b"z" * 200_000
+        assert pool.idle_count == 1
+    finally:
+        pool.close()
+
+
+def test_error_status_does_not_raise(fake_server) -> None:
+    pool = HttpPool()
+    response = pool.request(f"{fake_server.url}/missing")
+    assert response.status == 404
+    # connection is still usable after an error response
+    fake_server.files["/a"] = b"aaa"
+    assert pool.request(f"{fake_server.url}/a").status == 200
+    assert pool.created_count == 1
+    pool.close()
+
+
+def test_redirect(fake_server) -> None:
+    fake_server.files["/real.whl"] = b"wheel"
+    fake_server.redirects["/latest.whl"] = "/real.whl"
+    pool = HttpPool()
+    response = pool.request(f"{fake_server.url}/latest.whl")
+    assert response.status == 200
+    assert response.data == b"wheel"
+    assert response.url.endswith("/real.whl")
+    pool.close()
+
+
+def test_evict_idle(fake_server) -> None:
+    fake_server.files["/a"] = b"aaa"
+    pool = HttpPool(max_idle=0.0)
+    pool.request(f"{fake_server.url}/a")
+    assert pool.idle_count == 1
+    assert pool.evict_idle() == 1
+    assert pool.idle_count == 0
+    pool.request(f"{fake_server.url}/a")
+    assert pool.created_count == 2
+
+
+def test_progress(fake_server) -> None:
+    data = b"x" * 200_000
+    fake_server.files["/big"] = data
+    progress = []
+    pool = HttpPool()
+    response = pool.request(f"{fake_server.url}/big", on_progress=lambda read, total: progress.append((read, total)))
+    assert response.data == data
+    assert progress[0] == (0, len(data))
+    assert progress[-1] == (len(data), len(data))
+    pool.close()
+
+
+def test_unreachable() -> None:
+    pool = HttpPool(timeout=2.0)
+    with pytest.raises(URLError):
+        # port 9 (discard) is not expected to be listening
+        pool.request("http://127.0.0.1:9/nothing")
@@ -0,0 +1,62 @@
+from __future__ import annotations
+from pathlib import Path
+import pytest
+
+if __name__ == "__main__":
+    pytest.main([__file__])
+
+from oxt.___lo_pip___.install.local_wheels import (
+    LOCAL_WHEELS_FILE,
+    get_local_packages,
+    read_local_wheels,
+    write_local_wheels,
+)
+
+
+def _touch(root: Path, *names: str) -> None:
+    for name in names:
+        (root / name).write_bytes(b"")
+
+
+def test_no_mapping(tmp_path: Path) -> None:
+    _touch(tmp_path, "b-1.0.tar.gz", "a-1.0-py3-none-any.whl", "readme.txt")
+    pkgs = get_local_packages(tmp_path)
+    assert [p.name for p in pkgs] == ["a-1.0-py3-none-any.whl", "b-1.0.tar.gz"]
+    assert pkgs[1].files == (tmp_path / "b-1.0.tar.gz",)
+
+
+def test_mapping(tmp_path: Path) -> None:
+    # pure wheel, the sdist was removed at build time
+    _touch(tmp_path, "pure-1.0-py3-none-any.whl")
+    # platform wheel, the sdist is kept as a fallback
+    _touch(tmp_path, "ext-2.0.tar.gz", "ext-2.0-cp38-cp38-linux_x86_64.whl")
+    _touch(tmp_path, "other-1.0.tar.gz")
+    write_local_wheels(
+        tmp_path,
+        {"pure-1.0.tar.gz": "pure-1.0-py3-none-any.whl", "ext-2.0.tar.gz": "ext-2.0-cp38-cp38-linux_x86_64.whl"},
+    )
+    assert read_local_wheels(tmp_path)["pure-1.0.tar.gz"] == "pure-1.0-py3-none-any.whl"
+
+    pkgs = {p.name: p.files for p in get_local_packages(tmp_path)}
+    assert list(pkgs) == ["ext-2.0.tar.gz", "other-1.0.tar.gz", "pure-1.0.tar.gz"]
+    assert pkgs["pure-1.0.tar.gz"] == (tmp_path / "pure-1.0-py3-none-any.whl",)
+    assert pkgs["ext-2.0.tar.gz"] == (
+        tmp_path / "ext-2.0-cp38-cp38-linux_x86_64.whl",
+        tmp_path / "ext-2.0.tar.gz",
+    )
+
+
+def test_mapping_missing_files(tmp_path: Path) -> None:
+    write_local_wheels(tmp_path, {"gone-1.0.tar.gz": "gone-1.0-py3-none-any.whl"})
+    assert get_local_packages(tmp_path) == []
+
+
+def test_mapping_corrupt(tmp_path: Path) -> None:
+    (tmp_path / LOCAL_WHEELS_FILE).write_text("[1, 2]", encoding="utf-8")
+    _touch(tmp_path, "a-1.0.tar.gz")
+    assert read_local_wheels(tmp_path) == {}
+    assert [p.name for p in get_local_packages(tmp_path)] == ["a-1.0.tar.gz"]
+
+
+def test_missing_folder(tmp_path: Path) -> None:
+    assert get_local_packages(tmp_path / "local") == []
@@ -0,0 +1,127 @@
+from __future__ import annotations
+import socket
+from urllib.error import URLError
+import pytest
+
+if __name__ == "__main__":
+    pytest.main([__file__])
+
+from oxt.___lo_pip___.install.artifact_cache import ArtifactCache, CacheStatus
+from oxt.___lo_pip___.install.http_pool import HttpPool
+from oxt.___lo_pip___.install.mirrors import MirrorRanker, RetryPolicy, request_with_retry
+
+
+def _closed_url() -> str:
+    """Gets a url on a local port that nothing listens on."""
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        port = s.getsockname()[1]
+    return f"http://127.0.0.1:{port}/file.txt"
+
+
+def test_retry_delay() -> None:
+    policy = RetryPolicy(retries=5, backoff=0.5, max_backoff=3.0, jitter=0.5)
+    # rand of 0.5 adds no jitter
+    assert [policy.get_delay(i, rand=lambda: 0.5) for i in range(4)] == [0.5, 1.0, 2.0, 3.0]
+    assert policy.get_delay(1, rand=lambda: 0.0) == pytest.approx(0.5)
+    assert policy.get_delay(1, rand=lambda: 1.0) == pytest.approx(1.5)
+
+
+def test_retry_until_success(fake_server) -> None:
+    fake_server.files["/file.txt"] = b"data"
+    fake_server.fail_count = 2
+    delays = []
+    response = request_with_retry(
+        HttpPool(), f"{fake_server.url}/file.txt", RetryPolicy(retries=3), sleep=delays.append
+    )
+    assert response.status == 200
+    assert response.data == b"data"
+    assert len(fake_server.requests) == 3
+    assert len(delays) == 2
+
+
+def test_retry_gives_up(fake_server) -> None:
+    fake_server.files["/file.txt"] = b"data"
+    fake_server.fail_count = 5
+    response = request_with_retry(
+        HttpPool(), f"{fake_server.url}/file.txt", RetryPolicy(retries=2), sleep=lambda _: None
+    )
+    assert response.status == 503
+    assert len(fake_server.requests) == 3
+
+
+def test_retry_not_found_is_not_retried(fake_server) -> None:
+    response = request_with_retry(
+        HttpPool(), f"{fake_server.url}/missing.txt", RetryPolicy(retries=3), sleep=lambda _: None
+    )
+    assert response.status == 404
+    assert len(fake_server.requests) == 1
+
+
+def test_retry_unreachable_raises() -> None:
+    delays = []
+    with pytest.raises(URLError):
+        request_with_retry(HttpPool(), _closed_url(), RetryPolicy(retries=2), sleep=delays.append)
+    assert len(delays) == 2
+
+
+def test_rank_unreachable_last(fake_server, tmp_path) -> None:
+    fake_server.files["/file.txt"] = b"data"
+    bad = _closed_url()
+    good = f"{fake_server.url}/file.txt"
+    ranker = MirrorRanker(HttpPool(), cache_file=tmp_path / "mirrors.json")
+    assert ranker.rank([bad, good]) == [good, bad]
+
+
+def test_rank_is_cached(fake_server, tmp_path) -> None:
+    fake_server.files["/a.txt"] = b"a"
+    fake_server.files["/b.txt"] = b"b"
+    urls = [f"{fake_server.url}/a.txt", f"{fake_server.url}/b.txt"]
+    cache_file = tmp_path / "mirrors.json"
+    first = MirrorRanker(HttpPool(), cache_file=cache_file).rank(urls)
+    count = len(fake_server.requests)
+    assert count == 2
+    assert cache_file.exists()
+
+    # a new ranker, as in a new session, reuses the saved ranking
+    second = MirrorRanker(HttpPool(), cache_file=cache_file).rank(list(reversed(urls)))
+    assert second == first
+    assert len(fake_server.requests) == count
+
+    MirrorRanker(HttpPool(), cache_file=cache_file).rank(urls, refresh=True)
+    assert len(fake_server.requests) == count + 2
+
+
+def test_rank_expired(fake_server, tmp_path) -> None:
+    fake_server.files["/a.txt"] = b"a"
+    fake_server.files["/b.txt"] = b"b"
+    urls = [f"{fake_server.url}/a.txt", f"{fake_server.url}/b.txt"]
+    ranker = MirrorRanker(HttpPool(), cache_file=tmp_path / "mirrors.json", ttl=0.0)
+    ranker.rank(urls)
+    ranker.rank(urls)
+    assert len(fake_server.requests) == 4
+
+
+def test_cache_fetch_mirror_failover(fake_server, tmp_path) -> None:
+    fake_server.files["/mirror/file.txt"] = b"mirror data"
+    primary = _closed_url()
+    mirror = f"{fake_server.url}/mirror/file.txt"
+    cache = ArtifactCache(tmp_path, retry=RetryPolicy(retries=0))
+    result = cache.fetch(primary, mirrors=[primary, mirror])
+    assert result.status == CacheStatus.DOWNLOADED
+    assert result.path is not None
+    assert result.path.read_bytes() == b"mirror data"
+    # stored under the primary url
+    assert cache.get_cached(primary) == result.path
+    assert cache.get_cached(mirror) is None
+
+
+def test_cache_fetch_all_mirrors_fail_uses_cache(fake_server, tmp_path) -> None:
+    fake_server.files["/file.txt"] = b"data"
+    url = f"{fake_server.url}/file.txt"
+    cache = ArtifactCache(tmp_path)
+    assert cache.fetch(url).status == CacheStatus.DOWNLOADED
+    result = cache.fetch(url, mirrors=[_closed_url(), _closed_url()])
+    assert result.status == CacheStatus.OFFLINE
+    assert result.path is not None
+    assert result.path.read_bytes() == b"data"
@@ -0,0 +1,78 @@
+from __future__ import annotations
+import pytest
+
+if __name__ == "__main__":
+    pytest.main([__file__])
+
+from concurrent.futures import wait
+
+from oxt.___lo_pip___.install.artifact_cache import ArtifactCache, CacheStatus
+from oxt.___lo_pip___.install.multi_download import DownloadItem, MultiDownload
+
+
+def test_download_many(fake_server, tmp_path) -> None:
+    for i in range(5):
+        fake_server.files[f"/pkg{i}.whl"] = bytes([i]) * (1000 * (i + 1))
+    downloader = MultiDownload(ArtifactCache(tmp_path), max_workers=3)
+    tasks = downloader.start([f"{fake_server.url}/pkg{i}.whl" for i in range(5)])
+    wait([t.future for t in tasks], timeout=10)
+    for i, task in enumerate(tasks):
+        result = task.future.result()
+        assert result.status == CacheStatus.DOWNLOADED
+        assert result.path is not None
+        assert result.path.read_bytes() == bytes([i]) * (1000 * (i + 1))
+        assert task.done
+        assert task.read == task.total == 1000 * (i + 1)
+        assert task.percent == 100.0
+
+
+def test_error_is_isolated(fake_server, tmp_path) -> None:
+    fake_server.files["/good.whl"] = b"good"
+    cache = ArtifactCache(tmp_path)
+    tasks = MultiDownload(cache).start(
+        [
+            DownloadItem(f"{fake_server.url}/missing.whl"),
+            DownloadItem(f"{fake_server.url}/good.whl", filename="renamed.whl"),
+            DownloadItem("ftp://unsupported/file.whl"),
+        ]
+    )
+    wait([t.future for t in tasks], timeout=10)
+    assert tasks[0].future.result().status == CacheStatus.FAILED
+    good = tasks[1].future.result()
+    assert good.status == CacheStatus.DOWNLOADED
+    assert good.path is not None
+    assert good.path.name == "renamed.whl"
+    assert tasks[2].future.result().status == CacheStatus.FAILED
+
+
+def test_progress_callback(fake_server, tmp_path) -> None:
+    fake_server.files["/big.whl"] = b"z" * 300_000
+    seen = []
+    tasks = MultiDownload(ArtifactCache(tmp_path)).start(
+        [f"{fake_server.url}/big.whl"], on_progress=lambda task: seen.append(task.read)
+    )
+    tasks[0].future.result(timeout=10)
+    assert seen[0] == 0
+    assert seen[-1] == 300_000
+    assert seen == sorted(seen)
+
+
+def test_empty(tmp_path) -> None:
+    assert MultiDownload(ArtifactCache(tmp_path)).start([]) == []
+    with pytest.raises(ValueError):
+        MultiDownload(ArtifactCache(tmp_path), max_workers=0)
+
+
+def test_mirrors(fake_server, tmp_path) -> None:
+    fake_server.files["/mirror/pkg.whl"] = b"from mirror"
+    cache = ArtifactCache(tmp_path)
+    url = f"{fake_server.url}/pkg.whl"
+    tasks = MultiDownload(cache).start(
+        [DownloadItem(url, mirrors=(f"{fake_server.url}/missing/pkg.whl", f"{fake_server.url}/mirror/pkg.whl"))]
+    )
+    result = tasks[0].future.result(timeout=10)
+    assert result.status == CacheStatus.DOWNLOADED
+    assert result.path is not None
+    assert result.path.read_bytes() == b"from mirror"
+    # the url is the cache key.
+    assert cache.get_cached(url) == result.path
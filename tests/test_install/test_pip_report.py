@@ -0,0 +1,28 @@
+from __future__ import annotations
+import pytest
+
+if __name__ == "__main__":
+    pytest.main([__file__])
+
+from oxt.___lo_pip___.install.pip_report import get_installed_from_output, normalize_name
+
+
+def test_normalize_name() -> None:
+    assert normalize_name("Foo.Bar") == "foo_bar"
+    assert normalize_name("foo-bar") == "foo_bar"
+    assert normalize_name("typing_extensions") == "typing_extensions"
+
+
+def test_installed_from_output() -> None:
+    output = """Collecting pandas
+  Downloading pandas-2.1.0-cp311-cp311-manylinux_2_17_x86_64.whl (12.2 MB)
+Installing collected packages: pytz, numpy, python-dateutil, pandas
+Successfully installed numpy-1.26.0 pandas-2.1.0 python-dateutil-2.8.2 pytz-2023.3
+"""
+    assert get_installed_from_output(output) == {"numpy", "pandas", "python_dateutil", "pytz"}
+
+
+def test_installed_from_output_nothing() -> None:
+    output = "Requirement already satisfied: verr in ./site-packages (1.1.2)\n"
+    assert get_installed_from_output(output) == set()
+    assert get_installed_from_output("") == set()
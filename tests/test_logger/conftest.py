@@ -0,0 +1,13 @@
+from __future__ import annotations
+from pathlib import Path
+import sys
+import types
+
+try:
+    import oxt.___lo_pip___.oxt_logger  # noqa: F401
+except ImportError:
+    # the package imports OxtLogger which needs uno, register the package only
+    # so the queue and handler modules can be imported on their own.
+    _pkg = types.ModuleType("oxt.___lo_pip___.oxt_logger")
+    _pkg.__path__ = [str(Path(__file__).parents[2] / "oxt" / "___lo_pip___" / "oxt_logger")]
+    sys.modules[_pkg.__name__] = _pkg
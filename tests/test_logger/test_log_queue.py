@@ -0,0 +1,91 @@
+from __future__ import annotations
+from pathlib import Path
+from logging.handlers import QueueHandler
+import logging
+import pytest
+
+if __name__ == "__main__":
+    pytest.main([__file__])
+
+from oxt.___lo_pip___.oxt_logger.log_queue import CaptureQueueHandler, LogQueue
+
+FMT = "%(levelname)s - %(message)s"
+
+
+@pytest.fixture
+def log_queue():
+    lq = LogQueue()
+    yield lq
+    lq.stop()
+
+
+def _record(level: int, msg: str, *args: object) -> logging.LogRecord:
+    return logging.LogRecord("test", level, __file__, 0, msg, args, None)
+
+
+def test_null_handler(log_queue: LogQueue) -> None:
+    handler = log_queue.get_handler(log_file="", add_console=False, level=logging.ERROR, log_format=FMT)
+    assert isinstance(handler, logging.NullHandler)
+
+
+def test_shared_handler(log_queue: LogQueue, tmp_path: Path) -> None:
+    log_file = str(tmp_path / "log.txt")
+    h1 = log_queue.get_handler(log_file=log_file, add_console=False, level=logging.INFO, log_format=FMT)
+    h2 = log_queue.get_handler(log_file=log_file, add_console=False, level=logging.INFO, log_format=FMT)
+    h3 = log_queue.get_handler(log_file=log_file, add_console=False, level=logging.ERROR, log_format=FMT)
+    assert h1 is h2
+    assert h1 is not h3
+    assert type(h1) is QueueHandler
+
+
+def test_ring_handler(log_queue: LogQueue, tmp_path: Path) -> None:
+    log_file = str(tmp_path / "log.txt")
+    handler = log_queue.get_handler(
+        log_file=log_file, add_console=False, level=logging.ERROR, log_format=FMT, ring_size=10
+    )
+    assert isinstance(handler, CaptureQueueHandler)
+    # no ring buffer when the level already logs everything.
+    handler = log_queue.get_handler(
+        log_file=log_file, add_console=False, level=logging.DEBUG, log_format=FMT, ring_size=10
+    )
+    assert not isinstance(handler, CaptureQueueHandler)
+
+
+def test_ring_written_on_error(log_queue: LogQueue, tmp_path: Path) -> None:
+    log_file = tmp_path / "log.txt"
+    handler = log_queue.get_handler(
+        log_file=str(log_file), add_console=False, level=logging.ERROR, log_format=FMT, ring_size=2
+    )
+    assert isinstance(handler, CaptureQueueHandler)
+    handler.capture(_record(logging.DEBUG, "dropped"))
+    handler.capture(_record(logging.DEBUG, "debug %s", 1))
+    handler.capture(_record(logging.INFO, "info %s", 2))
+    log_queue.stop()
+    assert not log_file.exists()
+
+    handler = log_queue.get_handler(
+        log_file=str(log_file), add_console=False, level=logging.ERROR, log_format=FMT, ring_size=2
+    )
+    handler.capture(_record(logging.DEBUG, "dropped"))
+    handler.capture(_record(logging.DEBUG, "debug %s", 1))
+    handler.capture(_record(logging.INFO, "info %s", 2))
+    handler.handle(_record(logging.ERROR, "error"))
+    log_queue.stop()
+    assert log_file.read_text(encoding="utf8").splitlines() == ["DEBUG - debug 1", "INFO - info 2", "ERROR - error"]
+
+
+def test_json_timing_only(log_queue: LogQueue, tmp_path: Path) -> None:
+    json_file = tmp_path / "timing.jsonl"
+    handler = log_queue.get_handler(
+        log_file="", add_console=False, level=logging.ERROR, log_format=FMT, json_file=str(json_file)
+    )
+    assert isinstance(handler, QueueHandler)
+    handler.handle(_record(logging.ERROR, "not timing"))
+    record = _record(logging.INFO, "timing")
+    record.phase = "startup"
+    record.duration = 1.5
+    handler.handle(record)
+    log_queue.stop()
+    lines = json_file.read_text(encoding="utf8").splitlines()
+    assert len(lines) == 1
+    assert '"phase": "startup"' in lines[0]
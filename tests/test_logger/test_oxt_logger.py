@@ -0,0 +1,65 @@
+from __future__ import annotations
+from pathlib import Path
+import importlib
+import logging
+import sys
+import types
+import pytest
+
+if __name__ == "__main__":
+    pytest.main([__file__])
+
+from oxt.___lo_pip___.oxt_logger.log_queue import LogQueue
+
+PKG = "oxt.___lo_pip___.oxt_logger"
+
+
+@pytest.fixture
+def make_logger(monkeypatch: pytest.MonkeyPatch):
+    """Imports ``OxtLogger`` with a fake ``LoggerConfig`` and gets a function that creates a logger."""
+
+    class LoggerConfig:
+        log_file = ""
+        log_name = "test_oxt_logger"
+        log_format = "%(levelname)s - %(message)s"
+        log_json_file = ""
+        log_add_console = False
+        log_ring_buffer_size = 0
+        log_level = 0
+
+        def trigger_log_ready_event(self) -> None:
+            pass
+
+    logger_config = types.ModuleType(f"{PKG}.logger_config")
+    logger_config.LoggerConfig = LoggerConfig  # type: ignore
+    monkeypatch.setitem(sys.modules, logger_config.__name__, logger_config)
+    monkeypatch.delitem(sys.modules, f"{PKG}.oxt_logger", raising=False)
+    oxt_logger = importlib.import_module(f"{PKG}.oxt_logger")
+
+    def make(level: int, log_file: str = "", ring_size: int = 0):
+        monkeypatch.setattr(LoggerConfig, "log_level", level)
+        monkeypatch.setattr(LoggerConfig, "log_ring_buffer_size", ring_size)
+        return oxt_logger.OxtLogger(log_file=log_file, log_name=f"test_oxt_logger_{level}_{ring_size}")
+
+    yield make
+    LogQueue().stop()
+    sys.modules.pop(f"{PKG}.oxt_logger", None)
+
+
+def test_is_debug(make_logger) -> None:
+    # NONE is level 0.
+    assert make_logger(0).is_debug is False
+    assert make_logger(logging.DEBUG).is_debug is True
+    assert make_logger(logging.INFO).is_debug is False
+    assert make_logger(logging.ERROR, ring_size=10).is_debug is False
+
+
+def test_ring_buffer_capture(make_logger, tmp_path: Path) -> None:
+    log_file = tmp_path / "log.txt"
+    logger = make_logger(logging.ERROR, log_file=str(log_file), ring_size=10)
+    assert logger.getEffectiveLevel() == logging.ERROR
+    logger.debug("debug %s", 1)
+    logger.info("info %s", 2)
+    logger.error("error")
+    LogQueue().stop()
+    assert log_file.read_text(encoding="utf8").splitlines() == ["DEBUG - debug 1", "INFO - info 2", "ERROR - error"]
@@ -0,0 +1,61 @@
+from __future__ import annotations
+from typing import List
+import logging
+import pytest
+
+if __name__ == "__main__":
+    pytest.main([__file__])
+
+from oxt.___lo_pip___.oxt_logger.ring_buffer_handler import RingBufferHandler
+
+
+class _ListHandler(logging.Handler):
+    def __init__(self) -> None:
+        super().__init__()
+        self.records: List[logging.LogRecord] = []
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.records.append(record)
+
+
+def _record(level: int, msg: str) -> logging.LogRecord:
+    return logging.LogRecord("test", level, __file__, 0, msg, None, None)
+
+
+def test_buffers_below_level() -> None:
+    target = _ListHandler()
+    handler = RingBufferHandler(target, capacity=10, level=logging.WARNING)
+    handler.handle(_record(logging.DEBUG, "debug"))
+    handler.handle(_record(logging.INFO, "info"))
+    handler.handle(_record(logging.WARNING, "warning"))
+    assert [r.msg for r in target.records] == ["warning"]
+    assert handler.buffered == 2
+
+
+def test_flush_on_error() -> None:
+    target = _ListHandler()
+    handler = RingBufferHandler(target, capacity=10, level=logging.WARNING)
+    handler.handle(_record(logging.DEBUG, "one"))
+    handler.handle(_record(logging.INFO, "two"))
+    handler.handle(_record(logging.ERROR, "error"))
+    assert [r.msg for r in target.records] == ["one", "two", "error"]
+    assert handler.buffered == 0
+
+
+def test_capacity_drops_oldest() -> None:
+    target = _ListHandler()
+    handler = RingBufferHandler(target, capacity=3, level=logging.ERROR)
+    for i in range(5):
+        handler.handle(_record(logging.DEBUG, str(i)))
+    assert handler.buffered == 3
+    handler.handle(_record(logging.CRITICAL, "critical"))
+    assert [r.msg for r in target.records] == ["2", "3", "4", "critical"]
+
+
+def test_close_drops_buffer() -> None:
+    target = _ListHandler()
+    handler = RingBufferHandler(target, capacity=3, level=logging.ERROR)
+    handler.handle(_record(logging.DEBUG, "debug"))
+    handler.close()
+    assert handler.buffered == 0
+    assert target.records == []
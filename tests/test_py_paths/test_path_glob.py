@@ -0,0 +1,75 @@
+from __future__ import annotations
+from pathlib import Path
+import os
+import threading
+import time
+import pytest
+
+if __name__ == "__main__":
+    pytest.main([__file__])
+
+from oxt.___lo_pip___.py_paths.path_glob import PathGlobCache, expand_glob, is_glob_pattern
+
+
+def _make_envs(root: Path, *names: str) -> None:
+    for name in names:
+        (root / "envs" / name / "lib" / "python3.11" / "site-packages").mkdir(parents=True)
+
+
+def test_is_glob_pattern() -> None:
+    assert is_glob_pattern("~/envs/*/lib")
+    assert is_glob_pattern("/x/python3.?")
+    assert not is_glob_pattern("/home/user/envs")
+
+
+def test_expand_glob(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("HOME", str(tmp_path))
+    _make_envs(tmp_path, "b", "a", ".hidden")
+    (tmp_path / "envs" / "c" / "lib").mkdir(parents=True)
+    paths, dirs = expand_glob("~/envs/*/lib/python3.*/site-packages")
+    assert paths == [
+        os.path.join(tmp_path, "envs", name, "lib", "python3.11", "site-packages") for name in ("a", "b")
+    ]
+    assert str(tmp_path / "envs") in dirs
+
+
+def test_cache_reused_until_a_directory_changes(tmp_path: Path) -> None:
+    _make_envs(tmp_path, "a")
+    pattern = str(tmp_path / "envs" / "*" / "lib" / "python3.*" / "site-packages")
+    file = tmp_path / "globs.json"
+    cache = PathGlobCache(file)
+    assert len(cache.expand_all([pattern, "/plain"])) == 2
+    cache.save()
+
+    cache = PathGlobCache(file)
+    assert len(cache.expand(pattern)) == 1
+    assert (cache.hits, cache.misses) == (1, 0)
+
+    _make_envs(tmp_path, "b")
+    # keep the test independent of the file system mtime resolution.
+    envs = tmp_path / "envs"
+    st = os.stat(envs)
+    os.utime(envs, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+    cache = PathGlobCache(file)
+    assert len(cache.expand(pattern)) == 2
+    assert (cache.hits, cache.misses) == (0, 1)
+
+
+def test_expand_all_deadline(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    from oxt.___lo_pip___.py_paths import path_glob
+
+    release = threading.Event()
+
+    def hang(pattern: str):
+        release.wait(10)
+        return [], []
+
+    monkeypatch.setattr(path_glob, "expand_glob", hang)
+    cache = PathGlobCache(tmp_path / "globs.json")
+    start = time.monotonic()
+    try:
+        assert cache.expand_all([str(tmp_path / "*"), "/plain"], timeout=0.2) == ["/plain"]
+        assert time.monotonic() - start < 5
+        assert cache.timeouts == 1
+    finally:
+        release.set()
@@ -0,0 +1,92 @@
+from __future__ import annotations
+import pytest
+
+if __name__ == "__main__":
+    pytest.main([__file__])
+
+from oxt.___lo_pip___.py_paths import PathItems
+from oxt.___lo_pip___.py_paths import path_items
+
+
+def test_add_path_dedupes_normalized() -> None:
+    items = PathItems(["/a/b", "/a/c", "/a/b/", "/a/./c"])
+    assert items.get_as_tuple() == ("/a/b", "/a/c")
+    assert items.add_path("/a/b/") is items.find_path_item("/a/b")
+    assert "/a/c/" in items
+
+
+def test_remove_path_renumbers_sort_order() -> None:
+    items = PathItems(["/a", "/b", "/c", "/d"])
+    items.remove_path("/b")
+    items.remove_path("/missing")
+    assert [(p.path, p.sort_order) for p in items] == [("/a", 1), ("/c", 2), ("/d", 3)]
+
+
+def test_move_up_down() -> None:
+    items = PathItems(["/a", "/b", "/c"])
+    c = items.find_path_item("/c")
+    assert c is not None
+    items.move_up(c)
+    assert items.get_as_tuple() == ("/a", "/c", "/b")
+    items.move_down(c)
+    items.move_down(c)
+    assert items.get_as_tuple() == ("/a", "/b", "/c")
+    assert c.sort_order == 3
+
+
+def test_update_from_set_keeps_order() -> None:
+    items = PathItems(["/a", "/b", "/c"])
+    other = PathItems()
+    other.update_from_set(items.get_as_item_set())
+    assert other.get_as_tuple() == ("/a", "/b", "/c")
+
+
+def test_union() -> None:
+    items = PathItems(["/a", "/b"]).union(PathItems(["/b", "/c"]))
+    assert items.get_as_tuple() == ("/a", "/b", "/c")
+
+
+def test_10k_one_key_per_operation(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls = 0
+    get_key = path_items._get_key
+
+    def counting_get_key(pth: str) -> str:
+        nonlocal calls
+        calls += 1
+        return get_key(pth)
+
+    monkeypatch.setattr(path_items, "_get_key", counting_get_key)
+    paths = [f"/opt/generated/lib{i}/site-packages" for i in range(10_000)]
+    items = PathItems(paths)
+    for pth in paths:
+        assert items.find_path_item(pth) is not None
+        items.add_path(pth)
+    for pth in paths[::2]:
+        items.remove_path(pth)
+    orders = [p.sort_order for p in items]
+
+    assert len(items) == 5_000
+    assert orders == list(range(1, 5_001))
+    # each build, lookup, add and remove is one dict lookup by key, the linear scan version compared every item.
+    assert calls == 35_000
+
+
+def test_extend_and_remove_many() -> None:
+    items = PathItems(["/a"])
+    items.extend(["/b", "/a/", "", "/c", "/b"])
+    assert items.get_as_tuple() == ("/a", "/b", "/c")
+    assert items.remove_many(["/a", "/missing", "/c/"]) == 2
+    assert [(p.path, p.sort_order) for p in items] == [("/b", 1)]
+
+
+def test_reorder() -> None:
+    items = PathItems(["/a", "/b", "/c", "/d"])
+    items.reorder({"/d": 0, "/b": 10})
+    assert [(p.path, p.sort_order) for p in items] == [("/d", 1), ("/a", 2), ("/c", 3), ("/b", 4)]
+
+
+def test_merge_in_place() -> None:
+    items = PathItems(["/a", "/b"])
+    items.merge(PathItems(["/b", "/c"]))
+    items.merge(["/d"])
+    assert items.get_as_tuple() == ("/a", "/b", "/c", "/d")
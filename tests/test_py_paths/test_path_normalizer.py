@@ -0,0 +1,92 @@
+from __future__ import annotations
+from pathlib import Path
+import os
+import pytest
+
+if __name__ == "__main__":
+    pytest.main([__file__])
+
+from oxt.___lo_pip___.py_paths import PathItems, PathNormalizer
+
+
+def test_normalize_spellings(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("HOME", str(tmp_path))
+    real = tmp_path / "x"
+    real.mkdir()
+    link = tmp_path / "link"
+    link.symlink_to(real)
+    normalizer = PathNormalizer()
+    expected = os.path.realpath(real)
+    assert normalizer.normalize("~/x") == expected
+    assert normalizer.normalize(f"{real}{os.sep}") == expected
+    assert normalizer.normalize(link) == expected
+    assert normalizer.normalize("") == ""
+
+
+def test_normalize_is_cached(tmp_path: Path) -> None:
+    normalizer = PathNormalizer()
+    pth = str(tmp_path / "cached")
+    normalizer.normalize(pth)
+    hits = normalizer.hits
+    normalizer.normalize(pth)
+    assert normalizer.hits == hits + 1
+
+
+def test_dedupe_reports_collapsed(tmp_path: Path) -> None:
+    real = tmp_path / "x"
+    real.mkdir()
+    link = tmp_path / "link"
+    link.symlink_to(real)
+    paths = [str(real), str(tmp_path / "y"), f"{real}{os.sep}", str(link)]
+    kept, collapsed = PathNormalizer().dedupe(paths)
+    assert kept == [str(real), str(tmp_path / "y")]
+    assert collapsed == {str(real): [f"{real}{os.sep}", str(link)]}
+
+
+def test_path_items_keys_are_lexical(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    real = tmp_path / "x"
+    real.mkdir()
+    link = tmp_path / "link"
+    link.symlink_to(real)
+    monkeypatch.setenv("HOME", str(tmp_path))
+
+    def no_stat(*args, **kwargs):
+        raise AssertionError("PathItems must not touch the file system")
+
+    monkeypatch.setattr(os, "stat", no_stat)
+    monkeypatch.setattr(os.path, "realpath", no_stat)
+    items = PathItems([str(link), str(real), "~/x", f"{real}{os.sep}", str(tmp_path / "y" / ".." / "x")])
+    # symlinks are resolved by py_runner after the paths are verified, not here.
+    assert items.get_as_tuple() == (str(link), str(real))
+
+
+def test_dedupe_lexical(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    real = tmp_path / "x"
+    link = tmp_path / "link"
+
+    def no_realpath(*args, **kwargs):
+        raise AssertionError("realpath must not be called")
+
+    monkeypatch.setattr(os.path, "realpath", no_realpath)
+    paths = [str(real), f"{real}{os.sep}", str(link)]
+    kept, collapsed = PathNormalizer().dedupe(paths, resolve=False)
+    assert kept == [str(real), str(link)]
+    assert collapsed == {str(real): [f"{real}{os.sep}"]}
+
+
+def test_normalize_cache_expires(tmp_path: Path) -> None:
+    class _Normalizer(PathNormalizer):
+        """Own singleton instance with no caching."""
+
+    normalizer = _Normalizer(ttl=0.0)
+    first = tmp_path / "first"
+    first.mkdir()
+    second = tmp_path / "second"
+    second.mkdir()
+    link = tmp_path / "link"
+    link.symlink_to(first)
+    assert normalizer.normalize(link) == os.path.realpath(first)
+    # the link is pointed elsewhere during the session.
+    link.unlink()
+    link.symlink_to(second)
+    assert normalizer.normalize(link) == os.path.realpath(second)
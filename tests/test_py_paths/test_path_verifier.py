@@ -0,0 +1,63 @@
+from __future__ import annotations
+from pathlib import Path
+import threading
+import time
+import pytest
+
+if __name__ == "__main__":
+    pytest.main([__file__])
+
+from oxt.___lo_pip___.py_paths import PathVerifier
+
+
+class _HungVerifier(PathVerifier):
+    """Paths named ``hung`` block like a dead network mount until released."""
+
+    release = threading.Event()
+    calls = 0
+
+    def _exists(self, pth: str) -> bool:
+        _HungVerifier.calls += 1
+        if Path(pth).name == "hung":
+            self.release.wait(10)
+        return super()._exists(pth)
+
+
+def test_verify(tmp_path: Path) -> None:
+    missing = str(tmp_path / "missing")
+    result = PathVerifier().verify([str(tmp_path), missing, str(tmp_path)])
+    assert result == {str(tmp_path): True, missing: False}
+
+
+def test_hung_path_times_out_and_positive_results_are_cached(tmp_path: Path) -> None:
+    verifier = _HungVerifier(timeout=0.2)
+    hung = str(tmp_path / "hung")
+    start = time.perf_counter()
+    result = verifier.verify([hung, str(tmp_path)])
+    assert time.perf_counter() - start < 2
+    assert result == {hung: False, str(tmp_path): True}
+
+    calls = _HungVerifier.calls
+    # the hung path is still being checked and the existing path is cached, neither is checked again.
+    assert verifier.verify([hung, str(tmp_path)], timeout=0.0) == {hung: False, str(tmp_path): True}
+    assert _HungVerifier.calls == calls
+    _HungVerifier.release.set()
+
+
+class _BoundedVerifier(PathVerifier):
+    """Own singleton instance so the worker limit is not shared with the other tests."""
+
+
+def test_workers_are_bounded(tmp_path: Path) -> None:
+    verifier = _BoundedVerifier(max_workers=3)
+    paths = [str(tmp_path / f"p{i}") for i in range(50)]
+    for pth in paths[::2]:
+        Path(pth).mkdir()
+    before = threading.active_count()
+    result = verifier.verify(paths)
+    assert result == {pth: i % 2 == 0 for i, pth in enumerate(paths)}
+    assert verifier.workers == 3
+    assert threading.active_count() - before <= 3
+    # the workers are reused by the next call.
+    verifier.verify([str(tmp_path / "other")])
+    assert verifier.workers == 3
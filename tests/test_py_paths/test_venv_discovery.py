@@ -0,0 +1,63 @@
+from __future__ import annotations
+from pathlib import Path
+import os
+import pytest
+
+if __name__ == "__main__":
+    pytest.main([__file__])
+
+from oxt.___lo_pip___.py_paths.venv_discovery import VenvDiscovery, get_venv_version
+
+
+def _make_venv(folder: Path, version: str, key: str = "version") -> Path:
+    site_packages = folder / "lib" / f"python{'.'.join(version.split('.')[:2])}" / "site-packages"
+    site_packages.mkdir(parents=True)
+    (folder / "pyvenv.cfg").write_text(f"home = /usr/bin\n{key} = {version}\n", encoding="utf-8")
+    return site_packages
+
+
+def _touch(folder: Path) -> None:
+    # keep the test independent of the file system mtime resolution.
+    st = os.stat(folder)
+    os.utime(folder, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+
+def test_get_venv_version(tmp_path: Path) -> None:
+    cfg = tmp_path / "pyvenv.cfg"
+    cfg.write_text("home = /usr/bin\nversion_info = 3.12.1.final.0\n", encoding="utf-8")
+    assert get_venv_version(cfg) == "3.12.1.final.0"
+    assert get_venv_version(tmp_path / "missing.cfg") == ""
+
+
+def test_discover_matches_version(tmp_path: Path) -> None:
+    match = _make_venv(tmp_path / "projects" / "a" / ".venv", "3.11.4")
+    _make_venv(tmp_path / "projects" / "b" / ".venv", "3.12.0")
+    _make_venv(tmp_path / "envs" / "c", "3.11.9.final.0", key="version_info")
+    too_deep = tmp_path / "envs" / "1" / "2" / "3" / "4"
+    _make_venv(too_deep, "3.11.0")
+
+    venvs = VenvDiscovery("3.11").discover([str(tmp_path / "projects"), str(tmp_path / "envs")])
+    assert [v.site_packages for v in venvs] == [
+        str(match),
+        str(tmp_path / "envs" / "c" / "lib" / "python3.11" / "site-packages"),
+    ]
+
+
+def test_discover_rescans_changed_roots_only(tmp_path: Path) -> None:
+    root_a = tmp_path / "a"
+    root_b = tmp_path / "b"
+    _make_venv(root_a / "env1", "3.11.0")
+    _make_venv(root_b / "env1", "3.11.0")
+    cache_file = tmp_path / "cache" / "venvs.json"
+    roots = [str(root_a), str(root_b)]
+    assert len(VenvDiscovery("3.11", cache_file).discover(roots)) == 2
+
+    discovery = VenvDiscovery("3.11", cache_file)
+    assert len(discovery.discover(roots)) == 2
+    assert (discovery.hits, discovery.misses) == (2, 0)
+
+    _make_venv(root_b / "env2", "3.11.0")
+    _touch(root_b)
+    discovery = VenvDiscovery("3.11", cache_file)
+    assert len(discovery.discover(roots)) == 3
+    assert (discovery.hits, discovery.misses) == (1, 1)